@@ -40,6 +40,18 @@ contract KeyRegistry {
         emit PQCSignature(msg.sender, signature, message);
     }
     
+    /**
+     * @dev Log many PQC signatures and messages in one transaction (one event per entry)
+     * @param signatures The PQC signature bytes, one per entry
+     * @param messages The signed messages, matching signatures by index
+     */
+    function logSignatures(bytes[] memory signatures, bytes[] memory messages) public {
+        require(signatures.length == messages.length, "Length mismatch");
+        for (uint256 i = 0; i < signatures.length; i++) {
+            emit PQCSignature(msg.sender, signatures[i], messages[i]);
+        }
+    }
+    
     /**
      * @dev Get the registered PQC public key for an address
      * @param user The address to query
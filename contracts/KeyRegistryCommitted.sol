@@ -0,0 +1,65 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+/**
+ * @title KeyRegistryCommitted
+ * @dev KeyRegistry variant that stores only a keccak256 commitment to each PQC public key.
+ *      The full key is published in the PQCKeyRegistered event; verifiers fetch it from
+ *      the logs and check it against the stored commitment.
+ */
+contract KeyRegistryCommitted {
+    // Mapping to store the keccak256 hash of each address's PQC public key
+    mapping(address => bytes32) public pqKeyCommitment;
+
+    // Event emitted when a PQC signature is logged
+    event PQCSignature(
+        address indexed from,
+        bytes signature,
+        bytes message
+    );
+
+    // Event emitted when a PQC public key is registered (carries the full key)
+    event PQCKeyRegistered(
+        address indexed user,
+        bytes publicKey
+    );
+
+    /**
+     * @dev Register a PQC public key for the caller's address
+     * @param pk The PQC public key bytes to register
+     */
+    function registerPQCKey(bytes memory pk) public {
+        pqKeyCommitment[msg.sender] = keccak256(pk);
+        emit PQCKeyRegistered(msg.sender, pk);
+    }
+
+    /**
+     * @dev Log a PQC signature and message (for off-chain verification)
+     * @param signature The PQC signature bytes
+     * @param message The original message that was signed
+     */
+    function logSignature(bytes memory signature, bytes memory message) public {
+        emit PQCSignature(msg.sender, signature, message);
+    }
+
+    /**
+     * @dev Log many PQC signatures and messages in one transaction (one event per entry)
+     * @param signatures The PQC signature bytes, one per entry
+     * @param messages The signed messages, matching signatures by index
+     */
+    function logSignatures(bytes[] memory signatures, bytes[] memory messages) public {
+        require(signatures.length == messages.length, "Length mismatch");
+        for (uint256 i = 0; i < signatures.length; i++) {
+            emit PQCSignature(msg.sender, signatures[i], messages[i]);
+        }
+    }
+
+    /**
+     * @dev Get the commitment to the registered PQC public key for an address
+     * @param user The address to query
+     * @return The keccak256 hash of the key (zero if not registered)
+     */
+    function getPQCKeyCommitment(address user) public view returns (bytes32) {
+        return pqKeyCommitment[user];
+    }
+}
@@ -0,0 +1,196 @@
+"""
+Central registry of supported PQC signature algorithms
+Maps canonical names and aliases to cached QuantCrypt instances and static metadata
+"""
+
+# Try to import QuantCrypt
+try:
+    from quantcrypt import dss
+    QUANTCRYPT_AVAILABLE = True
+except ImportError:
+    QUANTCRYPT_AVAILABLE = False
+    dss = None
+
+# Static metadata for every supported algorithm, keyed by canonical name.
+# Sizes are in bytes and match the QuantCrypt (PQClean) parameter sets.
+# signature_size_range is set for variable-length (compressed) signatures;
+# verify_cost_rank orders candidates from cheapest to most expensive verify.
+ALGORITHMS = {
+    "dilithium2": {
+        "class_name": "MLDSA_44",
+        "display_name": "ML-DSA-44 (Dilithium2)",
+        "family": "Lattice-based (ML-DSA)",
+        "nist_level": "Level 2",
+        "public_key_size": 1312,
+        "private_key_size": 2560,
+        "signature_size": 2420,
+        "verify_cost_rank": 3,
+    },
+    "dilithium3": {
+        "class_name": "MLDSA_65",
+        "display_name": "ML-DSA-65 (Dilithium3)",
+        "family": "Lattice-based (ML-DSA)",
+        "nist_level": "Level 3",
+        "public_key_size": 1952,
+        "private_key_size": 4032,
+        "signature_size": 3309,
+        "verify_cost_rank": 4,
+    },
+    "dilithium5": {
+        "class_name": "MLDSA_87",
+        "display_name": "ML-DSA-87 (Dilithium5)",
+        "family": "Lattice-based (ML-DSA)",
+        "nist_level": "Level 5",
+        "public_key_size": 2592,
+        "private_key_size": 4896,
+        "signature_size": 4627,
+        "verify_cost_rank": 5,
+    },
+    "sphincs128f": {
+        "class_name": "SMALL_SPHINCS",
+        "display_name": "SPHINCS+ Small",
+        "family": "Hash-based (SLH-DSA)",
+        "nist_level": "Level 1",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_size": 29792,
+        "verify_cost_rank": 6,
+    },
+    "sphincs_fast": {
+        "class_name": "FAST_SPHINCS",
+        "display_name": "SPHINCS+ Fast",
+        "family": "Hash-based (SLH-DSA)",
+        "nist_level": "Level 3/5",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_size": 49856,
+        "verify_cost_rank": 7,
+    },
+    "falcon512": {
+        "class_name": "FALCON_512",
+        "display_name": "FALCON-512",
+        "family": "Lattice-based (FALCON)",
+        "nist_level": "Level 1",
+        "public_key_size": 897,
+        "private_key_size": 1281,
+        "signature_size": 666,  # Typical; FALCON signatures are variable-length
+        "signature_size_range": (42, 752),
+        "verify_cost_rank": 1,
+    },
+    "falcon1024": {
+        "class_name": "FALCON_1024",
+        "display_name": "FALCON-1024",
+        "family": "Lattice-based (FALCON)",
+        "nist_level": "Level 5",
+        "public_key_size": 1793,
+        "private_key_size": 2305,
+        "signature_size": 1280,  # Typical; FALCON signatures are variable-length
+        "signature_size_range": (42, 1462),
+        "verify_cost_rank": 2,
+    },
+}
+
+# Aliases accepted by the CLI scripts, mapped to their canonical name
+ALIASES = {
+    "dilithium2": "dilithium2", "dilithium44": "dilithium2", "mldsa44": "dilithium2",
+    "dilithium3": "dilithium3", "dilithium65": "dilithium3", "mldsa65": "dilithium3",
+    "dilithium5": "dilithium5", "dilithium87": "dilithium5", "mldsa87": "dilithium5",
+    "sphincs": "sphincs128f", "sphincs128f": "sphincs128f", "sphincs_small": "sphincs128f",
+    "sphincs192f": "sphincs_fast", "sphincs256f": "sphincs_fast", "sphincs_fast": "sphincs_fast",
+    "falcon512": "falcon512", "falcon_512": "falcon512",
+    "falcon1024": "falcon1024", "falcon_1024": "falcon1024",
+}
+
+SUPPORTED_ALGORITHMS = list(ALGORITHMS.keys())
+
+# Exact-length lookup tables for algorithm identification:
+# public key size -> [(signature (min, max) size, canonical name)], cheapest verify first
+_BY_PUBLIC_KEY_SIZE = {}
+for _name, _info in sorted(ALGORITHMS.items(), key=lambda item: item[1]["verify_cost_rank"]):
+    _sig_range = _info.get("signature_size_range", (_info["signature_size"], _info["signature_size"]))
+    _BY_PUBLIC_KEY_SIZE.setdefault(_info["public_key_size"], []).append((_sig_range, _name))
+
+# Lazily built algorithm instances, keyed by every name they have been requested under
+_INSTANCES = {}
+
+def resolve_algorithm_name(name):
+    """
+    Resolve an algorithm name or alias to its canonical name
+
+    Args:
+        name: Algorithm name or alias
+
+    Returns:
+        str: Canonical algorithm name
+    """
+    try:
+        return ALIASES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown algorithm: {name}. Supported: "
+            "dilithium2/3/5, sphincs128f/fast, falcon512/1024"
+        ) from None
+
+def get_algorithm_info(name):
+    """
+    Get static metadata for an algorithm
+
+    Args:
+        name: Algorithm name or alias
+
+    Returns:
+        dict: Algorithm metadata (sizes, NIST level, family)
+    """
+    return ALGORITHMS[resolve_algorithm_name(name)]
+
+def _build_instance(name):
+    """Build (or reuse) the instance for a name on the first lookup"""
+    if not QUANTCRYPT_AVAILABLE:
+        raise ImportError("QuantCrypt library not available. Install with: pip install quantcrypt")
+
+    canonical = resolve_algorithm_name(name)
+    instance = _INSTANCES.get(canonical)
+    if instance is None:
+        instance = getattr(dss, ALGORITHMS[canonical]["class_name"])()
+        _INSTANCES[canonical] = instance
+
+    # Cache under the alias as well so later lookups are a single dict hit
+    _INSTANCES[name] = instance
+    return instance
+
+def get_algorithm(name):
+    """
+    Get the shared algorithm instance for a name or alias
+
+    The first lookup builds the QuantCrypt object; every later lookup is a
+    single dictionary access that allocates nothing.
+
+    Args:
+        name: Algorithm name or alias
+
+    Returns:
+        QuantCrypt algorithm instance
+    """
+    try:
+        return _INSTANCES[name]
+    except KeyError:
+        return _build_instance(name)
+
+def identify_algorithm(public_key, signature):
+    """
+    Identify candidate algorithms from exact public key and signature lengths
+
+    Args:
+        public_key: PQC public key bytes
+        signature: PQC signature bytes
+
+    Returns:
+        list: Canonical names whose sizes match, cheapest verification first;
+              empty if the lengths match no supported algorithm
+    """
+    signature_size = len(signature)
+    return [
+        name
+        for (min_size, max_size), name in _BY_PUBLIC_KEY_SIZE.get(len(public_key), ())
+        if min_size <= signature_size <= max_size
+    ]
@@ -4,7 +4,6 @@ Generates charts and analysis for batch operation scalability
 """
 import os
 import sys
-import json
 from datetime import datetime
 
 # Get project root and change to it
@@ -12,6 +11,7 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 os.chdir(PROJECT_ROOT)
 
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "scripts"))
+from sample_store import load_results_index
 
 RESULTS_DIR = os.path.join(PROJECT_ROOT, "data", "benchmarks")
 FIGURES_DIR = os.path.join(PROJECT_ROOT, "data", "figures")
@@ -39,8 +39,7 @@ def load_latest_batch_results():
     latest_file = sorted(batch_files)[-1]
     filepath = os.path.join(RESULTS_DIR, latest_file)
     
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    return load_results_index(filepath)
 
 def load_all_batch_results():
     """Load all batch result files"""
@@ -55,9 +54,7 @@ def load_all_batch_results():
     for batch_file in sorted(batch_files):
         filepath = os.path.join(RESULTS_DIR, batch_file)
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-                all_data.append(data)
+            all_data.append(load_results_index(filepath))
         except Exception as e:
             print(f"[WARNING] Failed to load {batch_file}: {e}")
     
@@ -114,6 +111,79 @@ def create_scalability_chart(batch_data, operation='key_generation', save_path=N
         print(f"[OK] Scalability chart saved to: {save_path}")
         return save_path
 
+def create_worker_scaling_chart(batch_data, save_path=None):
+    """
+    Create worker scaling charts: throughput and parallel efficiency vs worker count
+    
+    Args:
+        batch_data: Batch results data containing worker_scaling results
+        save_path: Path to save figure (only used for a single algorithm)
+    
+    Returns:
+        list: Paths of the saved figures
+    """
+    if not MATPLOTLIB_AVAILABLE:
+        print("[SKIP] Matplotlib not available")
+        return []
+    
+    saved = []
+    for result in batch_data.get('results', []):
+        scaling = result.get('worker_scaling')
+        if not scaling:
+            continue
+        algo = result.get('algorithm', 'unknown')
+        
+        fig, (ax_tput, ax_eff) = plt.subplots(1, 2, figsize=(16, 6))
+        linestyles = {'process': '-', 'thread': '--'}
+        markers = {'key_generation': 'o', 'signing': 's', 'verification': '^'}
+        
+        for executor, curves in scaling['scaling'].items():
+            for operation, points in curves.items():
+                workers = [p['workers'] for p in points]
+                label = f'{operation.replace("_", " ").title()} ({executor})'
+                style = dict(linestyle=linestyles.get(executor, '-'), marker=markers.get(operation, 'o'),
+                             linewidth=2, markersize=7)
+                line, = ax_tput.plot(workers, [p['ops_per_sec'] for p in points], label=label, **style)
+                ax_eff.plot(workers, [p['efficiency'] * 100 for p in points], label=label,
+                            color=line.get_color(), **style)
+                
+                # Mark the knee point
+                knee = scaling['knee'][executor][operation]
+                knee_point = next(p for p in points if p['workers'] == knee)
+                ax_tput.scatter([knee], [knee_point['ops_per_sec']], s=180, facecolors='none',
+                                edgecolors=line.get_color(), linewidths=2, zorder=5)
+        
+        ax_tput.set_xlabel('Workers', fontsize=12, fontweight='bold')
+        ax_tput.set_ylabel('Aggregate Throughput (operations/sec)', fontsize=12, fontweight='bold')
+        ax_tput.set_title('Throughput vs Workers (circles: knee)', fontsize=13, fontweight='bold')
+        ax_eff.set_xlabel('Workers', fontsize=12, fontweight='bold')
+        ax_eff.set_ylabel('Parallel Efficiency (%)', fontsize=12, fontweight='bold')
+        ax_eff.set_title('Parallel Efficiency vs Workers', fontsize=13, fontweight='bold')
+        ax_eff.axhline(100, color='gray', linestyle=':', alpha=0.7)
+        for ax in (ax_tput, ax_eff):
+            ax.set_xscale('log', base=2)
+            ax.set_xticks(scaling['worker_counts'])
+            ax.set_xticklabels([str(w) for w in scaling['worker_counts']])
+            ax.grid(True, alpha=0.3)
+            ax.legend(fontsize=9)
+        
+        fig.suptitle(f'Multi-core Scaling: {algo.upper()} (batch of {scaling["batch_size"]})',
+                     fontsize=14, fontweight='bold')
+        plt.tight_layout()
+        
+        path = save_path
+        if path is None or len(batch_data.get('results', [])) > 1:
+            os.makedirs(FIGURES_DIR, exist_ok=True)
+            path = os.path.join(FIGURES_DIR, f'worker_scaling_{algo}.png')
+        
+        plt.savefig(path, dpi=300, bbox_inches='tight')
+        plt.close()
+        
+        print(f"[OK] Worker scaling chart saved to: {path}")
+        saved.append(path)
+    
+    return saved
+
 def create_combined_scalability_chart(all_batch_data, operation='key_generation', save_path=None):
     """
     Create combined scalability chart showing multiple algorithms on same plot
@@ -248,6 +318,10 @@ def generate_all_scalability_charts(batch_data=None):
         if fig:
             figures.append(fig)
     
+    if any(result.get('worker_scaling') for result in batch_data.get('results', [])):
+        print("\nGenerating worker scaling charts...")
+        figures.extend(create_worker_scaling_chart(batch_data))
+    
     print(f"\n[SUCCESS] Generated {len(figures)} chart(s)")
     return figures
 
@@ -286,6 +360,30 @@ def print_scalability_analysis(batch_data):
             print("    " + "-" * 70)
             for verify in result['verification']:
                 print(f"    {verify['batch_size']:<12} {verify['throughput']:<20.2f} {verify['total_time']:<15.4f} {verify['avg_time_per_verify']*1000:<15.2f} {verify['valid_signatures']}/{verify['total_signatures']}")
+        
+        # Worker scaling
+        if result.get('worker_scaling'):
+            scaling = result['worker_scaling']
+            print(f"\n  Worker Scaling (batch of {scaling['batch_size']}, {scaling['cpu_count']} CPUs):")
+            for executor, curves in scaling['scaling'].items():
+                for operation, points in curves.items():
+                    knee = scaling['knee'][executor][operation]
+                    print(f"\n    {operation.replace('_', ' ').title()} ({executor}, knee at {knee} workers):")
+                    print(f"      {'Workers':<10} {'Throughput (ops/sec)':<22} {'Speedup':<10} {'Efficiency':<10}")
+                    print("      " + "-" * 54)
+                    for point in points:
+                        print(f"      {point['workers']:<10} {point['ops_per_sec']:<22.2f} {point['speedup']:<10.2f} {point['efficiency']*100:.1f}%")
+
+        # On-chain batching
+        if result.get('onchain_batching'):
+            onchain = result['onchain_batching']
+            print(f"\n  Batched logSignatures ({onchain['chain_backend']}, gas budget {onchain['gas_budget']:,}):")
+            print(f"    {'Batch Size':<12} {'Gas Used':<14} {'Gas/Signature':<15} {'Saving vs Single':<16}")
+            print("    " + "-" * 57)
+            for point in onchain['batches']:
+                saving = point.get('saving_vs_single')
+                saving_text = f"{saving*100:.1f}%" if saving is not None else "N/A"
+                print(f"    {point['batch_size']:<12} {point['gas_used']:<14,} {point['gas_per_signature']:<15,.0f} {saving_text:<16}")
 
 def main():
     """Main analysis function"""
@@ -315,8 +413,7 @@ def main():
     
     # Load batch data
     if args.batch_file:
-        with open(args.batch_file, 'r') as f:
-            batch_data = json.load(f)
+        batch_data = load_results_index(args.batch_file)
     else:
         batch_data = load_latest_batch_results()
         if not batch_data:
@@ -4,7 +4,6 @@ Analyzes collected metrics and generates reports
 """
 import os
 import sys
-import csv
 import json
 from datetime import datetime
 
@@ -12,37 +11,39 @@ from datetime import datetime
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 os.chdir(PROJECT_ROOT)
 
-RESULTS_FILE = os.path.join(PROJECT_ROOT, "data", "results.csv")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import numpy as np
+from results_sink import load_results_columns
 
 def load_results():
     """
-    Load results from CSV file
+    Load results from every stored format (CSV, Arrow, binary records)
+    
+    Returns:
+        dict: Field name -> numpy array, or None if no results exist
     """
-    print("Loading results from CSV...")
-    results = []
-    if os.path.exists(RESULTS_FILE):
-        with open(RESULTS_FILE, 'r') as f:
-            reader = csv.DictReader(f)
-            results = list(reader)
-    return results
+    print("Loading results...")
+    return load_results_columns()
 
 def analyze_by_algorithm(results):
     """
     Analyze results grouped by algorithm
     """
     print("Analyzing results by algorithm...")
-    algorithms = {}
-    for result in results:
-        algo = result.get('algorithm', 'unknown')
-        if algo not in algorithms:
-            algorithms[algo] = []
-        algorithms[algo].append(result)
+    algorithms, inverse, counts = np.unique(results['algorithm'], return_inverse=True, return_counts=True)
+    valid = np.bincount(inverse, weights=results['valid'].astype(np.float64), minlength=len(algorithms))
+    verify_times = results['verify_time']
     
     # Calculate statistics for each algorithm
     analysis = {}
-    for algo, algo_results in algorithms.items():
-        analysis[algo] = {
-            'count': len(algo_results),
+    for index, algo in enumerate(algorithms):
+        algo_times = verify_times[inverse == index]
+        algo_times = algo_times[~np.isnan(algo_times)]
+        analysis[str(algo)] = {
+            'count': int(counts[index]),
+            'valid': int(valid[index]),
+            'invalid': int(counts[index] - valid[index]),
+            'avg_verify_time': float(algo_times.mean()) if len(algo_times) else None,
         }
     return analysis
 
@@ -70,7 +71,7 @@ def main():
     print("=" * 70)
     print()
     print("This tool will:")
-    print("  1. Load results from CSV")
+    print("  1. Load results (CSV, Arrow or binary records)")
     print("  2. Analyze by algorithm")
     print("  3. Calculate statistics")
     print("  4. Generate comparison reports")
@@ -78,7 +79,7 @@ def main():
     print()
     
     results = load_results()
-    if not results:
+    if results is None or len(results['algorithm']) == 0:
         print("No results found. Run benchmarks first.")
         return
     
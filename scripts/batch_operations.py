@@ -5,10 +5,7 @@ Tests performance with different batch sizes: 1, 2, 4, 8, 16, 32, ..., 1024, 204
 import os
 import sys
 import time
-import statistics
-import json
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Get project root and change to it
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -16,11 +13,19 @@ os.chdir(PROJECT_ROOT)
 
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "scripts"))
 
-from web3 import Web3
-from contract_utils import load_contract_info
+from web3_client import get_contract
+from chain_backend import connect, load_registry, CHAIN_BACKENDS, DEFAULT_CHAIN_BACKEND
 from register_key import generate_pqc_keypair, register_key_on_chain
-from send_hybrid_tx import sign_message_pqc, send_hybrid_transaction, get_algorithm_instance
+from send_hybrid_tx import (sign_message_pqc, send_hybrid_transaction, get_algorithm_instance,
+                            send_hybrid_batch, DEFAULT_BATCH_GAS_BUDGET)
+from gas_model import GasModel, load_gas_model
 from verify_signatures import verify_pqc_signature, get_public_key
+from batch_executor import BatchEngine, EXECUTOR_CHOICES, default_workers
+from algorithm_registry import SUPPORTED_ALGORITHMS, get_algorithm_info
+from key_fixtures import load_fixtures, fixture_message
+from vector_corpus import VectorCorpus
+from sample_store import save_results_index
+from sample_stats import SampleBuffer, summarize
 
 # Try to import QuantCrypt
 try:
@@ -47,11 +52,18 @@ BATCH_RESULTS_FILE = os.path.join(RESULTS_DIR, f"batch_operations_{datetime.now(
 # Batch sizes for scalability testing: 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048
 BATCH_SIZES = [2**i for i in range(0, 12)]  # 1 to 2048
 
+# Worker scaling sweep: operations per measurement and the operations swept
+SCALING_BATCH_SIZE = 256
+SCALING_OPERATIONS = ['key_generation', 'signing', 'verification']
+
+# On-chain phase: signatures per logSignatures transaction (capped by the gas budget)
+ONCHAIN_BATCH_SIZES = [2**i for i in range(0, 10)]  # 1 to 512
+
 def ensure_results_directory():
     """Ensure benchmark results directory exists"""
     os.makedirs(RESULTS_DIR, exist_ok=True)
 
-def batch_key_generation(algorithm, batch_size, parallel=False):
+def batch_key_generation(algorithm, batch_size, parallel=False, engine=None):
     """
     Generate multiple keys in a batch
     
@@ -59,6 +71,7 @@ def batch_key_generation(algorithm, batch_size, parallel=False):
         algorithm: Algorithm name
         batch_size: Number of keys to generate
         parallel: Whether to use parallel processing
+        engine: BatchEngine to run on (required when parallel is True)
     
     Returns:
         dict: Results with timing and statistics
@@ -69,30 +82,23 @@ def batch_key_generation(algorithm, batch_size, parallel=False):
         return None
     
     keys = []
-    times = []
+    times = SampleBuffer()
     
     start_total = time.perf_counter()
     
-    if parallel and batch_size > 4:
-        # Use parallel processing for large batches
-        def generate_one_key():
-            start = time.perf_counter()
-            pk, sk, alg = generate_pqc_keypair(algorithm)
-            elapsed = time.perf_counter() - start
-            return (pk, sk, alg), elapsed
-        
-        with ThreadPoolExecutor(max_workers=min(4, batch_size)) as executor:
-            futures = [executor.submit(generate_one_key) for _ in range(batch_size)]
-            
-            iterator = tqdm(futures, desc=f"    Generating keys", disable=not TQDM_AVAILABLE) if TQDM_AVAILABLE else futures
-            
-            for future in iterator:
-                try:
-                    key_data, elapsed = future.result()
-                    keys.append(key_data)
-                    times.append(elapsed)
-                except Exception as e:
-                    print(f"    [ERROR] Key generation failed: {e}")
+    if parallel and engine is not None:
+        # Chunked execution on the worker pool
+        progress = tqdm(total=batch_size, desc=f"    Generating keys") if TQDM_AVAILABLE else None
+        try:
+            public_keys, private_keys, chunk_times = engine.keygen(batch_size, progress)
+            times.extend(chunk_times)
+            alg = get_algorithm_instance(algorithm)
+            keys = [(pk, sk, alg) for pk, sk in zip(public_keys, private_keys)]
+        except Exception as e:
+            print(f"    [ERROR] Key generation failed: {e}")
+        finally:
+            if progress is not None:
+                progress.close()
     else:
         # Sequential processing
         iterator = tqdm(range(batch_size), desc=f"    Generating keys", disable=not TQDM_AVAILABLE) if TQDM_AVAILABLE else range(batch_size)
@@ -112,25 +118,24 @@ def batch_key_generation(algorithm, batch_size, parallel=False):
     if not keys:
         return None
     
+    summary = summarize(times)
     return {
         'operation': 'batch_key_generation',
         'algorithm': algorithm,
         'batch_size': batch_size,
         'parallel': parallel,
+        'executor': engine.executor_kind if parallel and engine else 'sequential',
+        'workers': engine.workers if parallel and engine else 1,
         'total_time': total_time,
-        'avg_time_per_key': statistics.mean(times) if times else 0,
+        'avg_time_per_key': summary['mean'],
         'total_keys': len(keys),
         'throughput': len(keys) / total_time if total_time > 0 else 0,  # keys per second
-        'times': times,
-        'mean': statistics.mean(times) if times else 0,
-        'median': statistics.median(times) if times else 0,
-        'std_dev': statistics.stdev(times) if len(times) > 1 else 0.0,
-        'min': min(times) if times else 0,
-        'max': max(times) if times else 0,
+        'times': times.values,
+        **summary,
         'timestamp': datetime.now().isoformat()
     }
 
-def batch_signing(algorithm, private_keys, messages, parallel=False):
+def batch_signing(algorithm, private_keys, messages, parallel=False, engine=None):
     """
     Sign multiple messages in a batch
     
@@ -139,6 +144,7 @@ def batch_signing(algorithm, private_keys, messages, parallel=False):
         private_keys: List of private keys
         messages: List of messages to sign
         parallel: Whether to use parallel processing
+        engine: BatchEngine to run on (required when parallel is True)
     
     Returns:
         dict: Results with timing and statistics
@@ -155,32 +161,22 @@ def batch_signing(algorithm, private_keys, messages, parallel=False):
     
     alg = get_algorithm_instance(algorithm)
     signatures = []
-    times = []
+    times = SampleBuffer()
     
     start_total = time.perf_counter()
     
-    if parallel and batch_size > 4:
-        # Use parallel processing
-        def sign_one_message(idx):
-            pk, sk, alg_instance = private_keys[idx]
-            msg = messages[idx]
-            start = time.perf_counter()
-            sig, sign_time = sign_message_pqc(alg, sk, msg)
-            elapsed = time.perf_counter() - start
-            return sig, elapsed
-        
-        with ThreadPoolExecutor(max_workers=min(4, batch_size)) as executor:
-            futures = [executor.submit(sign_one_message, i) for i in range(batch_size)]
-            
-            iterator = tqdm(futures, desc=f"    Signing messages", disable=not TQDM_AVAILABLE) if TQDM_AVAILABLE else futures
-            
-            for i, future in enumerate(iterator):
-                try:
-                    sig, elapsed = future.result()
-                    signatures.append(sig)
-                    times.append(elapsed)
-                except Exception as e:
-                    print(f"    [ERROR] Signing {i+1} failed: {e}")
+    if parallel and engine is not None:
+        # Chunked execution on the worker pool; only secret keys are shipped
+        progress = tqdm(total=batch_size, desc=f"    Signing messages") if TQDM_AVAILABLE else None
+        try:
+            secret_keys = [sk for pk, sk, alg_instance in private_keys]
+            signatures, chunk_times = engine.sign(secret_keys, messages, progress)
+            times.extend(chunk_times)
+        except Exception as e:
+            print(f"    [ERROR] Signing failed: {e}")
+        finally:
+            if progress is not None:
+                progress.close()
     else:
         # Sequential processing
         iterator = tqdm(zip(private_keys, messages), total=batch_size, desc=f"    Signing messages", disable=not TQDM_AVAILABLE) if TQDM_AVAILABLE else zip(private_keys, messages)
@@ -198,25 +194,24 @@ def batch_signing(algorithm, private_keys, messages, parallel=False):
     if not signatures:
         return None
     
+    summary = summarize(times)
     return {
         'operation': 'batch_signing',
         'algorithm': algorithm,
         'batch_size': batch_size,
         'parallel': parallel,
+        'executor': engine.executor_kind if parallel and engine else 'sequential',
+        'workers': engine.workers if parallel and engine else 1,
         'total_time': total_time,
-        'avg_time_per_sign': statistics.mean(times) if times else 0,
+        'avg_time_per_sign': summary['mean'],
         'total_signatures': len(signatures),
         'throughput': len(signatures) / total_time if total_time > 0 else 0,  # signatures per second
-        'times': times,
-        'mean': statistics.mean(times) if times else 0,
-        'median': statistics.median(times) if times else 0,
-        'std_dev': statistics.stdev(times) if len(times) > 1 else 0.0,
-        'min': min(times) if times else 0,
-        'max': max(times) if times else 0,
+        'times': times.values,
+        **summary,
         'timestamp': datetime.now().isoformat()
     }
 
-def batch_verification(algorithm, public_keys, messages, signatures, parallel=False):
+def batch_verification(algorithm, public_keys, messages, signatures, parallel=False, engine=None):
     """
     Verify multiple signatures in a batch
     
@@ -226,6 +221,7 @@ def batch_verification(algorithm, public_keys, messages, signatures, parallel=Fa
         messages: List of messages
         signatures: List of signatures
         parallel: Whether to use parallel processing
+        engine: BatchEngine to run on (required when parallel is True)
     
     Returns:
         dict: Results with timing and statistics
@@ -240,33 +236,28 @@ def batch_verification(algorithm, public_keys, messages, signatures, parallel=Fa
         print(f"    [ERROR] Mismatch: {len(public_keys)} keys, {len(messages)} messages, {len(signatures)} signatures")
         return None
     
-    times = []
+    times = SampleBuffer()
+    rejection_times = SampleBuffer()  # Invalid signatures: time to reject
     valid_count = 0
     
     start_total = time.perf_counter()
     
-    if parallel and batch_size > 4:
-        # Use parallel processing
-        def verify_one_signature(pk, msg, sig):
-            start = time.perf_counter()
-            is_valid, verify_time = verify_pqc_signature(algorithm, pk, msg, sig)
-            elapsed = time.perf_counter() - start
-            return is_valid, elapsed
-        
-        with ThreadPoolExecutor(max_workers=min(4, batch_size)) as executor:
-            futures = [executor.submit(verify_one_signature, pk, msg, sig) 
-                      for pk, msg, sig in zip(public_keys, messages, signatures)]
-            
-            iterator = tqdm(futures, desc=f"    Verifying signatures", disable=not TQDM_AVAILABLE) if TQDM_AVAILABLE else futures
-            
-            for future in iterator:
-                try:
-                    is_valid, elapsed = future.result()
-                    if is_valid:
-                        times.append(elapsed)
-                        valid_count += 1
-                except Exception as e:
-                    print(f"    [ERROR] Verification failed: {e}")
+    if parallel and engine is not None:
+        # Chunked execution on the worker pool
+        progress = tqdm(total=batch_size, desc=f"    Verifying signatures") if TQDM_AVAILABLE else None
+        try:
+            results, all_times = engine.verify(public_keys, messages, signatures, progress)
+            for is_valid, elapsed in zip(results, all_times):
+                if is_valid:
+                    times.append(elapsed)
+                    valid_count += 1
+                else:
+                    rejection_times.append(elapsed)
+        except Exception as e:
+            print(f"    [ERROR] Verification failed: {e}")
+        finally:
+            if progress is not None:
+                progress.close()
     else:
         # Sequential processing
         iterator = tqdm(zip(public_keys, messages, signatures), total=batch_size, desc=f"    Verifying signatures", disable=not TQDM_AVAILABLE) if TQDM_AVAILABLE else zip(public_keys, messages, signatures)
@@ -277,34 +268,65 @@ def batch_verification(algorithm, public_keys, messages, signatures, parallel=Fa
                 if is_valid:
                     times.append(verify_time)
                     valid_count += 1
+                else:
+                    rejection_times.append(verify_time)
             except Exception as e:
                 print(f"    [ERROR] Verification failed: {e}")
     
     total_time = time.perf_counter() - start_total
     
-    if not times:
+    if not times and not rejection_times:
         return None
     
+    summary = summarize(times)
+    rejection = None
+    if rejection_times:
+        rejection = {'count': len(rejection_times), 'times': rejection_times.values, **summarize(rejection_times)}
     return {
         'operation': 'batch_verification',
         'algorithm': algorithm,
         'batch_size': batch_size,
         'parallel': parallel,
+        'executor': engine.executor_kind if parallel and engine else 'sequential',
+        'workers': engine.workers if parallel and engine else 1,
         'total_time': total_time,
-        'avg_time_per_verify': statistics.mean(times) if times else 0,
+        'avg_time_per_verify': summary['mean'],
         'total_signatures': batch_size,
         'valid_signatures': valid_count,
+        'invalid_signatures': len(rejection_times),
         'throughput': valid_count / total_time if total_time > 0 else 0,  # verifications per second
-        'times': times,
-        'mean': statistics.mean(times) if times else 0,
-        'median': statistics.median(times) if times else 0,
-        'std_dev': statistics.stdev(times) if len(times) > 1 else 0.0,
-        'min': min(times) if times else 0,
-        'max': max(times) if times else 0,
+        'times': times.values,
+        **summary,
+        'rejection': rejection,
         'timestamp': datetime.now().isoformat()
     }
 
-def test_batch_scalability(algorithm, batch_sizes=None, parallel=False, test_signing=True, test_verification=True):
+def load_batch_inputs(algorithm, count, workers=None, corpus=None):
+    """
+    Keys, messages and signatures for the signing/verification phases
+    
+    Args:
+        algorithm: Algorithm name
+        count: Number of inputs needed
+        workers: Process pool size if fixtures have to be generated
+        corpus: VectorCorpus to take valid vectors from (default: key fixtures)
+    
+    Returns:
+        tuple: (public_keys, private_keys, messages, signatures); shorter than
+               count if the corpus holds fewer vectors
+    """
+    if corpus is not None:
+        inputs = corpus.inputs(algorithm, count)
+        print(f"  [OK] {len(inputs[0])} corpus vector(s) ({corpus.digest[:12]})")
+        return inputs
+    
+    fixtures = load_fixtures(algorithm, count, workers)
+    print(f"  [OK] {len(fixtures)} fixtures ({fixtures.digest[:12]})")
+    return (fixtures.public_keys(count), fixtures.private_keys(count),
+            fixtures.messages(count), fixtures.signatures(count))
+
+def test_batch_scalability(algorithm, batch_sizes=None, parallel=False, test_signing=True, test_verification=True,
+                           executor="thread", workers=None, corpus=None):
     """
     Test scalability with different batch sizes
     
@@ -314,6 +336,9 @@ def test_batch_scalability(algorithm, batch_sizes=None, parallel=False, test_sig
         parallel: Whether to use parallel processing
         test_signing: Whether to test batch signing
         test_verification: Whether to test batch verification
+        executor: Worker pool type used when parallel ("thread" or "process")
+        workers: Number of pool workers (default: one per core)
+        corpus: VectorCorpus supplying signing/verification inputs (default: key fixtures)
     
     Returns:
         dict: Complete scalability test results
@@ -326,6 +351,8 @@ def test_batch_scalability(algorithm, batch_sizes=None, parallel=False, test_sig
     print(f"{'='*70}")
     print(f"Batch sizes: {batch_sizes}")
     print(f"Parallel processing: {parallel}")
+    if parallel:
+        print(f"Executor: {executor} ({workers or default_workers()} workers)")
     print()
     
     results = {
@@ -333,116 +360,327 @@ def test_batch_scalability(algorithm, batch_sizes=None, parallel=False, test_sig
         'timestamp': datetime.now().isoformat(),
         'batch_sizes': batch_sizes,
         'parallel': parallel,
+        'executor': executor if parallel else 'sequential',
+        'workers': (workers or default_workers()) if parallel else 1,
         'key_generation': [],
         'signing': [],
         'verification': []
     }
     
-    # Test key generation scalability
-    print("="*70)
-    print("BATCH KEY GENERATION SCALABILITY")
-    print("="*70)
-    
-    for batch_size in batch_sizes:
-        print(f"\nTesting batch size: {batch_size}")
-        result = batch_key_generation(algorithm, batch_size, parallel)
-        if result:
-            results['key_generation'].append(result)
-            print(f"  Total time: {result['total_time']:.4f}s")
-            print(f"  Throughput: {result['throughput']:.2f} keys/sec")
-            print(f"  Avg time per key: {result['avg_time_per_key']*1000:.2f}ms")
-        else:
-            print(f"  [FAIL] Batch size {batch_size} failed")
+    # One worker pool for all phases, so pool start-up is not timed per batch
+    engine = BatchEngine(algorithm, executor=executor, workers=workers) if parallel else None
+    if engine is not None:
+        engine.start()
     
-    # Test signing scalability (if requested)
-    if test_signing:
-        print("\n" + "="*70)
-        print("BATCH SIGNING SCALABILITY")
-        print("="*70)
-        
-        # Generate keys and messages for signing tests
-        print("\nPreparing keys and messages for signing tests...")
-        all_keys = []
-        all_messages = []
-        
+    try:
+        # Keys and signatures for the signing/verification phases come from the
+        # corpus or the fixture store (generated once per algorithm, reused by later runs)
+        inputs = ([], [], [], [])
         max_batch = max(batch_sizes)
-        for i in range(max_batch):
+        if test_signing or test_verification:
+            print("Loading test vectors..." if corpus is not None else "Loading key fixtures...")
             try:
-                pk, sk, alg = generate_pqc_keypair(algorithm)
-                all_keys.append((pk, sk, alg))
-                all_messages.append(f"Batch test message {i+1}".encode('utf-8'))
+                inputs = load_batch_inputs(algorithm, max_batch, workers, corpus)
             except Exception as e:
-                print(f"  [ERROR] Failed to prepare key {i+1}: {e}")
-                break
+                print(f"  [ERROR] Failed to prepare inputs: {e}")
+            print()
+        input_pubkeys, input_privkeys, input_messages, input_signatures = inputs
+        
+        # Test key generation scalability
+        print("="*70)
+        print("BATCH KEY GENERATION SCALABILITY")
+        print("="*70)
         
         for batch_size in batch_sizes:
-            if batch_size > len(all_keys):
-                print(f"\n[SKIP] Batch size {batch_size} (insufficient keys)")
-                continue
-            
             print(f"\nTesting batch size: {batch_size}")
-            keys_batch = all_keys[:batch_size]
-            messages_batch = all_messages[:batch_size]
-            
-            result = batch_signing(algorithm, keys_batch, messages_batch, parallel)
+            result = batch_key_generation(algorithm, batch_size, parallel, engine)
             if result:
-                results['signing'].append(result)
+                results['key_generation'].append(result)
                 print(f"  Total time: {result['total_time']:.4f}s")
-                print(f"  Throughput: {result['throughput']:.2f} signatures/sec")
-                print(f"  Avg time per sign: {result['avg_time_per_sign']*1000:.2f}ms")
+                print(f"  Throughput: {result['throughput']:.2f} keys/sec")
+                print(f"  Avg time per key: {result['avg_time_per_key']*1000:.2f}ms")
             else:
                 print(f"  [FAIL] Batch size {batch_size} failed")
-    
-    # Test verification scalability (if requested)
-    if test_verification:
-        print("\n" + "="*70)
-        print("BATCH VERIFICATION SCALABILITY")
-        print("="*70)
-        
-        # Generate keys, messages, and signatures for verification tests
-        print("\nPreparing keys, messages, and signatures for verification tests...")
-        all_pubkeys = []
-        all_messages = []
-        all_signatures = []
         
-        max_batch = max(batch_sizes)
-        alg = get_algorithm_instance(algorithm)
-        
-        for i in range(max_batch):
-            try:
-                pk, sk, alg_instance = generate_pqc_keypair(algorithm)
-                msg = f"Batch verification test message {i+1}".encode('utf-8')
-                sig, _ = sign_message_pqc(alg, sk, msg)
+        # Test signing scalability (if requested)
+        if test_signing:
+            print("\n" + "="*70)
+            print("BATCH SIGNING SCALABILITY")
+            print("="*70)
+            
+            alg = get_algorithm_instance(algorithm) if input_privkeys else None
+            all_keys = [(pk, sk, alg) for pk, sk in zip(input_pubkeys, input_privkeys)]
+            all_messages = input_messages
+            
+            for batch_size in batch_sizes:
+                if batch_size > len(all_keys):
+                    print(f"\n[SKIP] Batch size {batch_size} (insufficient keys)")
+                    continue
                 
-                all_pubkeys.append(pk)
-                all_messages.append(msg)
-                all_signatures.append(sig)
-            except Exception as e:
-                print(f"  [ERROR] Failed to prepare verification data {i+1}: {e}")
-                break
+                print(f"\nTesting batch size: {batch_size}")
+                keys_batch = all_keys[:batch_size]
+                messages_batch = all_messages[:batch_size]
+                
+                result = batch_signing(algorithm, keys_batch, messages_batch, parallel, engine)
+                if result:
+                    results['signing'].append(result)
+                    print(f"  Total time: {result['total_time']:.4f}s")
+                    print(f"  Throughput: {result['throughput']:.2f} signatures/sec")
+                    print(f"  Avg time per sign: {result['avg_time_per_sign']*1000:.2f}ms")
+                else:
+                    print(f"  [FAIL] Batch size {batch_size} failed")
         
-        for batch_size in batch_sizes:
-            if batch_size > len(all_signatures):
-                print(f"\n[SKIP] Batch size {batch_size} (insufficient data)")
-                continue
+        # Test verification scalability (if requested)
+        if test_verification:
+            print("\n" + "="*70)
+            print("BATCH VERIFICATION SCALABILITY")
+            print("="*70)
             
-            print(f"\nTesting batch size: {batch_size}")
-            pubkeys_batch = all_pubkeys[:batch_size]
-            messages_batch = all_messages[:batch_size]
-            signatures_batch = all_signatures[:batch_size]
+            all_pubkeys = input_pubkeys
+            all_messages = input_messages
+            all_signatures = input_signatures
             
-            result = batch_verification(algorithm, pubkeys_batch, messages_batch, signatures_batch, parallel)
-            if result:
-                results['verification'].append(result)
-                print(f"  Total time: {result['total_time']:.4f}s")
-                print(f"  Throughput: {result['throughput']:.2f} verifications/sec")
-                print(f"  Valid signatures: {result['valid_signatures']}/{result['total_signatures']}")
-                print(f"  Avg time per verify: {result['avg_time_per_verify']*1000:.2f}ms")
-            else:
-                print(f"  [FAIL] Batch size {batch_size} failed")
+            for batch_size in batch_sizes:
+                if batch_size > len(all_signatures):
+                    print(f"\n[SKIP] Batch size {batch_size} (insufficient data)")
+                    continue
+                
+                print(f"\nTesting batch size: {batch_size}")
+                pubkeys_batch = all_pubkeys[:batch_size]
+                messages_batch = all_messages[:batch_size]
+                signatures_batch = all_signatures[:batch_size]
+                
+                result = batch_verification(algorithm, pubkeys_batch, messages_batch, signatures_batch, parallel, engine)
+                if result:
+                    results['verification'].append(result)
+                    print(f"  Total time: {result['total_time']:.4f}s")
+                    print(f"  Throughput: {result['throughput']:.2f} verifications/sec")
+                    print(f"  Valid signatures: {result['valid_signatures']}/{result['total_signatures']}")
+                    print(f"  Avg time per verify: {result['avg_time_per_verify']*1000:.2f}ms")
+                    if result['rejection']:
+                        print(f"  Avg time per rejection: {result['rejection']['mean']*1000:.2f}ms "
+                              f"({result['rejection']['count']} invalid)")
+                else:
+                    print(f"  [FAIL] Batch size {batch_size} failed")
+    finally:
+        if engine is not None:
+            engine.shutdown()
     
     return results
 
+def scaling_worker_counts(max_workers=None):
+    """Worker counts for the scaling sweep: 1, 2, 4, ... up to max_workers (default: nproc)"""
+    max_workers = max_workers or default_workers()
+    counts = []
+    workers = 1
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    counts.append(max_workers)
+    return counts
+
+def find_knee(worker_counts, throughputs):
+    """
+    Knee of a throughput-vs-workers curve (Kneedle: farthest point above the chord)
+    
+    Returns:
+        int: Worker count beyond which extra workers add comparatively little throughput
+    """
+    if len(worker_counts) < 3:
+        return worker_counts[-1]
+    x0, x1 = worker_counts[0], worker_counts[-1]
+    y0, y1 = min(throughputs), max(throughputs)
+    if y1 <= y0:
+        return worker_counts[0]
+    distances = [
+        (t - y0) / (y1 - y0) - (w - x0) / (x1 - x0)
+        for w, t in zip(worker_counts, throughputs)
+    ]
+    return worker_counts[distances.index(max(distances))]
+
+def test_worker_scaling(algorithm, executors=None, worker_counts=None, batch_size=SCALING_BATCH_SIZE,
+                        operations=None, corpus=None):
+    """
+    Measure aggregate throughput as the worker count grows
+    
+    Every (executor, worker count) pair gets a fresh, warmed-up pool and runs
+    each operation on the same batch_size inputs.
+    
+    Args:
+        algorithm: Algorithm name
+        executors: Pool types to sweep (default: process and thread)
+        worker_counts: Worker counts to sweep (default: 1, 2, 4, ... nproc)
+        batch_size: Operations per measurement
+        operations: Operations to sweep (default: keygen, signing, verification)
+        corpus: VectorCorpus supplying signing/verification inputs (default: key fixtures)
+    
+    Returns:
+        dict: Per-executor, per-operation ops/sec, speedup and parallel efficiency
+              per worker count, plus the knee worker count of each curve
+    """
+    executors = executors or EXECUTOR_CHOICES[::-1]
+    worker_counts = worker_counts or scaling_worker_counts()
+    operations = operations or SCALING_OPERATIONS
+    
+    print(f"\n{'='*70}")
+    print(f"WORKER SCALING SWEEP: {algorithm.upper()}")
+    print(f"{'='*70}")
+    print(f"Workers: {worker_counts}  Executors: {', '.join(executors)}  Batch size: {batch_size}")
+    
+    # Inputs come from the corpus or the fixture store and are shared by every measurement
+    print("\nLoading test vectors..." if corpus is not None else "\nLoading key fixtures...")
+    public_keys, private_keys, messages, signatures = load_batch_inputs(algorithm, batch_size,
+                                                                        max(worker_counts), corpus)
+    if len(messages) < batch_size:
+        print(f"  [WARNING] Only {len(messages)} input(s) available, measuring batches of {len(messages)}")
+        batch_size = len(messages)
+    
+    run = {
+        'key_generation': lambda engine: engine.keygen(batch_size),
+        'signing': lambda engine: engine.sign(private_keys, messages),
+        'verification': lambda engine: engine.verify(public_keys, messages, signatures),
+    }
+    
+    scaling = {}
+    knees = {}
+    for executor in executors:
+        curves = {operation: [] for operation in operations}
+        for workers in worker_counts:
+            with BatchEngine(algorithm, executor=executor, workers=workers) as engine:
+                for operation in operations:
+                    start = time.perf_counter()
+                    run[operation](engine)
+                    total_time = time.perf_counter() - start
+                    curves[operation].append({
+                        'workers': workers,
+                        'total_time': total_time,
+                        'ops_per_sec': batch_size / total_time if total_time > 0 else 0,
+                    })
+            print(f"  {executor:<8} {workers:>3} worker(s): " + ", ".join(
+                f"{operation} {curves[operation][-1]['ops_per_sec']:.1f} ops/sec" for operation in operations))
+        
+        knees[executor] = {}
+        for operation, points in curves.items():
+            base = points[0]['ops_per_sec'] / points[0]['workers'] if points[0]['ops_per_sec'] else 0
+            for point in points:
+                point['speedup'] = point['ops_per_sec'] / base if base else 0
+                point['efficiency'] = point['speedup'] / point['workers']
+            knees[executor][operation] = find_knee([p['workers'] for p in points],
+                                                   [p['ops_per_sec'] for p in points])
+        scaling[executor] = curves
+    
+    for executor, operation_knees in knees.items():
+        for operation, knee in operation_knees.items():
+            point = next(p for p in scaling[executor][operation] if p['workers'] == knee)
+            print(f"  Knee ({executor}, {operation}): {knee} worker(s), "
+                  f"{point['ops_per_sec']:.1f} ops/sec at {point['efficiency']*100:.0f}% efficiency")
+    
+    return {
+        'batch_size': batch_size,
+        'worker_counts': worker_counts,
+        'cpu_count': default_workers(),
+        'scaling': scaling,
+        'knee': knees,
+    }
+
+def test_onchain_batching(algorithm, batch_sizes=None, chain_backend=DEFAULT_CHAIN_BACKEND,
+                          gas_budget=DEFAULT_BATCH_GAS_BUDGET, corpus=None):
+    """
+    On-chain phase: gas per signature of one logSignatures transaction as the batch grows
+    
+    Batch size 1 is the single logSignature baseline. Sizes whose gas-model
+    prediction exceeds the gas budget are not sent.
+    
+    Args:
+        algorithm: Algorithm name
+        batch_sizes: Signatures per transaction (default: ONCHAIN_BATCH_SIZES)
+        chain_backend: "ganache" or in-process "eth-tester"
+        gas_budget: Maximum gas per transaction
+        corpus: VectorCorpus supplying messages/signatures (default: key fixtures)
+    
+    Returns:
+        dict: Gas per batch size, or None if the chain or contract is unavailable
+    """
+    print(f"\n[On-chain] Batched signature logging ({chain_backend}, gas budget {gas_budget:,})...")
+    batch_sizes = sorted(batch_sizes or ONCHAIN_BATCH_SIZES)
+    
+    try:
+        w3 = connect(chain_backend, GANACHE_URL)
+        if not w3.is_connected():
+            print(f"  [SKIP] Could not connect to the {chain_backend} backend")
+            return None
+        contract_address, abi = load_registry(w3, chain_backend)
+    except Exception as e:
+        print(f"  [SKIP] On-chain phase unavailable: {e}")
+        return None
+    if not contract_address:
+        print("  [SKIP] Contract not deployed. Run: python scripts/deploy.py")
+        return None
+    if not any(item.get('name') == 'logSignatures' for item in abi):
+        print("  [SKIP] Deployed KeyRegistry has no logSignatures; redeploy with python scripts/deploy.py")
+        return None
+    
+    gas_model = load_gas_model()
+    if gas_model is None:
+        print("  [INFO] No gas model calibration; packing on intrinsic gas (run python scripts/gas_model.py)")
+    model = gas_model or GasModel.intrinsic_only()
+    
+    # Only load as many signatures as the largest batch that can fit the budget
+    info = get_algorithm_info(algorithm)
+    max_signature = b"\xff" * info.get("signature_size_range", (0, info["signature_size"]))[1]
+    fitting = [size for size in batch_sizes
+               if model.predict_log_signatures([(fixture_message(0), max_signature)] * size) <= gas_budget]
+    if not fitting:
+        print(f"  [SKIP] Not even one {algorithm} signature fits the gas budget")
+        return None
+    _, _, messages, signatures = load_batch_inputs(algorithm, max(fitting), corpus=corpus)
+    entries = list(zip(messages, signatures))
+    
+    account = w3.eth.accounts[0]
+    contract = get_contract(w3, contract_address, abi)
+    points = []
+    single_gas = None
+    for batch_size in batch_sizes:
+        if batch_size > len(entries):
+            break
+        batch = entries[:batch_size]
+        # A single entry is sent with logSignature (see send_hybrid_batch)
+        if batch_size == 1:
+            predicted_gas = model.predict('logSignature', payloads=[batch[0][1], batch[0][0]])
+        else:
+            predicted_gas = model.predict_log_signatures(batch)
+        if predicted_gas > gas_budget:
+            print(f"  Batch {batch_size}: over the gas budget, stopping")
+            break
+        
+        sent = send_hybrid_batch(w3, account, contract.address, abi, batch, gas_budget, model)
+        if len(sent) != 1:
+            print(f"  Batch {batch_size}: needed {len(sent)} transactions under the gas budget, stopping")
+            break
+        gas_used = sent[0][1]['gasUsed']
+        if batch_size == 1:
+            single_gas = gas_used
+        per_signature = gas_used / batch_size
+        points.append({
+            'batch_size': batch_size,
+            'gas_used': gas_used,
+            'gas_per_signature': per_signature,
+            'saving_vs_single': 1 - per_signature / single_gas if single_gas else None,
+            'predicted_gas': predicted_gas if gas_model is not None else None,
+        })
+    
+    for point in points:
+        saving = f", {point['saving_vs_single']*100:.1f}% below single" if point['saving_vs_single'] else ""
+        print(f"  Batch {point['batch_size']:4d}: {point['gas_used']:>12,} gas, "
+              f"{point['gas_per_signature']:>10,.0f} per signature{saving}")
+    
+    return {
+        'chain_backend': chain_backend,
+        'gas_budget': gas_budget,
+        'single_gas': single_gas,
+        'batches': points,
+    }
+
 def save_batch_results(all_results):
     """Save batch operation results to JSON file"""
     ensure_results_directory()
@@ -453,8 +691,8 @@ def save_batch_results(all_results):
         'results': all_results
     }
     
-    with open(BATCH_RESULTS_FILE, 'w') as f:
-        json.dump(output, f, indent=2)
+    # Raw timing samples and outlier positions go to .samples.npy / .outliers.npy files next to the JSON summary
+    save_results_index(output, BATCH_RESULTS_FILE)
     
     print(f"\n[OK] Batch results saved to: {BATCH_RESULTS_FILE}")
     return BATCH_RESULTS_FILE
@@ -492,6 +730,23 @@ def generate_scalability_chart(batch_results):
                 batch_size = verify_result['batch_size']
                 throughput = verify_result['throughput']
                 print(f"    Batch {batch_size:4d}: {throughput:8.2f} verifications/sec")
+        
+        # Worker scaling
+        if result.get('worker_scaling'):
+            scaling = result['worker_scaling']
+            for executor, curves in scaling['scaling'].items():
+                for operation, points in curves.items():
+                    print(f"\n  {operation.replace('_', ' ').title()} Scaling ({executor}, knee at "
+                          f"{scaling['knee'][executor][operation]} workers):")
+                    for point in points:
+                        print(f"    Workers {point['workers']:3d}: {point['ops_per_sec']:8.2f} ops/sec, "
+                              f"efficiency {point['efficiency']*100:5.1f}%")
+        
+        # On-chain batching
+        if result.get('onchain_batching'):
+            print(f"\n  Batched logSignatures Gas ({result['onchain_batching']['chain_backend']}):")
+            for point in result['onchain_batching']['batches']:
+                print(f"    Batch {point['batch_size']:4d}: {point['gas_per_signature']:10,.0f} gas/signature")
 
 def main():
     """Main batch operations function"""
@@ -502,9 +757,9 @@ def main():
     )
     parser.add_argument(
         "--algorithm",
-        type=str,
-        default="dilithium3",
-        help="Algorithm to test (default: dilithium3)"
+        nargs="+",
+        default=["dilithium3"],
+        help="Algorithm(s) to test, or 'all' (default: dilithium3)"
     )
     parser.add_argument(
         "--batch-sizes",
@@ -522,7 +777,37 @@ def main():
     parser.add_argument(
         "--parallel",
         action="store_true",
-        help="Use parallel processing"
+        help="Use parallel processing (same as --executor thread)"
+    )
+    parser.add_argument(
+        "--executor",
+        choices=EXECUTOR_CHOICES,
+        default=None,
+        help="Run batches on a worker pool: 'process' for multi-core scaling, 'thread' for the legacy mode"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Number of pool workers (default: {default_workers()}, one per core)"
+    )
+    parser.add_argument(
+        "--scaling",
+        action="store_true",
+        help="Run the worker scaling sweep (1, 2, 4, ... nproc workers, process and thread pools) "
+             "instead of the batch-size test"
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help=f"Largest worker count in the scaling sweep (default: {default_workers()})"
+    )
+    parser.add_argument(
+        "--scaling-batch-size",
+        type=int,
+        default=SCALING_BATCH_SIZE,
+        help=f"Operations per scaling measurement (default: {SCALING_BATCH_SIZE})"
     )
     parser.add_argument(
         "--skip-signing",
@@ -534,9 +819,37 @@ def main():
         action="store_true",
         help="Skip batch verification tests"
     )
+    parser.add_argument(
+        "--corpus",
+        type=str,
+        default=None,
+        help="Take signing/verification inputs from a test-vector corpus (see vector_corpus.py) "
+             "instead of the key fixtures"
+    )
+    parser.add_argument(
+        "--onchain",
+        action="store_true",
+        help="Also measure gas per signature of batched logSignatures transactions (1 to 512 per transaction)"
+    )
+    parser.add_argument(
+        "--chain-backend",
+        choices=CHAIN_BACKENDS,
+        default=DEFAULT_CHAIN_BACKEND,
+        help="Chain for the on-chain phase: ganache or in-process eth-tester (default: ganache)"
+    )
+    parser.add_argument(
+        "--gas-budget",
+        type=int,
+        default=DEFAULT_BATCH_GAS_BUDGET,
+        help=f"Maximum gas per batched transaction in the on-chain phase (default: {DEFAULT_BATCH_GAS_BUDGET:,})"
+    )
     
     args = parser.parse_args()
     
+    parallel = args.parallel or args.executor is not None
+    executor = args.executor or "thread"
+    algorithms = SUPPORTED_ALGORITHMS if 'all' in args.algorithm else args.algorithm
+    
     # Determine batch sizes
     if args.batch_sizes:
         batch_sizes = sorted(args.batch_sizes)
@@ -551,11 +864,22 @@ def main():
     print("="*70)
     print("  BATCH OPERATIONS FOR SCALABILITY ANALYSIS")
     print("="*70)
-    print(f"\nAlgorithm: {args.algorithm}")
-    print(f"Batch sizes: {batch_sizes}")
-    print(f"Parallel processing: {args.parallel}")
-    print(f"Test signing: {not args.skip_signing}")
-    print(f"Test verification: {not args.skip_verification}")
+    print(f"\nAlgorithm(s): {', '.join(algorithms)}")
+    if args.scaling:
+        print(f"Worker scaling sweep: {scaling_worker_counts(args.max_workers)} workers, "
+              f"{args.scaling_batch_size} operations per measurement")
+    else:
+        print(f"Batch sizes: {batch_sizes}")
+        print(f"Parallel processing: {parallel}")
+        if parallel:
+            print(f"Executor: {executor} ({args.workers or default_workers()} workers)")
+        print(f"Test signing: {not args.skip_signing}")
+        print(f"Test verification: {not args.skip_verification}")
+    if args.onchain:
+        print(f"On-chain batching: {args.chain_backend}, gas budget {args.gas_budget:,} per transaction")
+    corpus = VectorCorpus(args.corpus, verify=True) if args.corpus else None
+    if corpus is not None:
+        print(f"Test vectors: {corpus.describe()}")
     print()
     
     if not QUANTCRYPT_AVAILABLE:
@@ -563,29 +887,60 @@ def main():
         print("        Install with: pip install quantcrypt")
         sys.exit(1)
     
-    # Run scalability test
-    results = test_batch_scalability(
-        args.algorithm,
-        batch_sizes=batch_sizes,
-        parallel=args.parallel,
-        test_signing=not args.skip_signing,
-        test_verification=not args.skip_verification
-    )
+    all_results = []
+    for algorithm in algorithms:
+        if args.scaling:
+            # Run worker scaling sweep
+            operations = [op for op in SCALING_OPERATIONS
+                          if not (op == 'signing' and args.skip_signing)
+                          and not (op == 'verification' and args.skip_verification)]
+            results = {
+                'algorithm': algorithm,
+                'timestamp': datetime.now().isoformat(),
+                'worker_scaling': test_worker_scaling(
+                    algorithm,
+                    worker_counts=scaling_worker_counts(args.max_workers),
+                    batch_size=args.scaling_batch_size,
+                    operations=operations,
+                    corpus=corpus
+                )
+            }
+        else:
+            # Run scalability test
+            results = test_batch_scalability(
+                algorithm,
+                batch_sizes=batch_sizes,
+                parallel=parallel,
+                test_signing=not args.skip_signing,
+                test_verification=not args.skip_verification,
+                executor=executor,
+                workers=args.workers,
+                corpus=corpus
+            )
+        if results and args.onchain:
+            onchain = test_onchain_batching(algorithm, chain_backend=args.chain_backend,
+                                            gas_budget=args.gas_budget, corpus=corpus)
+            if onchain:
+                results['onchain_batching'] = onchain
+        if results:
+            all_results.append(results)
+        else:
+            print(f"\n[ERROR] Batch scalability test failed for {algorithm}")
     
-    if not results:
+    if not all_results:
         print("\n[ERROR] Batch scalability test failed")
         sys.exit(1)
     
     # Save results
-    results_file = save_batch_results([results])
+    results_file = save_batch_results(all_results)
     
     # Generate scalability analysis
-    generate_scalability_chart([results])
+    generate_scalability_chart(all_results)
     
     print("\n" + "="*70)
     print("BATCH OPERATIONS SUMMARY")
     print("="*70)
-    print(f"Algorithm: {args.algorithm}")
+    print(f"Algorithm(s): {', '.join(algorithms)}")
     print(f"Results saved to: {results_file}")
     print("="*70)
     
@@ -5,8 +5,6 @@ Runs systematic performance tests with statistical analysis
 import os
 import sys
 import time
-import statistics
-import json
 import csv
 from datetime import datetime
 from collections import defaultdict
@@ -17,11 +15,20 @@ os.chdir(PROJECT_ROOT)
 
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "scripts"))
 
-from web3 import Web3
-from contract_utils import load_contract_info
-from register_key import generate_pqc_keypair, register_key_on_chain
+from web3_client import get_contract
+from chain_backend import connect, load_registry, CHAIN_BACKENDS, DEFAULT_CHAIN_BACKEND, ETH_TESTER_AVAILABLE
+from committed_registry import COMMITTED_CONTRACT, key_commitment, register_committed_key
+from register_key import generate_pqc_keypair
+from algorithm_registry import get_algorithm_info
 from send_hybrid_tx import sign_message_pqc, send_hybrid_transaction, get_algorithm_instance
 from verify_signatures import verify_pqc_signature, get_public_key
+from tx_submitter import TransactionSubmitter
+from sample_store import save_results_index
+from vector_corpus import VectorCorpus, INVALID_KINDS, iter_invalid_inputs
+from sample_stats import (
+    SampleBuffer, SamplingPlan, collect_samples, summarize, time_batched,
+    DEFAULT_WARMUP, DEFAULT_MIN_SAMPLES, DEFAULT_MAX_SAMPLES, DEFAULT_TARGET_REL_CI, DEFAULT_TIME_BUDGET
+)
 
 # Try to import QuantCrypt
 try:
@@ -71,6 +78,13 @@ ALL_ALGORITHMS = [
 
 # ECDSA baseline for comparison
 INCLUDE_ECDSA = True
+DEFAULT_ECDSA_ITERATIONS = 20
+
+# per-call: one timer read per operation; batch: autoranged tight loops (ns/op)
+TIMING_MODES = ["per-call", "batch"]
+
+# Message-size sweep: 32 B to 16 MB on a log scale (x4 steps)
+MESSAGE_SWEEP_SIZES = [32 * 4 ** i for i in range(10)] + [16 * 1024 * 1024]
 
 def ensure_results_directory():
     """Ensure benchmark results directory exists"""
@@ -91,7 +105,7 @@ def benchmark_ecdsa_key_generation(iterations=20):
     if not ECDSA_AVAILABLE:
         return None
     
-    times = []
+    times = SampleBuffer()
     public_key_sizes = []
     private_key_sizes = []
     
@@ -141,12 +155,8 @@ def benchmark_ecdsa_key_generation(iterations=20):
         'algorithm': 'ecdsa',
         'operation': 'key_generation',
         'iterations': len(times),
-        'times': times,
-        'mean': statistics.mean(times),
-        'median': statistics.median(times),
-        'std_dev': statistics.stdev(times) if len(times) > 1 else 0.0,
-        'min': min(times),
-        'max': max(times),
+        'times': times.values,
+        **summarize(times),
         'public_key_size': public_key_sizes[0] if public_key_sizes else 65,
         'private_key_size': private_key_sizes[0] if private_key_sizes else 32,
         'timestamp': datetime.now().isoformat()
@@ -169,7 +179,7 @@ def benchmark_ecdsa_signing(private_key_obj, message, iterations=20):
     if not ECDSA_AVAILABLE:
         return None
     
-    times = []
+    times = SampleBuffer()
     signature_sizes = []
     
     try:
@@ -213,12 +223,8 @@ def benchmark_ecdsa_signing(private_key_obj, message, iterations=20):
         'algorithm': 'ecdsa',
         'operation': 'signing',
         'iterations': len(times),
-        'times': times,
-        'mean': statistics.mean(times),
-        'median': statistics.median(times),
-        'std_dev': statistics.stdev(times) if len(times) > 1 else 0.0,
-        'min': min(times),
-        'max': max(times),
+        'times': times.values,
+        **summarize(times),
         'signature_size': signature_sizes[0] if signature_sizes else 64,
         'message_size': len(message),
         'timestamp': datetime.now().isoformat()
@@ -242,7 +248,7 @@ def benchmark_ecdsa_verification(public_key_obj, message, signature, iterations=
     if not ECDSA_AVAILABLE:
         return None
     
-    times = []
+    times = SampleBuffer()
     
     try:
         if ECDSA_LIB == 'cryptography':
@@ -293,21 +299,55 @@ def benchmark_ecdsa_verification(public_key_obj, message, signature, iterations=
         'algorithm': 'ecdsa',
         'operation': 'verification',
         'iterations': len(times),
-        'times': times,
-        'mean': statistics.mean(times),
-        'median': statistics.median(times),
-        'std_dev': statistics.stdev(times) if len(times) > 1 else 0.0,
-        'min': min(times),
-        'max': max(times),
+        'times': times.values,
+        **summarize(times),
+        'timestamp': datetime.now().isoformat()
+    }
+
+def benchmark_batched(algorithm, operation, func, **fields):
+    """
+    Benchmark one operation with batch timing (autoranged loops, baseline subtracted)
+    
+    Args:
+        algorithm: Algorithm name
+        operation: Operation name ('key_generation', 'signing', 'verification')
+        func: Zero-argument callable performing one operation
+        **fields: Extra result fields (sizes)
+    
+    Returns:
+        dict: Benchmark results with statistics over per-loop seconds per operation
+    """
+    print(f"  Benchmarking {algorithm} {operation.replace('_', ' ')} (batch timing)...")
+    
+    try:
+        per_op, batch = time_batched(func)
+    except Exception as e:
+        print(f"    [ERROR] {operation.replace('_', ' ').capitalize()} failed: {e}")
+        return None
+    
+    print(f"    {batch['ns_per_op']:,.0f} ns/op ± {batch['ns_per_op_std']:,.0f} "
+          f"({batch['repeats']} loops x {batch['loops']} calls, "
+          f"baseline {batch['baseline_ns_per_op']:,.0f} ns/op subtracted)")
+    
+    return {
+        'algorithm': algorithm,
+        'operation': operation,
+        'iterations': batch['loops'] * batch['repeats'],
+        'timing': 'batch',
+        'batch': batch,
+        'times': per_op,
+        **summarize(per_op),
+        **fields,
         'timestamp': datetime.now().isoformat()
     }
 
-def benchmark_ecdsa(iterations=20):
+def benchmark_ecdsa(iterations=20, timing="per-call"):
     """
     Complete ECDSA benchmark for baseline comparison
     
     Args:
         iterations: Number of iterations per operation
+        timing: "per-call" or "batch" (autoranged loops, for sub-microsecond resolution)
     
     Returns:
         dict: Complete ECDSA benchmark results
@@ -319,11 +359,20 @@ def benchmark_ecdsa(iterations=20):
     results = {
         'algorithm': 'ecdsa',
         'timestamp': datetime.now().isoformat(),
-        'iterations': iterations
+        'iterations': 'batch timing' if timing == "batch" else iterations
     }
     
     # 1. Key Generation
-    keygen_result = benchmark_ecdsa_key_generation(iterations)
+    if timing == "batch":
+        if ECDSA_LIB == 'cryptography':
+            keygen = lambda: ec.generate_private_key(ec.SECP256K1(), default_backend()).public_key()
+            keygen_sizes = {'public_key_size': 65, 'private_key_size': 32}
+        else:
+            keygen = lambda: SigningKey.generate(curve=SECP256k1).get_verifying_key()
+            keygen_sizes = {'public_key_size': 64, 'private_key_size': 32}
+        keygen_result = benchmark_batched('ecdsa', 'key_generation', keygen, **keygen_sizes)
+    else:
+        keygen_result = benchmark_ecdsa_key_generation(iterations)
     if keygen_result:
         results['key_generation'] = keygen_result
         
@@ -349,7 +398,15 @@ def benchmark_ecdsa(iterations=20):
     
     # 2. Signing
     test_message = b"Benchmark test message for research paper analysis" + b"x" * 100
-    signing_result = benchmark_ecdsa_signing(private_key_obj, test_message, iterations)
+    if timing == "batch":
+        if ECDSA_LIB == 'cryptography':
+            sign = lambda: private_key_obj.sign(test_message, ec.ECDSA(hashes.SHA256()))
+        else:
+            sign = lambda: private_key_obj.sign(test_message, hashfunc=hashlib.sha256)
+        signing_result = benchmark_batched('ecdsa', 'signing', sign,
+                                           signature_size=len(sign()), message_size=len(test_message))
+    else:
+        signing_result = benchmark_ecdsa_signing(private_key_obj, test_message, iterations)
     if signing_result:
         results['signing'] = signing_result
         
@@ -370,9 +427,16 @@ def benchmark_ecdsa(iterations=20):
     
     # 3. Verification
     if public_key_obj and signature:
-        verification_result = benchmark_ecdsa_verification(
-            public_key_obj, test_message, signature, iterations
-        )
+        if timing == "batch":
+            if ECDSA_LIB == 'cryptography':
+                verify = lambda: public_key_obj.verify(signature, test_message, ec.ECDSA(hashes.SHA256()))
+            else:
+                verify = lambda: public_key_obj.verify(signature, test_message, hashfunc=hashlib.sha256)
+            verification_result = benchmark_batched('ecdsa', 'verification', verify)
+        else:
+            verification_result = benchmark_ecdsa_verification(
+                public_key_obj, test_message, signature, iterations
+            )
         if verification_result:
             results['verification'] = verification_result
     else:
@@ -380,42 +444,49 @@ def benchmark_ecdsa(iterations=20):
     
     return results
 
-def benchmark_key_generation(algorithm, iterations=20):
+def _print_sampling(info):
+    """Print how many samples a benchmark needed and why it stopped"""
+    rel_ci = f", CI ±{info['rel_ci'] * 100:.2f}%" if info['rel_ci'] is not None else ""
+    failures = f", {info['failures']} failed" if info['failures'] else ""
+    print(f"    Collected {info['samples']} samples in {info['elapsed']:.2f}s "
+          f"({info['stop_reason']}{rel_ci}{failures})")
+
+def benchmark_key_generation(algorithm, iterations=20, plan=None):
     """
     Benchmark PQC key generation with statistical analysis
     
     Args:
         algorithm: Algorithm name
-        iterations: Number of iterations
+        iterations: Number of iterations (used when no plan is given)
+        plan: SamplingPlan controlling warmup and adaptive iteration count
     
     Returns:
         dict: Benchmark results with statistics
     """
-    print(f"  Benchmarking {algorithm} key generation ({iterations} iterations)...")
+    plan = plan or SamplingPlan.fixed(iterations)
+    print(f"  Benchmarking {algorithm} key generation ({plan.describe()})...")
     
     if not QUANTCRYPT_AVAILABLE:
         return None
     
-    times = []
     public_key_sizes = []
     private_key_sizes = []
     
-    for i in range(iterations):
+    def measure():
         try:
             start = time.perf_counter()
             pk, sk, alg = generate_pqc_keypair(algorithm)
             elapsed = time.perf_counter() - start
-            
-            times.append(elapsed)
+        except Exception as e:
+            print(f"    [ERROR] Key generation failed: {e}")
+            return None
+        if not public_key_sizes:
             public_key_sizes.append(len(pk))
             private_key_sizes.append(len(sk))
-            
-            if (i + 1) % 5 == 0:
-                print(f"    Completed {i + 1}/{iterations} iterations...")
-        
-        except Exception as e:
-            print(f"    [ERROR] Iteration {i + 1} failed: {e}")
-            continue
+        return elapsed
+    
+    times, sampling = collect_samples(measure, plan)
+    _print_sampling(sampling)
     
     if not times:
         return None
@@ -424,18 +495,15 @@ def benchmark_key_generation(algorithm, iterations=20):
         'algorithm': algorithm,
         'operation': 'key_generation',
         'iterations': len(times),
-        'times': times,
-        'mean': statistics.mean(times),
-        'median': statistics.median(times),
-        'std_dev': statistics.stdev(times) if len(times) > 1 else 0.0,
-        'min': min(times),
-        'max': max(times),
+        'sampling': sampling,
+        'times': times.values,
+        **summarize(times),
         'public_key_size': public_key_sizes[0] if public_key_sizes else 0,
         'private_key_size': private_key_sizes[0] if private_key_sizes else 0,
         'timestamp': datetime.now().isoformat()
     }
 
-def benchmark_signing(algorithm, private_key, message, iterations=20):
+def benchmark_signing(algorithm, private_key, message, iterations=20, plan=None):
     """
     Benchmark PQC message signing with statistical analysis
     
@@ -443,32 +511,33 @@ def benchmark_signing(algorithm, private_key, message, iterations=20):
         algorithm: Algorithm name
         private_key: Private key bytes
         message: Message to sign
-        iterations: Number of iterations
+        iterations: Number of iterations (used when no plan is given)
+        plan: SamplingPlan controlling warmup and adaptive iteration count
     
     Returns:
         dict: Benchmark results with statistics
     """
-    print(f"  Benchmarking {algorithm} signing ({iterations} iterations)...")
+    plan = plan or SamplingPlan.fixed(iterations)
+    print(f"  Benchmarking {algorithm} signing ({plan.describe()})...")
     
     if not QUANTCRYPT_AVAILABLE:
         return None
     
     alg = get_algorithm_instance(algorithm)
-    times = []
     signature_sizes = []
     
-    for i in range(iterations):
+    def measure():
         try:
             sig, sign_time = sign_message_pqc(alg, private_key, message)
-            times.append(sign_time)
-            signature_sizes.append(len(sig))
-            
-            if (i + 1) % 5 == 0:
-                print(f"    Completed {i + 1}/{iterations} iterations...")
-        
         except Exception as e:
-            print(f"    [ERROR] Iteration {i + 1} failed: {e}")
-            continue
+            print(f"    [ERROR] Signing failed: {e}")
+            return None
+        if not signature_sizes:
+            signature_sizes.append(len(sig))
+        return sign_time
+    
+    times, sampling = collect_samples(measure, plan)
+    _print_sampling(sampling)
     
     if not times:
         return None
@@ -477,18 +546,15 @@ def benchmark_signing(algorithm, private_key, message, iterations=20):
         'algorithm': algorithm,
         'operation': 'signing',
         'iterations': len(times),
-        'times': times,
-        'mean': statistics.mean(times),
-        'median': statistics.median(times),
-        'std_dev': statistics.stdev(times) if len(times) > 1 else 0.0,
-        'min': min(times),
-        'max': max(times),
+        'sampling': sampling,
+        'times': times.values,
+        **summarize(times),
         'signature_size': signature_sizes[0] if signature_sizes else 0,
         'message_size': len(message),
         'timestamp': datetime.now().isoformat()
     }
 
-def benchmark_verification(algorithm, public_key, message, signature, iterations=20):
+def benchmark_verification(algorithm, public_key, message, signature, iterations=20, plan=None):
     """
     Benchmark PQC signature verification with statistical analysis
     
@@ -497,32 +563,27 @@ def benchmark_verification(algorithm, public_key, message, signature, iterations
         public_key: Public key bytes
         message: Original message
         signature: Signature bytes
-        iterations: Number of iterations
+        iterations: Number of iterations (used when no plan is given)
+        plan: SamplingPlan controlling warmup and adaptive iteration count
     
     Returns:
         dict: Benchmark results with statistics
     """
-    print(f"  Benchmarking {algorithm} verification ({iterations} iterations)...")
+    plan = plan or SamplingPlan.fixed(iterations)
+    print(f"  Benchmarking {algorithm} verification ({plan.describe()})...")
     
     if not QUANTCRYPT_AVAILABLE:
         return None
     
-    times = []
+    def measure():
+        is_valid, verify_time = verify_pqc_signature(algorithm, public_key, message, signature)
+        if not is_valid:
+            print(f"    [WARNING] Invalid signature")
+            return None
+        return verify_time
     
-    for i in range(iterations):
-        try:
-            is_valid, verify_time = verify_pqc_signature(algorithm, public_key, message, signature)
-            if is_valid:
-                times.append(verify_time)
-            else:
-                print(f"    [WARNING] Iteration {i + 1}: Invalid signature")
-            
-            if (i + 1) % 5 == 0:
-                print(f"    Completed {i + 1}/{iterations} iterations...")
-        
-        except Exception as e:
-            print(f"    [ERROR] Iteration {i + 1} failed: {e}")
-            continue
+    times, sampling = collect_samples(measure, plan)
+    _print_sampling(sampling)
     
     if not times:
         return None
@@ -531,61 +592,260 @@ def benchmark_verification(algorithm, public_key, message, signature, iterations
         'algorithm': algorithm,
         'operation': 'verification',
         'iterations': len(times),
-        'times': times,
-        'mean': statistics.mean(times),
-        'median': statistics.median(times),
-        'std_dev': statistics.stdev(times) if len(times) > 1 else 0.0,
-        'min': min(times),
-        'max': max(times),
+        'sampling': sampling,
+        'times': times.values,
+        **summarize(times),
         'timestamp': datetime.now().isoformat()
     }
 
-def benchmark_gas_usage(w3, account, contract_address, abi, algorithm, public_key, message, signature):
+def benchmark_rejection(algorithm, public_key, message, signature, wrong_public_key, iterations=20, plan=None,
+                        kinds=None, seed=0, accept_mean=None):
+    """
+    Benchmark how fast invalid signatures are rejected
+    
+    Every sample verifies the next input from a seeded stream of invalid
+    signatures of one kind; an exception from verify counts as a rejection
+    and is timed like a False result.
+    
+    Args:
+        algorithm: Algorithm name
+        public_key: Public key the signature is valid for
+        message: Signed message
+        signature: Valid signature the invalid inputs are derived from
+        wrong_public_key: Another public key of the same algorithm (for wrong_key inputs)
+        iterations: Number of iterations per kind (used when no plan is given)
+        plan: SamplingPlan controlling warmup and adaptive iteration count
+        kinds: Invalid kinds to measure (default: tampered, truncated, wrong_key)
+        seed: Seed of the invalid-signature generator
+        accept_mean: Mean accept-path verify time, for the printed ratio
+    
+    Returns:
+        dict: Per-kind rejection latency statistics; 'accepted' counts invalid
+              inputs that verified (should be 0)
+    """
+    plan = plan or SamplingPlan.fixed(iterations)
+    kinds = kinds or INVALID_KINDS
+    print(f"  Benchmarking {algorithm} rejection latency ({', '.join(kinds)}; {plan.describe()})...")
+    
+    if not QUANTCRYPT_AVAILABLE:
+        return None
+    
+    alg = get_algorithm_instance(algorithm)
+    rejection = {}
+    for kind in kinds:
+        if kind == 'wrong_key' and wrong_public_key is None:
+            print(f"    [SKIP] wrong_key: no second public key")
+            continue
+        inputs = iter_invalid_inputs(kind, public_key, signature, seed, wrong_public_key)
+        
+        def measure():
+            pk, sig = next(inputs)
+            start = time.perf_counter()
+            try:
+                accepted = alg.verify(pk, message, sig)
+            except Exception:
+                accepted = False
+            elapsed = time.perf_counter() - start
+            return None if accepted else elapsed
+        
+        times, sampling = collect_samples(measure, plan)
+        if sampling['failures']:
+            print(f"    [WARNING] {kind}: {sampling['failures']} invalid signature(s) accepted")
+        if not times:
+            continue
+        
+        rejection[kind] = {
+            'algorithm': algorithm,
+            'operation': 'rejection',
+            'kind': kind,
+            'iterations': len(times),
+            'sampling': sampling,
+            'accepted': sampling['failures'],
+            'times': times.values,
+            **summarize(times),
+            'timestamp': datetime.now().isoformat()
+        }
+        ratio = f" ({rejection[kind]['mean'] / accept_mean:.2f}x accept)" if accept_mean else ""
+        print(f"    {kind:<10} mean {rejection[kind]['mean'] * 1000:.3f} ms, "
+              f"p99 {rejection[kind]['p99'] * 1000:.3f} ms{ratio}")
+    
+    return rejection or None
+
+def benchmark_gas_usage(w3, account, contract_address, abi, algorithm, public_key, message, signature,
+                        transactions=1, committed_registry=None):
     """
     Benchmark gas usage for blockchain operations
     
+    The key registration (when needed) and the logSignature transactions are
+    submitted back-to-back with locally tracked nonces and their receipts are
+    collected asynchronously; throughput covers every submitted transaction.
+    
+    Args:
+        transactions: Number of logSignature transactions to submit
+        committed_registry: (address, abi) of a KeyRegistryCommitted deployment to also
+                            measure commitment-only registration on (optional)
+    
     Returns:
         dict: Gas usage metrics
     """
-    print(f"  Benchmarking {algorithm} gas usage...")
+    print(f"  Benchmarking {algorithm} gas usage ({transactions} transaction(s))...")
     
+    submitter = None
     try:
-        # Register key (if not already registered)
-        contract = w3.eth.contract(address=contract_address, abi=abi)
+        contract = get_contract(w3, contract_address, abi)
         stored_key = contract.functions.getPQCKey(account).call()
         
-        if len(stored_key) == 0 or stored_key != public_key:
-            # Register key
-            tx_receipt = register_key_on_chain(w3, account, contract_address, abi, public_key)
-            registration_gas = tx_receipt['gasUsed'] if tx_receipt else 0
-        else:
-            registration_gas = 0  # Already registered
+        committed_registration_gas = None
+        committed_already_registered = False
+        if committed_registry is not None:
+            committed = get_contract(w3, *committed_registry)
+            if bytes(committed.functions.getPQCKeyCommitment(account).call()) != key_commitment(public_key):
+                committed_registration_gas = register_committed_key(w3, account, committed, public_key)['gasUsed']
+            else:
+                # No transaction was sent, so there is no gas to report
+                committed_already_registered = True
+                print("    Commitment-only registration: key already registered, gas not measured")
         
-        # Send hybrid transaction
-        tx_receipt = send_hybrid_transaction(w3, account, contract_address, abi, message, signature)
-        transaction_gas = tx_receipt['gasUsed'] if tx_receipt else 0
+        # Register key (if not already registered), then send hybrid transactions
+        submitter = TransactionSubmitter(w3, account, contract)
+        register = len(stored_key) == 0 or stored_key != public_key
+        if register:
+            submitter.submit("registerPQCKey", public_key)
+        for _ in range(transactions):
+            submitter.submit("logSignature", signature, message)
+        receipts = submitter.collect()
+        throughput = submitter.stats()
+        
+        registration_gas = receipts.pop(0)['gasUsed'] if register else 0
+        if register and contract.functions.getPQCKey(account).call() != public_key:
+            print("    [WARNING] Stored key doesn't match the registered key")
+        if committed_registration_gas is not None:
+            full_key = f"{registration_gas:,}" if register else "already registered"
+            print(f"    Commitment-only registration gas: {committed_registration_gas:,} (full key: {full_key})")
+        
+        gas_values = [receipt['gasUsed'] for receipt in receipts]
+        transaction_gas = gas_values[0] if gas_values else 0
+        
+        print(f"    Submitted {throughput['submitted']} tx at {throughput['submitted_tps']:.1f} tx/sec, "
+              f"confirmed at {throughput['confirmed_tps']:.1f} tx/sec")
         
         return {
             'algorithm': algorithm,
             'operation': 'gas_usage',
             'registration_gas': registration_gas,
+            'committed_registration_gas': committed_registration_gas,
+            'committed_already_registered': committed_already_registered,
             'transaction_gas': transaction_gas,
             'total_gas': registration_gas + transaction_gas,
+            'transactions': len(gas_values),
+            'transaction_gas_mean': sum(gas_values) / len(gas_values) if gas_values else 0,
+            'transaction_gas_min': min(gas_values) if gas_values else 0,
+            'transaction_gas_max': max(gas_values) if gas_values else 0,
+            'submitted_tps': throughput['submitted_tps'],
+            'confirmed_tps': throughput['confirmed_tps'],
+            'submit_duration': throughput['submit_duration'],
+            'confirm_duration': throughput['confirm_duration'],
             'timestamp': datetime.now().isoformat()
         }
     
     except Exception as e:
         print(f"    [ERROR] Gas benchmarking failed: {e}")
         return None
+    finally:
+        if submitter is not None:
+            submitter.close()
+
+def benchmark_message_sweep(algorithm, public_key, private_key, sizes=None, plan=None, messages=None):
+    """
+    Benchmark signing and verification across message sizes
+    
+    One keypair is reused for every size and all messages are allocated up
+    front, so the timed calls never build message bytes.
+    
+    Args:
+        algorithm: Algorithm name
+        public_key: Public key bytes
+        private_key: Private key bytes
+        sizes: Message sizes in bytes (default: MESSAGE_SWEEP_SIZES)
+        plan: SamplingPlan per size and operation (default: adaptive, 2s budget)
+        messages: Message bytes per size, e.g. from a corpus (default: random bytes)
+    
+    Returns:
+        list: Per-size results with signing/verification statistics and bytes/sec
+    """
+    sizes = sorted(sizes or (messages.keys() if messages else MESSAGE_SWEEP_SIZES))
+    plan = plan or SamplingPlan(time_budget=2.0)
+    print(f"  Message-size sweep for {algorithm}: {len(sizes)} sizes, {sizes[0]} B to {sizes[-1]:,} B "
+          f"({plan.describe()})...")
+    
+    if not QUANTCRYPT_AVAILABLE:
+        return None
+    
+    alg = get_algorithm_instance(algorithm)
+    if messages:
+        messages = [messages[size] for size in sizes]
+    else:
+        payload = os.urandom(sizes[-1])
+        messages = [payload[:size] for size in sizes]
+    
+    sweep = []
+    print(f"    {'Size (B)':>10} {'Sign (ms)':>11} {'Sign MB/s':>11} {'Verify (ms)':>12} {'Verify MB/s':>12}")
+    for size, message in zip(sizes, messages):
+        try:
+            signature, _ = sign_message_pqc(alg, private_key, message)
+        except Exception as e:
+            print(f"    [ERROR] Signing {size} B failed: {e}")
+            continue
+        
+        def measure_sign():
+            try:
+                return sign_message_pqc(alg, private_key, message)[1]
+            except Exception:
+                return None
+        
+        def measure_verify():
+            is_valid, verify_time = verify_pqc_signature(algorithm, public_key, message, signature)
+            return verify_time if is_valid else None
+        
+        sign_times, sign_sampling = collect_samples(measure_sign, plan)
+        verify_times, verify_sampling = collect_samples(measure_verify, plan)
+        if not sign_times or not verify_times:
+            print(f"    [ERROR] {size} B: no valid samples")
+            continue
+        
+        signing = {'sampling': sign_sampling, 'times': sign_times.values, **summarize(sign_times)}
+        verification = {'sampling': verify_sampling, 'times': verify_times.values, **summarize(verify_times)}
+        entry = {
+            'message_size': size,
+            'signature_size': len(signature),
+            'signing': signing,
+            'verification': verification,
+            'sign_bytes_per_sec': size / signing['mean'] if signing['mean'] > 0 else 0,
+            'verify_bytes_per_sec': size / verification['mean'] if verification['mean'] > 0 else 0,
+        }
+        sweep.append(entry)
+        print(f"    {size:>10,} {signing['mean'] * 1000:>11.3f} {entry['sign_bytes_per_sec'] / 1e6:>11.2f} "
+              f"{verification['mean'] * 1000:>12.3f} {entry['verify_bytes_per_sec'] / 1e6:>12.2f}")
+    
+    return sweep
 
-def benchmark_algorithm(algorithm, iterations=20, test_gas=True):
+def benchmark_algorithm(algorithm, iterations=20, test_gas=True, gas_transactions=1, plan=None, timing="per-call",
+                        message_sizes=None, corpus=None, rejection=False, chain_backend=DEFAULT_CHAIN_BACKEND):
     """
     Complete benchmark for one algorithm
     
     Args:
         algorithm: Algorithm name
-        iterations: Number of iterations per operation
+        iterations: Number of iterations per operation (used when no plan is given)
         test_gas: Whether to test gas usage
+        gas_transactions: Number of logSignature transactions for gas benchmarking
+        plan: SamplingPlan for the keygen/sign/verify micro-benchmarks
+        timing: "per-call" or "batch" (autoranged loops, for sub-microsecond resolution)
+        message_sizes: Message sizes for a sign/verify sweep (default: no sweep)
+        corpus: VectorCorpus supplying the keypair, message and signature of the
+                sign/verify benchmarks (default: fresh keypair and a fixed message)
+        rejection: Also time rejection of tampered, truncated and wrong-key signatures
+        chain_backend: Chain for gas benchmarking ("ganache" or in-process "eth-tester")
     
     Returns:
         dict: Complete benchmark results
@@ -597,39 +857,71 @@ def benchmark_algorithm(algorithm, iterations=20, test_gas=True):
     results = {
         'algorithm': algorithm,
         'timestamp': datetime.now().isoformat(),
-        'iterations': iterations
+        'iterations': 'batch timing' if timing == "batch" else (plan.describe() if plan else iterations)
     }
     
+    # Inputs for signing/verification: first valid corpus vector, if the corpus has this algorithm
+    vector = None
+    if corpus is not None:
+        positions = corpus.select(algorithm, 'valid')
+        if len(positions):
+            vector = corpus.vector(positions[0])
+            results['corpus'] = corpus.digest
+        else:
+            print(f"  [WARNING] Corpus has no vectors for {algorithm}, generating inputs")
+    
     # 1. Key Generation
-    keygen_result = benchmark_key_generation(algorithm, iterations)
+    if timing == "batch":
+        alg = get_algorithm_instance(algorithm)
+        info = get_algorithm_info(algorithm)
+        keygen_result = benchmark_batched(algorithm, 'key_generation', alg.keygen,
+                                          public_key_size=info['public_key_size'],
+                                          private_key_size=info['private_key_size'])
+    else:
+        keygen_result = benchmark_key_generation(algorithm, iterations, plan)
     if keygen_result:
         results['key_generation'] = keygen_result
         public_key = None
         private_key = None
         
         # Generate keys for subsequent tests
-        try:
-            public_key, private_key, alg_instance = generate_pqc_keypair(algorithm)
-        except:
-            pass
+        if vector is not None:
+            public_key, private_key = vector['public_key'], vector['private_key']
+        else:
+            try:
+                public_key, private_key, alg_instance = generate_pqc_keypair(algorithm)
+            except:
+                pass
     else:
         print(f"  [SKIP] Key generation benchmark failed for {algorithm}")
         return None
     
     # 2. Signing
     if private_key:
-        test_message = b"Benchmark test message for research paper analysis" + b"x" * 100
-        signing_result = benchmark_signing(algorithm, private_key, test_message, iterations)
+        if vector is not None:
+            test_message = vector['message']
+        else:
+            test_message = b"Benchmark test message for research paper analysis" + b"x" * 100
+        if timing == "batch":
+            alg = get_algorithm_instance(algorithm)
+            signing_result = benchmark_batched(algorithm, 'signing', lambda: alg.sign(private_key, test_message),
+                                               signature_size=len(alg.sign(private_key, test_message)),
+                                               message_size=len(test_message))
+        else:
+            signing_result = benchmark_signing(algorithm, private_key, test_message, iterations, plan)
         if signing_result:
             results['signing'] = signing_result
             signature = None
             
             # Get signature for verification test
-            try:
-                alg = get_algorithm_instance(algorithm)
-                signature, _ = sign_message_pqc(alg, private_key, test_message)
-            except:
-                pass
+            if vector is not None:
+                signature = vector['signature']
+            else:
+                try:
+                    alg = get_algorithm_instance(algorithm)
+                    signature, _ = sign_message_pqc(alg, private_key, test_message)
+                except:
+                    pass
         else:
             print(f"  [SKIP] Signing benchmark failed for {algorithm}")
     else:
@@ -638,27 +930,85 @@ def benchmark_algorithm(algorithm, iterations=20, test_gas=True):
     
     # 3. Verification
     if public_key and signature:
-        verification_result = benchmark_verification(
-            algorithm, public_key, test_message, signature, iterations
-        )
+        if timing == "batch":
+            alg = get_algorithm_instance(algorithm)
+            verification_result = benchmark_batched(algorithm, 'verification',
+                                                    lambda: alg.verify(public_key, test_message, signature))
+        else:
+            verification_result = benchmark_verification(
+                algorithm, public_key, test_message, signature, iterations, plan
+            )
         if verification_result:
             results['verification'] = verification_result
     else:
         print(f"  [SKIP] Verification benchmark skipped")
     
-    # 4. Gas Usage (optional, requires blockchain)
+    # 4. Rejection latency of invalid signatures (optional)
+    if rejection and public_key and signature:
+        wrong_public_key = None
+        if vector is not None:
+            for position in corpus.select(algorithm, 'valid'):
+                other = corpus.vector(position)
+                if other['public_key'] != public_key:
+                    wrong_public_key = other['public_key']
+                    break
+        if wrong_public_key is None:
+            try:
+                wrong_public_key, _, _ = generate_pqc_keypair(algorithm)
+            except Exception as e:
+                print(f"  [WARNING] Could not generate a second keypair: {e}")
+        accept_mean = results['verification']['mean'] if 'verification' in results else None
+        rejection_result = benchmark_rejection(algorithm, public_key, test_message, signature, wrong_public_key,
+                                               iterations, plan, accept_mean=accept_mean)
+        if rejection_result:
+            results['rejection'] = rejection_result
+    
+    # 5. Message-size sweep (optional), reusing the same keypair
+    if message_sizes and public_key and private_key:
+        corpus_messages = None
+        if vector is not None:
+            # Corpus messages of the requested sizes (one per size); sizes not in the corpus are skipped
+            corpus_messages = {}
+            for size in message_sizes:
+                positions = corpus.select(algorithm, 'valid', size)
+                if len(positions):
+                    corpus_messages[size] = corpus.vector(positions[0])['message']
+            missing = sorted(set(message_sizes) - set(corpus_messages))
+            if missing:
+                print(f"  [WARNING] Corpus has no messages of {missing} bytes, skipping those sizes")
+        sweep = None
+        if corpus_messages is None or corpus_messages:
+            sweep = benchmark_message_sweep(algorithm, public_key, private_key,
+                                            sorted(corpus_messages or message_sizes),
+                                            plan, corpus_messages)
+        if sweep:
+            results['message_sweep'] = sweep
+    
+    # 6. Gas Usage (optional, requires blockchain)
     if test_gas and public_key and signature:
         try:
-            w3 = Web3(Web3.HTTPProvider(GANACHE_URL))
+            w3 = connect(chain_backend, GANACHE_URL)
             if w3.is_connected():
-                contract_address, abi = load_contract_info()
+                contract_address, abi = load_registry(w3, chain_backend)
                 if contract_address:
                     account = w3.eth.accounts[0]
+                    try:
+                        committed_registry = load_registry(w3, chain_backend, COMMITTED_CONTRACT)
+                    except Exception as e:
+                        print(f"  [SKIP] {COMMITTED_CONTRACT} unavailable: {e}")
+                        committed_registry = None
+                    if committed_registry is not None and not committed_registry[0]:
+                        print(f"  [INFO] {COMMITTED_CONTRACT} not deployed, skipping commitment registration gas "
+                              f"(python scripts/deploy.py --contract {COMMITTED_CONTRACT})")
+                        committed_registry = None
                     gas_result = benchmark_gas_usage(
                         w3, account, contract_address, abi, algorithm,
-                        public_key, test_message, signature
+                        public_key, test_message, signature,
+                        transactions=gas_transactions,
+                        committed_registry=committed_registry
                     )
                     if gas_result:
+                        gas_result['chain_backend'] = chain_backend
                         results['gas_usage'] = gas_result
         except Exception as e:
             print(f"  [SKIP] Gas benchmarking skipped: {e}")
@@ -680,12 +1030,16 @@ def save_benchmark_results(all_results):
         'results': all_results
     }
     
-    with open(BENCHMARK_RESULTS_FILE, 'w') as f:
-        json.dump(output, f, indent=2)
+    # Raw timing samples and outlier positions go to .samples.npy / .outliers.npy files next to the JSON summary
+    save_results_index(output, BENCHMARK_RESULTS_FILE)
     
     print(f"\n[OK] Benchmark results saved to: {BENCHMARK_RESULTS_FILE}")
     return BENCHMARK_RESULTS_FILE
 
+def _has_committed_registration(gas):
+    """Whether a gas result covers the commitment-only registry (measured or already registered)"""
+    return gas.get('committed_registration_gas') is not None or gas.get('committed_already_registered', False)
+
 def generate_comparison_table(all_results):
     """
     Generate algorithm comparison table for research paper
@@ -701,8 +1055,8 @@ def generate_comparison_table(all_results):
     print("="*70)
     
     table = []
-    table.append(f"{'Algorithm':<15} {'Keygen (ms)':<15} {'Sign (ms)':<15} {'Verify (ms)':<15} {'PubKey (B)':<12} {'Sig (B)':<12}")
-    table.append("-" * 90)
+    table.append(f"{'Algorithm':<15} {'Keygen (ms)':<15} {'Sign (ms)':<15} {'Verify (ms)':<15} {'Verify p99 (ms)':<17} {'PubKey (B)':<12} {'Sig (B)':<12}")
+    table.append("-" * 108)
     
     for result in all_results:
         algo = result.get('algorithm', 'unknown')
@@ -713,14 +1067,53 @@ def generate_comparison_table(all_results):
         keygen_mean = keygen.get('mean', 0) * 1000 if keygen else 0
         sign_mean = signing.get('mean', 0) * 1000 if signing else 0
         verify_mean = verify.get('mean', 0) * 1000 if verify else 0
+        verify_p99 = verify.get('p99', 0) * 1000 if verify else 0
         pubkey_size = keygen.get('public_key_size', 0) if keygen else 0
         sig_size = signing.get('signature_size', 0) if signing else 0
         
         table.append(
-            f"{algo:<15} {keygen_mean:>12.2f} {sign_mean:>12.2f} {verify_mean:>12.2f} "
+            f"{algo:<15} {keygen_mean:>12.2f} {sign_mean:>12.2f} {verify_mean:>12.2f} {verify_p99:>15.2f} "
             f"{pubkey_size:>10} {sig_size:>10}"
         )
     
+    # Rejection latency next to the accept path (only when --rejection was run)
+    if any(result.get('rejection') for result in all_results):
+        table.append("")
+        table.append(f"{'Algorithm':<15} {'Accept (ms)':<15} " + " ".join(f"{kind + ' (ms)':<17}" for kind in INVALID_KINDS))
+        table.append("-" * 84)
+        for result in all_results:
+            rejection = result.get('rejection')
+            if not rejection:
+                continue
+            accept_mean = result.get('verification', {}).get('mean', 0) * 1000
+            cells = " ".join(
+                f"{rejection[kind]['mean'] * 1000:>15.3f}  " if kind in rejection else f"{'-':>15}  "
+                for kind in INVALID_KINDS
+            )
+            table.append(f"{result.get('algorithm', 'unknown'):<15} {accept_mean:>12.3f}   {cells}")
+    
+    # Registration gas of the full-key and commitment-only registries
+    if any(_has_committed_registration(result.get('gas_usage') or {}) for result in all_results):
+        table.append("")
+        table.append(f"{'Algorithm':<15} {'PubKey (B)':<12} {'Full key (gas)':<16} {'Commitment (gas)':<18} {'Saving':<8}")
+        table.append("-" * 72)
+        for result in all_results:
+            gas = result.get('gas_usage') or {}
+            if not _has_committed_registration(gas):
+                continue
+            committed_gas = gas.get('committed_registration_gas')
+            full_gas = gas.get('registration_gas', 0)
+            pubkey_size = (result.get('key_generation') or {}).get('public_key_size', 0)
+            if committed_gas is None:
+                # Key was already on the committed registry: nothing was measured
+                committed_cell, saving = "already registered", "-"
+            else:
+                committed_cell = f"{committed_gas:,}"
+                saving = f"{(1 - committed_gas / full_gas) * 100:.1f}%" if full_gas else "-"
+            full_cell = f"{full_gas:,}" if full_gas else "already registered"
+            table.append(f"{result.get('algorithm', 'unknown'):<15} {pubkey_size:>10} {full_cell:>16} "
+                         f"{committed_cell:>18} {saving:>8}")
+    
     table_str = "\n".join(table)
     print(table_str)
     
@@ -748,14 +1141,89 @@ def main():
     parser.add_argument(
         "--iterations",
         type=int,
-        default=20,
-        help="Number of iterations per operation (default: 20)"
+        default=None,
+        help="Fixed number of iterations per operation (default: adaptive sampling)"
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=DEFAULT_WARMUP,
+        help=f"Discarded warmup runs per operation in adaptive mode (default: {DEFAULT_WARMUP})"
+    )
+    parser.add_argument(
+        "--min-iterations",
+        type=int,
+        default=DEFAULT_MIN_SAMPLES,
+        help=f"Minimum samples per operation in adaptive mode (default: {DEFAULT_MIN_SAMPLES})"
+    )
+    parser.add_argument(
+        "--max-iterations",
+        type=int,
+        default=DEFAULT_MAX_SAMPLES,
+        help=f"Maximum samples per operation in adaptive mode (default: {DEFAULT_MAX_SAMPLES})"
+    )
+    parser.add_argument(
+        "--target-ci",
+        type=float,
+        default=DEFAULT_TARGET_REL_CI,
+        help=f"Stop once the 95%% CI half-width is within this fraction of the mean (default: {DEFAULT_TARGET_REL_CI})"
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=DEFAULT_TIME_BUDGET,
+        help=f"Sampling time budget per operation in seconds (default: {DEFAULT_TIME_BUDGET})"
+    )
+    parser.add_argument(
+        "--timing",
+        choices=TIMING_MODES,
+        default="per-call",
+        help="per-call: time every operation; batch: autoranged loops with baseline "
+             "subtraction for fast operations (ns/op) (default: per-call)"
+    )
+    parser.add_argument(
+        "--message-sweep",
+        action="store_true",
+        help="Also sweep sign/verify over message sizes from 32 B to 16 MB "
+             "(with --iterations, every size runs that many iterations)"
+    )
+    parser.add_argument(
+        "--message-sizes",
+        nargs="+",
+        type=int,
+        default=None,
+        help="Message sizes in bytes for the sweep (implies --message-sweep)"
+    )
+    parser.add_argument(
+        "--rejection",
+        action="store_true",
+        help="Also benchmark rejection latency of tampered, truncated and wrong-key signatures"
+    )
+    parser.add_argument(
+        "--corpus",
+        type=str,
+        default=None,
+        help="Take keypairs, messages and signatures from a test-vector corpus (see vector_corpus.py); "
+             "with --message-sweep, sweeps the corpus message sizes"
     )
     parser.add_argument(
         "--skip-gas",
         action="store_true",
         help="Skip gas usage benchmarking"
     )
+    parser.add_argument(
+        "--gas-transactions",
+        type=int,
+        default=1,
+        help="Number of pipelined logSignature transactions per algorithm for gas benchmarking (default: 1)"
+    )
+    parser.add_argument(
+        "--chain-backend",
+        choices=CHAIN_BACKENDS,
+        default=DEFAULT_CHAIN_BACKEND,
+        help="Chain for gas benchmarking: ganache (JSON-RPC at http://127.0.0.1:8545) or eth-tester "
+             "(in-process EVM, needs eth-tester[py-evm]; no node or network) (default: ganache)"
+    )
     parser.add_argument(
         "--skip-ecdsa",
         action="store_true",
@@ -775,8 +1243,24 @@ def main():
     print("  For Research Paper Publication")
     print("="*70)
     print(f"\nAlgorithms to benchmark: {', '.join(args.algorithms)}")
-    print(f"Iterations per operation: {args.iterations}")
+    if args.iterations is not None:
+        plan = SamplingPlan.fixed(args.iterations)
+    else:
+        plan = SamplingPlan(args.warmup, args.min_iterations, args.max_iterations,
+                            args.target_ci, args.time_budget)
+    print(f"Iterations per operation: {plan.describe() if args.timing == 'per-call' else 'batch timing'}")
+    corpus = VectorCorpus(args.corpus, verify=True) if args.corpus else None
+    if corpus is not None:
+        print(f"Test vectors: {corpus.describe()}")
+    message_sizes = args.message_sizes or (
+        (corpus.header['message_sizes'] if corpus is not None else MESSAGE_SWEEP_SIZES) if args.message_sweep else None
+    )
+    if message_sizes:
+        print(f"Message-size sweep: {len(message_sizes)} sizes, {min(message_sizes)} B to {max(message_sizes):,} B")
     print(f"Skip gas benchmarking: {args.skip_gas}")
+    if not args.skip_gas:
+        print(f"Gas transactions per algorithm: {args.gas_transactions}")
+        print(f"Chain backend: {args.chain_backend}")
     print(f"Include ECDSA baseline: {not args.skip_ecdsa}")
     print()
     
@@ -785,13 +1269,18 @@ def main():
         print("        Install with: pip install quantcrypt")
         sys.exit(1)
     
+    if not args.skip_gas and args.chain_backend == "eth-tester" and not ETH_TESTER_AVAILABLE:
+        print("[ERROR] eth-tester not available for the in-process chain backend")
+        print("        Install with: pip install \"eth-tester[py-evm]\"")
+        sys.exit(1)
+    
     all_results = []
     
     # Benchmark ECDSA baseline first (if requested)
     if not args.skip_ecdsa and INCLUDE_ECDSA:
         if ECDSA_AVAILABLE:
             try:
-                ecdsa_result = benchmark_ecdsa(args.iterations)
+                ecdsa_result = benchmark_ecdsa(args.iterations or DEFAULT_ECDSA_ITERATIONS, args.timing)
                 if ecdsa_result:
                     all_results.append(ecdsa_result)
             except Exception as e:
@@ -807,7 +1296,9 @@ def main():
             continue
         
         try:
-            result = benchmark_algorithm(algorithm, args.iterations, not args.skip_gas)
+            result = benchmark_algorithm(algorithm, plan.min_samples, not args.skip_gas, args.gas_transactions,
+                                         plan, args.timing, message_sizes, corpus, args.rejection,
+                                         args.chain_backend)
             if result:
                 all_results.append(result)
         except Exception as e:
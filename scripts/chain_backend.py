@@ -0,0 +1,93 @@
+"""
+Pluggable chain backends for on-chain measurements
+"ganache" talks JSON-RPC to an external node; "eth-tester" runs py-evm in-process
+(no sockets, no external node) on Ganache's hardfork with a KeyRegistry deployed on first use
+"""
+import threading
+
+from web3 import Web3, EthereumTesterProvider
+
+from web3_client import get_web3, DEFAULT_RPC_URL
+from contract_utils import load_contract_info
+from contract_build import compile_contract
+
+# web3 exposes EthereumTesterProvider unconditionally; the EVM itself is optional
+try:
+    from eth_tester import EthereumTester, PyEVMBackend
+    from eth.vm.forks import ShanghaiVM
+    ETH_TESTER_AVAILABLE = True
+except ImportError:
+    ETH_TESTER_AVAILABLE = False
+
+CHAIN_BACKENDS = ["ganache", "eth-tester"]
+DEFAULT_CHAIN_BACKEND = "ganache"
+
+# Ganache 7 runs Shanghai; py-evm defaults to its newest fork (Prague and its EIP-7623
+# calldata floor), which would charge calldata-heavy logSignature calls differently
+GANACHE_HARDFORK = "shanghai"
+
+_TESTER_W3 = None
+_TESTER_CONTRACTS = {}
+# py-evm is not thread-safe; receipt polling threads must not overlap with mining
+_TESTER_LOCK = threading.RLock()
+
+class _LockedTesterProvider(EthereumTesterProvider):
+    def make_request(self, method, params):
+        with _TESTER_LOCK:
+            return super().make_request(method, params)
+
+def connect(backend=DEFAULT_CHAIN_BACKEND, url=DEFAULT_RPC_URL):
+    """
+    Get a Web3 client for a chain backend
+
+    Args:
+        backend: "ganache" (JSON-RPC at url) or "eth-tester" (in-process EVM)
+        url: JSON-RPC endpoint for the ganache backend
+
+    Returns:
+        Web3 instance (shared per backend/URL)
+    """
+    global _TESTER_W3
+    if backend == "ganache":
+        return get_web3(url)
+    if backend != "eth-tester":
+        raise ValueError(f"Unknown chain backend: {backend}. Available: {', '.join(CHAIN_BACKENDS)}")
+    if not ETH_TESTER_AVAILABLE:
+        raise ImportError("eth-tester not available. Install with: pip install \"eth-tester[py-evm]\"")
+    with _TESTER_LOCK:
+        if _TESTER_W3 is None:
+            backend = PyEVMBackend(vm_configuration=((0, ShanghaiVM),))
+            _TESTER_W3 = Web3(_LockedTesterProvider(EthereumTester(backend)))
+    return _TESTER_W3
+
+def load_registry(w3, backend=DEFAULT_CHAIN_BACKEND, contract_name="KeyRegistry"):
+    """
+    Get the registry contract to measure against on a backend
+
+    Ganache uses the deployment recorded by deploy.py (contracts/contract_info*.json);
+    the in-process chain starts empty, so the contract is deployed (from the cached
+    build) once per process.
+
+    Args:
+        w3: Web3 instance from connect()
+        backend: Chain backend name
+        contract_name: Registry contract (KeyRegistry or KeyRegistryCommitted)
+
+    Returns:
+        tuple: (contract_address, abi), (None, None) if nothing is deployed
+    """
+    if backend != "eth-tester":
+        return load_contract_info(contract_name)
+
+    with _TESTER_LOCK:
+        deployed = _TESTER_CONTRACTS.get(contract_name)
+        if deployed is None:
+            interface = compile_contract(contract_name)
+            factory = w3.eth.contract(abi=interface['abi'], bytecode=interface['bin'])
+            tx_hash = factory.constructor().transact({'from': w3.eth.accounts[0]})
+            receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+            if receipt.status != 1:
+                raise Exception(f"{contract_name} deployment failed on the in-process chain")
+            deployed = (receipt['contractAddress'], interface['abi'])
+            _TESTER_CONTRACTS[contract_name] = deployed
+    return deployed
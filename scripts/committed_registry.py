@@ -0,0 +1,120 @@
+"""
+Client path for the hash-committed key registry (contracts/KeyRegistryCommitted.sol)
+The contract stores keccak256(public key); the key itself is read from the
+PQCKeyRegistered event and accepted only if it matches the stored commitment
+"""
+import threading
+
+from web3 import Web3
+
+from event_indexer import iter_event_pages, DEFAULT_PAGE_SIZE
+from key_cache import PublicKeyCache
+from rpc_batch import call_many, DEFAULT_BATCH_SIZE
+from tx_submitter import TransactionSubmitter
+
+COMMITTED_CONTRACT = "KeyRegistryCommitted"
+EMPTY_COMMITMENT = bytes(32)
+
+def key_commitment(public_key):
+    """keccak256 commitment the contract stores for a public key"""
+    return bytes(Web3.keccak(public_key))
+
+def register_committed_key(w3, account, contract, public_key):
+    """
+    Register a PQC public key on KeyRegistryCommitted
+
+    Sent through the TransactionSubmitter like the full-key registration, so
+    both registries are measured on the same nonce/gas path.
+
+    Args:
+        w3: Web3 instance
+        account: Ethereum account address
+        contract: KeyRegistryCommitted contract object
+        public_key: PQC public key bytes
+
+    Returns:
+        Transaction receipt
+    """
+    submitter = TransactionSubmitter(w3, account, contract, gas_buffer=1.5)
+    try:
+        submitter.submit("registerPQCKey", public_key)
+        tx_receipt = submitter.collect()[0]
+    finally:
+        submitter.close()
+
+    stored = bytes(contract.functions.getPQCKeyCommitment(account).call())
+    if stored != key_commitment(public_key):
+        raise Exception("Stored commitment does not match the registered key")
+    return tx_receipt
+
+class CommittedKeyCache(PublicKeyCache):
+    """
+    PublicKeyCache for KeyRegistryCommitted
+
+    Commitments are read (batched) at the snapshot block; keys come from
+    PQCKeyRegistered events, which are scanned incrementally once and shared by
+    every lookup. A published key that does not hash to the commitment is never
+    returned: the address is treated as having no usable key and counted in
+    `mismatches`.
+    """
+
+    def __init__(self, contract, rpc_batch_size=DEFAULT_BATCH_SIZE, page_size=DEFAULT_PAGE_SIZE):
+        super().__init__(contract, rpc_batch_size)
+        self.page_size = page_size
+        self.mismatches = 0
+        self._published = {}
+        self._scanned_to = -1
+        self._scan_lock = threading.Lock()
+
+    def sync(self, w3, to_block, page_size=DEFAULT_PAGE_SIZE):
+        if self.synced_block is not None and to_block < self.synced_block:
+            with self._scan_lock:
+                self._published.clear()
+                self._scanned_to = -1
+        return super().sync(w3, to_block, page_size)
+
+    def _snapshot_block(self):
+        if self.synced_block is not None:
+            return self.synced_block
+        return self.contract.w3.eth.block_number
+
+    def _scan_registrations(self, to_block):
+        """Collect published keys per address up to to_block"""
+        with self._scan_lock:
+            if to_block <= self._scanned_to:
+                return
+            for _, _, events in iter_event_pages(self.contract.w3, self.contract, self._scanned_to + 1, to_block,
+                                                 self.page_size, event_name="PQCKeyRegistered"):
+                for event in events:
+                    self._published.setdefault(event['args']['user'], []).append(bytes(event['args']['publicKey']))
+            self._scanned_to = to_block
+
+    def _resolve(self, address, commitment, block):
+        """Newest published key of an address that matches its commitment"""
+        commitment = bytes(commitment)
+        if commitment == EMPTY_COMMITMENT:
+            return None
+        self._scan_registrations(block)
+        for public_key in reversed(self._published.get(address, [])):
+            if key_commitment(public_key) == commitment:
+                return public_key
+        self.mismatches += 1
+        print(f"[WARNING] No published key of {address} matches its on-chain commitment")
+        return None
+
+    def _fetch(self, address):
+        block = self._snapshot_block()
+        commitment = self.contract.functions.getPQCKeyCommitment(address).call(block_identifier=block)
+        return self._resolve(address, commitment, block)
+
+    def prefetch(self, addresses):
+        missing = list(dict.fromkeys(a for a in addresses if a not in self._keys))
+        if not missing:
+            return 0
+        block = self._snapshot_block()
+        commitments = call_many(self.contract, "getPQCKeyCommitment", ([a] for a in missing),
+                                block_identifier=block, batch_size=self.rpc_batch_size)
+        for address, commitment in zip(missing, commitments):
+            self._keys[address] = self._resolve(address, commitment, block)
+        self.misses += len(missing)
+        return len(missing)
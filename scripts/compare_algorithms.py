@@ -4,7 +4,6 @@ Generates comprehensive comparison matrices and analysis
 """
 import os
 import sys
-import json
 import csv
 from datetime import datetime
 
@@ -13,32 +12,20 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 os.chdir(PROJECT_ROOT)
 
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "scripts"))
+from sample_store import load_results_index
 
 RESULTS_DIR = os.path.join(PROJECT_ROOT, "data", "benchmarks")
 
+from algorithm_registry import ALGORITHMS
+from gas_model import load_gas_model, GAS_MODEL_FILE
+
 # NIST Security Levels
-NIST_LEVELS = {
-    "dilithium2": "Level 2",
-    "dilithium3": "Level 3",
-    "dilithium5": "Level 5",
-    "sphincs128f": "Level 1",
-    "sphincs_fast": "Level 3/5",
-    "falcon512": "Level 1",
-    "falcon1024": "Level 5",
-    "ecdsa": "Classical",
-}
+NIST_LEVELS = {name: info["nist_level"] for name, info in ALGORITHMS.items()}
+NIST_LEVELS["ecdsa"] = "Classical"
 
 # Algorithm categories
-ALGORITHM_CATEGORIES = {
-    "dilithium2": "Lattice-based (ML-DSA)",
-    "dilithium3": "Lattice-based (ML-DSA)",
-    "dilithium5": "Lattice-based (ML-DSA)",
-    "sphincs128f": "Hash-based (SLH-DSA)",
-    "sphincs_fast": "Hash-based (SLH-DSA)",
-    "falcon512": "Lattice-based (FALCON)",
-    "falcon1024": "Lattice-based (FALCON)",
-    "ecdsa": "Elliptic Curve (Classical)",
-}
+ALGORITHM_CATEGORIES = {name: info["family"] for name, info in ALGORITHMS.items()}
+ALGORITHM_CATEGORIES["ecdsa"] = "Elliptic Curve (Classical)"
 
 def load_latest_benchmark():
     """Load the most recent benchmark results"""
@@ -52,15 +39,15 @@ def load_latest_benchmark():
     latest_file = sorted(benchmark_files)[-1]
     filepath = os.path.join(RESULTS_DIR, latest_file)
     
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    return load_results_index(filepath)
 
-def generate_comparison_matrix(benchmark_data):
+def generate_comparison_matrix(benchmark_data, gas_model=None):
     """
     Generate comprehensive comparison matrix for research paper
     
     Args:
         benchmark_data: Loaded benchmark JSON data
+        gas_model: GasModel filling in gas columns that were not measured (optional)
     
     Returns:
         dict: Comparison matrix data
@@ -94,8 +81,27 @@ def generate_comparison_matrix(benchmark_data):
             'private_key_bytes': keygen.get('private_key_size', 0) if keygen else 0,
             'signature_bytes': signing.get('signature_size', 0) if signing else 0,
             'registration_gas': gas.get('registration_gas', 0) if gas else 0,
+            'committed_registration_gas': (gas.get('committed_registration_gas') or 0) if gas else 0,
             'transaction_gas': gas.get('transaction_gas', 0) if gas else 0,
+            'gas_source': 'measured' if gas else '',
         })
+        row = comparison[-1]
+        
+        # Predict gas the benchmark did not measure (--skip-gas, or a key that was already registered)
+        if gas_model is not None and algo in ALGORITHMS:
+            info = ALGORITHMS[algo]
+            public_key_size = row['public_key_bytes'] or info['public_key_size']
+            signature_size = row['signature_bytes'] or info['signature_size']
+            message_size = signing.get('message_size', 151) if signing else 151
+            predicted = False
+            if not row['registration_gas']:
+                row['registration_gas'] = gas_model.predict_registration(public_key_size)
+                predicted = True
+            if not row['transaction_gas']:
+                row['transaction_gas'] = gas_model.predict_log_signature(signature_size, message_size)
+                predicted = True
+            if predicted:
+                row['gas_source'] = 'measured+model' if gas else 'model'
     
     return comparison
 
@@ -146,7 +152,7 @@ def generate_csv_comparison(comparison_data, output_file):
         'sign_mean_ms', 'sign_std_ms',
         'verify_mean_ms', 'verify_std_ms',
         'public_key_bytes', 'private_key_bytes', 'signature_bytes',
-        'registration_gas', 'transaction_gas'
+        'registration_gas', 'committed_registration_gas', 'transaction_gas', 'gas_source'
     ]
     
     with open(output_file, 'w', newline='') as f:
@@ -226,8 +232,16 @@ def main():
     print(f"     Algorithms: {benchmark_data.get('total_algorithms', 0)}")
     print()
     
+    # Gas model fills gas columns for algorithms benchmarked without a chain
+    gas_model = load_gas_model()
+    if gas_model is not None:
+        print(f"[OK] Gas model loaded ({gas_model.backend} calibration); unmeasured gas is predicted")
+    else:
+        print(f"[INFO] No gas model at {GAS_MODEL_FILE}; run python scripts/gas_model.py to predict missing gas")
+    print()
+    
     # Generate comparison matrix
-    comparison_data = generate_comparison_matrix(benchmark_data)
+    comparison_data = generate_comparison_matrix(benchmark_data, gas_model)
     
     # Print comparison table
     print_comparison_table(comparison_data)
@@ -0,0 +1,166 @@
+"""
+Cached Solidity compilation
+Compiled ABI/bytecode are stored in contracts/build/ keyed by a hash of the
+source, compiler version and settings, so unchanged contracts load from disk
+without solc (or network access for installing it)
+"""
+import os
+import json
+import hashlib
+
+try:
+    import solcx
+    SOLCX_AVAILABLE = True
+except ImportError:
+    SOLCX_AVAILABLE = False
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONTRACTS_DIR = os.path.join(PROJECT_ROOT, "contracts")
+BUILD_DIR = os.path.join(CONTRACTS_DIR, "build")
+
+SOLIDITY_VERSION = "0.8.0"
+DEFAULT_OUTPUT_VALUES = ['abi', 'bin']
+
+# Set to 1 to never download a compiler (cached artifacts or an installed solc only)
+OFFLINE_ENV = "PQC_SOLC_OFFLINE"
+
+def is_offline():
+    """True when PQC_SOLC_OFFLINE is set to a non-empty value other than 0"""
+    return os.environ.get(OFFLINE_ENV, "") not in ("", "0")
+
+def contract_source_path(contract_name):
+    return os.path.join(CONTRACTS_DIR, f"{contract_name}.sol")
+
+def artifact_path(contract_name):
+    return os.path.join(BUILD_DIR, f"{contract_name}.json")
+
+def build_key(source, solc_version, settings):
+    """
+    Cache key of a compilation
+
+    Args:
+        source: Solidity source code
+        solc_version: Compiler version string
+        settings: JSON-serializable compiler settings
+
+    Returns:
+        str: sha256 hex digest
+    """
+    payload = json.dumps({
+        'source': hashlib.sha256(source.encode('utf-8')).hexdigest(),
+        'solc_version': str(solc_version),
+        'settings': settings,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _load_artifact(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+def _save_artifact(path, artifact):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(artifact, f, indent=2)
+    os.replace(tmp_path, path)
+
+def _ensure_solc(solc_version, offline):
+    """Make solc_version available, downloading it only when online"""
+    installed = {str(v) for v in solcx.get_installed_solc_versions()}
+    if solc_version in installed:
+        return
+    if offline:
+        raise RuntimeError(f"solc {solc_version} is not installed and offline mode is on "
+                           f"(unset {OFFLINE_ENV} or install it with solcx.install_solc)")
+    print(f"Installing Solidity compiler version {solc_version}...")
+    solcx.install_solc(solc_version)
+
+def compile_contract(contract_name="KeyRegistry", solc_version=SOLIDITY_VERSION,
+                     output_values=None, offline=None, force=False):
+    """
+    Get a contract's ABI and bytecode, compiling only when the source, compiler or settings changed
+
+    Args:
+        contract_name: Contract name; the source is contracts/<contract_name>.sol
+        solc_version: Solidity compiler version
+        output_values: solc outputs to keep (default: abi and bin)
+        offline: Never download a compiler (default: PQC_SOLC_OFFLINE environment variable)
+        force: Recompile even if a matching artifact exists
+
+    Returns:
+        dict: Contract interface with at least 'abi' and 'bin'
+    """
+    output_values = list(output_values or DEFAULT_OUTPUT_VALUES)
+    offline = is_offline() if offline is None else offline
+
+    source_path = contract_source_path(contract_name)
+    if not os.path.exists(source_path):
+        raise FileNotFoundError(f"Contract file not found: {source_path}")
+    with open(source_path, "r") as f:
+        source = f.read()
+
+    settings = {'contract': contract_name, 'output_values': output_values}
+    key = build_key(source, solc_version, settings)
+    path = artifact_path(contract_name)
+
+    artifact = _load_artifact(path)
+    if not force and artifact is not None and artifact.get('build_key') == key:
+        print(f"  Using cached build {os.path.relpath(path, PROJECT_ROOT)}")
+        return artifact['interface']
+
+    if not SOLCX_AVAILABLE:
+        raise RuntimeError(f"No up-to-date artifact at {path} and py-solc-x is not installed")
+    _ensure_solc(solc_version, offline)
+
+    print(f"Compiling {contract_name}.sol with solc {solc_version}...")
+    compiled = solcx.compile_source(source, output_values=output_values, solc_version=solc_version)
+    contract_key = f"<stdin>:{contract_name}"
+    if contract_key not in compiled:
+        raise KeyError(f"Contract '{contract_name}' not found in compiled output. Available: {list(compiled.keys())}")
+    interface = {value: compiled[contract_key][value] for value in output_values}
+
+    _save_artifact(path, {
+        'contract': contract_name,
+        'build_key': key,
+        'solc_version': solc_version,
+        'settings': settings,
+        'interface': interface,
+    })
+    return interface
+
+def main():
+    """Compile contracts into the build cache (e.g. to warm it before an offline CI run)"""
+    import sys
+    import argparse
+
+    available = sorted(os.path.splitext(name)[0] for name in os.listdir(CONTRACTS_DIR) if name.endswith(".sol"))
+    parser = argparse.ArgumentParser(description="Compile contracts into the contracts/build/ cache")
+    parser.add_argument(
+        "--contracts",
+        nargs="+",
+        choices=available,
+        default=available,
+        help=f"Contracts to build (default: all). Available: {', '.join(available)}"
+    )
+    parser.add_argument(
+        "--recompile",
+        action="store_true",
+        help="Ignore cached builds and compile again"
+    )
+    args = parser.parse_args()
+
+    try:
+        for contract_name in args.contracts:
+            compile_contract(contract_name, force=args.recompile)
+            print(f"[OK] {contract_name}: {os.path.relpath(artifact_path(contract_name), PROJECT_ROOT)}")
+    except Exception as e:
+        print(f"[ERROR] Build failed: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -6,41 +6,50 @@ import os
 import json
 
 CONTRACT_INFO_FILE = os.path.join(os.path.dirname(__file__), "..", "contracts", "contract_info.json")
+DEFAULT_CONTRACT = "KeyRegistry"
 
-def save_contract_info(contract_address, abi):
+def get_contract_info_path(contract_name=DEFAULT_CONTRACT):
+    """Get the path to the contract info file (other contracts than KeyRegistry get their own file)"""
+    if contract_name == DEFAULT_CONTRACT:
+        return CONTRACT_INFO_FILE
+    return os.path.join(os.path.dirname(CONTRACT_INFO_FILE), f"contract_info_{contract_name}.json")
+
+def save_contract_info(contract_address, abi, contract_name=DEFAULT_CONTRACT):
     """
     Save contract address and ABI to a JSON file
     
     Args:
         contract_address: The deployed contract address
         abi: The contract ABI (list)
+        contract_name: Deployed contract
     """
     contract_info = {
         "address": contract_address,
         "abi": abi
     }
     
-    with open(CONTRACT_INFO_FILE, "w") as f:
+    info_file = get_contract_info_path(contract_name)
+    with open(info_file, "w") as f:
         json.dump(contract_info, f, indent=2)
     
-    print(f"Contract info saved to {CONTRACT_INFO_FILE}")
+    print(f"Contract info saved to {info_file}")
 
-def load_contract_info():
+def load_contract_info(contract_name=DEFAULT_CONTRACT):
     """
     Load contract address and ABI from JSON file
     
+    Args:
+        contract_name: Deployed contract
+    
     Returns:
         tuple: (contract_address, abi) or (None, None) if file doesn't exist
     """
-    if not os.path.exists(CONTRACT_INFO_FILE):
+    info_file = get_contract_info_path(contract_name)
+    if not os.path.exists(info_file):
         return None, None
     
-    with open(CONTRACT_INFO_FILE, "r") as f:
+    with open(info_file, "r") as f:
         contract_info = json.load(f)
     
     return contract_info["address"], contract_info["abi"]
 
-def get_contract_info_path():
-    """Get the path to the contract info file"""
-    return CONTRACT_INFO_FILE
-
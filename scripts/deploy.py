@@ -7,44 +7,20 @@ import sys
 # Add scripts directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from web3 import Web3
-from solcx import compile_source, install_solc, set_solc_version
-from contract_utils import save_contract_info
+from web3_client import get_web3
+from contract_build import compile_contract as build_contract, SOLIDITY_VERSION
+from contract_utils import save_contract_info, DEFAULT_CONTRACT
 
 # Configuration
 GANACHE_URL = "http://127.0.0.1:8545"
-SOLIDITY_VERSION = "0.8.0"
+REGISTRY_CONTRACTS = ["KeyRegistry", "KeyRegistryCommitted"]
 
-def load_contract_source():
-    """Load the Solidity contract source code"""
-    contract_path = os.path.join(os.path.dirname(__file__), "..", "contracts", "KeyRegistry.sol")
-    if not os.path.exists(contract_path):
-        raise FileNotFoundError(f"Contract file not found: {contract_path}")
-    
-    with open(contract_path, "r") as f:
-        return f.read()
-
-def compile_contract():
-    """Compile the KeyRegistry contract"""
-    print("Compiling contract...")
+def compile_contract(offline=None, force=False, contract_name=DEFAULT_CONTRACT):
+    """Compile a registry contract (or load the cached build when nothing changed)"""
+    print(f"Compiling {contract_name}...")
     
     try:
-        # Install and set Solidity compiler version
-        print(f"Installing Solidity compiler version {SOLIDITY_VERSION}...")
-        install_solc(SOLIDITY_VERSION)
-        set_solc_version(SOLIDITY_VERSION)
-        
-        # Load and compile contract source
-        source_code = load_contract_source()
-        print("Compiling Solidity source...")
-        compiled = compile_source(source_code, output_values=['abi', 'bin'])
-        
-        # Extract contract interface
-        contract_key = f"<stdin>:KeyRegistry"
-        if contract_key not in compiled:
-            raise KeyError(f"Contract 'KeyRegistry' not found in compiled output. Available: {list(compiled.keys())}")
-        
-        contract_interface = compiled[contract_key]
+        contract_interface = build_contract(contract_name, SOLIDITY_VERSION, offline=offline, force=force)
         print("[OK] Contract compiled successfully")
         
         return contract_interface
@@ -53,13 +29,13 @@ def compile_contract():
         print(f"Error compiling contract: {e}")
         raise
 
-def deploy_contract(w3, account):
+def deploy_contract(w3, account, offline=None, force_compile=False, contract_name=DEFAULT_CONTRACT):
     """Deploy the contract to Ganache"""
-    print("Deploying contract to Ganache...")
+    print(f"Deploying {contract_name} to Ganache...")
     
     try:
         # Compile contract
-        contract_interface = compile_contract()
+        contract_interface = compile_contract(offline=offline, force=force_compile, contract_name=contract_name)
         
         # Create contract instance
         contract = w3.eth.contract(
@@ -103,14 +79,37 @@ def deploy_contract(w3, account):
 
 def main():
     """Main deployment function"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Deploy a PQC key registry contract")
+    parser.add_argument(
+        "--contract",
+        choices=REGISTRY_CONTRACTS,
+        default=DEFAULT_CONTRACT,
+        help="Registry to deploy: KeyRegistry stores full keys, KeyRegistryCommitted stores "
+             "keccak256 commitments and publishes keys in events (default: KeyRegistry)"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never download solc: use the cached build in contracts/build/ or an installed compiler"
+    )
+    parser.add_argument(
+        "--recompile",
+        action="store_true",
+        help="Ignore the cached build and compile again"
+    )
+    
+    args = parser.parse_args()
+    
     print("=" * 50)
-    print("KeyRegistry Contract Deployment")
+    print(f"{args.contract} Contract Deployment")
     print("=" * 50)
     
     try:
         # Connect to Ganache
         print(f"\nConnecting to Ganache at {GANACHE_URL}...")
-        w3 = Web3(Web3.HTTPProvider(GANACHE_URL))
+        w3 = get_web3(GANACHE_URL)
         
         if not w3.is_connected():
             print(f"Error: Could not connect to Ganache. Make sure it's running on {GANACHE_URL}")
@@ -132,11 +131,12 @@ def main():
         
         # Deploy contract
         print("\n" + "-" * 50)
-        contract_address, abi = deploy_contract(w3, account)
+        contract_address, abi = deploy_contract(w3, account, offline=args.offline or None,
+                                               force_compile=args.recompile, contract_name=args.contract)
         
         # Save contract address and ABI to file for other scripts
         print("\n" + "-" * 50)
-        save_contract_info(contract_address, abi)
+        save_contract_info(contract_address, abi, args.contract)
         
         print("\n" + "=" * 50)
         print("Deployment completed successfully!")
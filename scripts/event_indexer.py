@@ -0,0 +1,137 @@
+"""
+Incremental, checkpointed indexer for KeyRegistry event logs
+Pages through block ranges with bounded memory and remembers the last processed block
+"""
+import os
+import json
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHECKPOINT_FILE = os.path.join(PROJECT_ROOT, "data", "indexer_checkpoint.json")
+
+# Number of blocks requested per get_logs call
+DEFAULT_PAGE_SIZE = 2000
+
+# Checkpoint entry holding events that were passed over but must be retried
+PENDING_KEY = "pending"
+
+def _load_checkpoints():
+    if not os.path.exists(CHECKPOINT_FILE):
+        return {}
+    with open(CHECKPOINT_FILE, "r") as f:
+        return json.load(f)
+
+def load_checkpoint(contract_address, event_name="PQCSignature"):
+    """
+    Get the last processed block for a contract event
+
+    Args:
+        contract_address: Contract address
+        event_name: Event name
+
+    Returns:
+        int: Last processed block number, or None if never indexed
+    """
+    return _load_checkpoints().get(contract_address, {}).get(event_name)
+
+def load_pending(contract_address, event_name="PQCSignature"):
+    """
+    Get the events left behind the checkpoint for a later retry
+
+    Returns:
+        dict: Address -> sorted block numbers holding that address's pending events
+    """
+    return _load_checkpoints().get(contract_address, {}).get(PENDING_KEY, {}).get(event_name, {})
+
+def save_checkpoint(contract_address, block_number, event_name="PQCSignature", pending=None):
+    """
+    Persist the last processed block for a contract event
+
+    Args:
+        contract_address: Contract address
+        block_number: Last block whose events have been fully processed
+        event_name: Event name
+        pending: Optional address -> block numbers of events at or before
+                 block_number that still need processing (replaces the saved set)
+    """
+    os.makedirs(os.path.dirname(CHECKPOINT_FILE), exist_ok=True)
+    checkpoints = _load_checkpoints()
+    entry = checkpoints.setdefault(contract_address, {})
+    entry[event_name] = block_number
+    if pending is not None:
+        entry.setdefault(PENDING_KEY, {})[event_name] = {
+            address: sorted(set(blocks)) for address, blocks in pending.items() if blocks
+        }
+
+    # Write to a temporary file first so an interrupted run never corrupts the checkpoint
+    tmp_file = CHECKPOINT_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(checkpoints, f, indent=2)
+    os.replace(tmp_file, CHECKPOINT_FILE)
+
+def resolve_start_block(w3, contract_address, from_block=None, full_rescan=False, event_name="PQCSignature"):
+    """
+    Decide where indexing should start
+
+    An explicit from_block wins; otherwise resume after the checkpoint, unless a
+    full rescan is requested or the checkpoint is ahead of the chain (e.g. the
+    local chain was reset).
+
+    Returns:
+        int: First block to fetch
+    """
+    if from_block is not None:
+        return from_block
+    if full_rescan:
+        return 0
+
+    checkpoint = load_checkpoint(contract_address, event_name)
+    if checkpoint is None:
+        return 0
+    if checkpoint > w3.eth.block_number:
+        print(f"[WARNING] Checkpoint block {checkpoint} is ahead of the chain, rescanning from block 0")
+        return 0
+    return checkpoint + 1
+
+def iter_event_pages(w3, contract, from_block=0, to_block=None, page_size=DEFAULT_PAGE_SIZE,
+                     event_name="PQCSignature"):
+    """
+    Fetch contract events one block range at a time
+
+    Args:
+        w3: Web3 instance
+        contract: Contract object
+        from_block: First block to fetch
+        to_block: Last block to fetch (default: chain head when called)
+        page_size: Number of blocks per get_logs call
+        event_name: Event name
+
+    Yields:
+        tuple: (page_start_block, page_end_block, list of events)
+    """
+    if to_block is None:
+        to_block = w3.eth.block_number
+
+    event = getattr(contract.events, event_name)
+    start = from_block
+    while start <= to_block:
+        end = min(start + page_size - 1, to_block)
+        yield start, end, event.get_logs(from_block=start, to_block=end)
+        start = end + 1
+
+def fetch_block_events(contract, blocks, event_name="PQCSignature"):
+    """
+    Fetch the events of a set of individual blocks
+
+    Args:
+        contract: Contract object
+        blocks: Block numbers
+        event_name: Event name
+
+    Returns:
+        list: Events in block order
+    """
+    event = getattr(contract.events, event_name)
+    events = []
+    for block in sorted(set(blocks)):
+        events.extend(event.get_logs(from_block=block, to_block=block))
+    return events
@@ -0,0 +1,375 @@
+"""
+Analytical gas model for KeyRegistry.registerPQCKey, logSignature and logSignatures
+Calibrated once against a chain backend, then predicts gas for any key,
+signature and message size without sending transactions
+"""
+import os
+import sys
+import json
+import math
+from datetime import datetime
+
+import numpy as np
+from eth_abi import encode
+from eth_utils import function_signature_to_4byte_selector
+from web3 import EthereumTesterProvider
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from algorithm_registry import ALGORITHMS
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAS_MODEL_FILE = os.path.join(PROJECT_ROOT, "data", "gas_model.json")
+
+# Bump when the feature set changes; older calibrations are ignored
+GAS_MODEL_VERSION = 2
+
+# Intrinsic transaction cost (protocol constants, EIP-2028 / EIP-7623)
+GAS_TX_BASE = 21000
+GAS_CALLDATA_ZERO = 4
+GAS_CALLDATA_NONZERO = 16
+GAS_CALLDATA_FLOOR_PER_TOKEN = 10
+
+FUNCTION_SIGNATURES = {
+    'registerPQCKey': "registerPQCKey(bytes)",
+    'logSignature': "logSignature(bytes,bytes)",
+    'logSignatures': "logSignatures(bytes[],bytes[])",
+}
+
+# Calibration grid: registration needs one unregistered account per size (fresh storage)
+CALIBRATION_KEY_SIZES = [33, 97, 480, 897, 1312, 1793, 2592, 4100]
+# Tiny payloads keep some logSignature samples above the EIP-7623 floor on Prague chains
+CALIBRATION_SIGNATURE_SIZES = [1, 32, 64, 666, 1280, 2420, 4627, 17088]
+CALIBRATION_MESSAGE_SIZES = [1, 32, 151, 1000, 4096]
+# logSignatures grid: entries per call x signature size x message size
+CALIBRATION_BATCH_SIZES = [1, 2, 4, 8, 32]
+CALIBRATION_BATCH_SIGNATURE_SIZES = [1, 33, 666, 2420]
+CALIBRATION_BATCH_MESSAGE_SIZES = [1, 151]
+
+def calldata(fn_name, *payload_sizes, payloads=None):
+    """
+    ABI-encoded call data of a KeyRegistry function
+
+    For logSignatures the payloads are (signature, message) pairs flattened in
+    order: signature 0, message 0, signature 1, message 1, ...
+
+    Args:
+        fn_name: "registerPQCKey", "logSignature" or "logSignatures"
+        *payload_sizes: Length of each bytes argument
+        payloads: Actual bytes arguments (default: non-zero filler of the given sizes,
+                  which matches random keys/signatures to within ~0.05 gas per byte)
+
+    Returns:
+        bytes: Selector followed by the encoded arguments
+    """
+    if payloads is None:
+        payloads = [b"\xff" * size for size in payload_sizes]
+    selector = function_signature_to_4byte_selector(FUNCTION_SIGNATURES[fn_name])
+    if fn_name == 'logSignatures':
+        return selector + encode(['bytes[]', 'bytes[]'], [list(payloads[0::2]), list(payloads[1::2])])
+    return selector + encode(['bytes'] * len(payloads), list(payloads))
+
+def intrinsic_gas(data, floor=False):
+    """
+    Intrinsic gas of a transaction carrying `data`
+
+    Args:
+        data: Call data bytes
+        floor: Apply the EIP-7623 calldata floor (Prague and later)
+
+    Returns:
+        tuple: (standard intrinsic gas, floor gas or 0)
+    """
+    zeros = data.count(0)
+    nonzeros = len(data) - zeros
+    standard = GAS_TX_BASE + GAS_CALLDATA_ZERO * zeros + GAS_CALLDATA_NONZERO * nonzeros
+    floor_gas = GAS_TX_BASE + GAS_CALLDATA_FLOOR_PER_TOKEN * (zeros + 4 * nonzeros) if floor else 0
+    return standard, floor_gas
+
+def _words(size):
+    return math.ceil(size / 32)
+
+def _features(fn_name, *payload_sizes):
+    """
+    Execution-gas features: constant, payload words and payload words squared
+
+    Every execution cost of these functions is per 32-byte word (storage slots,
+    memory copies, LOG data of the ABI-encoded event); the squared term is
+    memory expansion. logSignatures adds the number of entries (one LOG, loop
+    iteration and element decoding each) after the constant.
+    """
+    words = sum(_words(size) for size in payload_sizes)
+    if fn_name == 'logSignatures':
+        return [1.0, float(len(payload_sizes) // 2), float(words), float(words * words)]
+    return [1.0, float(words), float(words * words)]
+
+class GasModel:
+    """
+    Linear execution-gas model per function plus exact intrinsic gas
+
+    gas = max(intrinsic(calldata) + c0 + c1 * words + c2 * words^2, calldata floor)
+
+    For registerPQCKey the per-word coefficient is dominated by SSTORE of a
+    fresh slot; for logSignature(s) by LOG data (8 gas/byte) and memory copies.
+    Registration predictions assume the account has no key stored yet (a
+    re-registration overwrites slots at a lower cost). On chains with the
+    calldata floor only small logSignature payloads are metered, so predictions
+    close to the floor crossover are approximate.
+    """
+
+    def __init__(self, coefficients, calldata_floor=False, backend=None, residuals=None, calibrated=None):
+        self.coefficients = coefficients
+        self.calldata_floor = calldata_floor
+        self.backend = backend
+        self.residuals = residuals or {}
+        self.calibrated = calibrated
+
+    @classmethod
+    def intrinsic_only(cls):
+        """
+        Uncalibrated stand-in: exact intrinsic gas (with the calldata floor) and no
+        execution cost, i.e. a lower bound of every call's gas
+        """
+        return cls({fn_name: [0.0] * len(_features(fn_name, 0, 0)) for fn_name in FUNCTION_SIGNATURES},
+                   calldata_floor=True)
+
+    def predict(self, fn_name, *payload_sizes, payloads=None):
+        """
+        Predicted gasUsed of one call
+
+        Args:
+            fn_name: "registerPQCKey", "logSignature" or "logSignatures"
+            *payload_sizes: Length of each bytes argument
+            payloads: Actual bytes arguments for an exact calldata cost (optional)
+
+        Returns:
+            int: Predicted gas
+        """
+        if payloads is not None:
+            payload_sizes = [len(p) for p in payloads]
+        standard, floor_gas = intrinsic_gas(calldata(fn_name, *payload_sizes, payloads=payloads),
+                                            self.calldata_floor)
+        execution = float(np.dot(self.coefficients[fn_name], _features(fn_name, *payload_sizes)))
+        return max(int(round(standard + execution)), floor_gas)
+
+    def predict_registration(self, public_key_size):
+        return self.predict('registerPQCKey', public_key_size)
+
+    def predict_log_signature(self, signature_size, message_size):
+        return self.predict('logSignature', signature_size, message_size)
+
+    def predict_log_signatures(self, entries):
+        """Predicted gasUsed of one logSignatures call for (message, signature) pairs"""
+        return self.predict('logSignatures', payloads=[p for message, signature in entries
+                                                       for p in (signature, message)])
+
+    def sstore_per_word(self):
+        """Approximate storage cost per 32-byte key word (registration minus event/copy cost)"""
+        return self.coefficients['registerPQCKey'][1] - self.coefficients['logSignature'][1]
+
+    def to_dict(self):
+        return {
+            'version': GAS_MODEL_VERSION,
+            'backend': self.backend,
+            'calibrated': self.calibrated,
+            'calldata_floor': self.calldata_floor,
+            'coefficients': {name: list(map(float, c)) for name, c in self.coefficients.items()},
+            'residuals': self.residuals,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['coefficients'], data.get('calldata_floor', False), data.get('backend'),
+                   data.get('residuals'), data.get('calibrated'))
+
+def save_gas_model(model, path=GAS_MODEL_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(model.to_dict(), f, indent=2)
+    os.replace(tmp_path, path)
+
+def load_gas_model(path=GAS_MODEL_FILE):
+    """
+    Load a saved calibration
+
+    Returns:
+        GasModel or None if no (current) calibration exists
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        data = json.load(f)
+    if data.get('version') != GAS_MODEL_VERSION:
+        return None
+    return GasModel.from_dict(data)
+
+def _fit(samples):
+    """Least-squares fit of execution gas; returns (coefficients, max abs residual)"""
+    X = np.array([features for features, _ in samples])
+    y = np.array([execution for _, execution in samples], dtype=float)
+    coefficients, *_ = np.linalg.lstsq(X, y, rcond=None)
+    residual = float(np.max(np.abs(X @ coefficients - y))) if len(y) else 0.0
+    return coefficients, residual
+
+def calibrate(w3, contract, key_sizes=None, signature_sizes=None, message_sizes=None, batch_sizes=None, seed=0):
+    """
+    Fit the model from real transactions on the in-process chain
+
+    Registration samples permanently occupy one account per key size with a
+    junk key, so calibration refuses to run anywhere but the throwaway
+    eth-tester chain (never the Ganache used by deploy.py/register_key.py).
+
+    Args:
+        w3: Web3 instance from chain_backend.connect("eth-tester")
+        contract: KeyRegistry contract object
+        key_sizes: Public key sizes to register
+        signature_sizes, message_sizes: logSignature grid
+        batch_sizes: Entries per logSignatures call (signature/message sizes from
+                     CALIBRATION_BATCH_SIGNATURE_SIZES/CALIBRATION_BATCH_MESSAGE_SIZES)
+        seed: Seed for the random payload bytes
+
+    Returns:
+        GasModel
+
+    Raises:
+        ValueError: If w3 is not connected to the in-process eth-tester chain
+    """
+    if not isinstance(w3.provider, EthereumTesterProvider):
+        raise ValueError("Gas model calibration registers junk keys; it only runs on the eth-tester backend")
+    rng = np.random.default_rng(seed)
+    key_sizes = key_sizes or CALIBRATION_KEY_SIZES
+    signature_sizes = signature_sizes or CALIBRATION_SIGNATURE_SIZES
+    message_sizes = message_sizes or CALIBRATION_MESSAGE_SIZES
+    batch_sizes = batch_sizes or CALIBRATION_BATCH_SIZES
+
+    def payload(size):
+        return rng.integers(0, 256, size, dtype=np.uint8).tobytes()
+
+    def send(fn_name, account, *args):
+        tx_hash = getattr(contract.functions, fn_name)(*args).transact({'from': account})
+        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        if receipt.status != 1:
+            raise Exception(f"{fn_name} calibration transaction failed")
+        return receipt['gasUsed']
+
+    measured = {'registerPQCKey': [], 'logSignature': [], 'logSignatures': []}
+    free_accounts = [a for a in w3.eth.accounts if len(contract.functions.getPQCKey(a).call()) == 0]
+    if len(free_accounts) < 4:
+        raise Exception(f"Need at least 4 accounts without a registered key, found {len(free_accounts)}")
+    if len(free_accounts) < len(key_sizes):
+        print(f"  [WARNING] Only {len(free_accounts)} unregistered account(s); "
+              f"calibrating registration on {len(free_accounts)} key sizes")
+    for account, size in zip(free_accounts, key_sizes):
+        args = (payload(size),)
+        measured['registerPQCKey'].append((args, send('registerPQCKey', account, *args)))
+
+    for signature_size in signature_sizes:
+        for message_size in message_sizes:
+            args = (payload(signature_size), payload(message_size))
+            measured['logSignature'].append((args, send('logSignature', w3.eth.accounts[0], *args)))
+
+    for batch_size in batch_sizes:
+        for signature_size in CALIBRATION_BATCH_SIGNATURE_SIZES:
+            for message_size in CALIBRATION_BATCH_MESSAGE_SIZES:
+                args = tuple(payload(size) for _ in range(batch_size) for size in (signature_size, message_size))
+                gas = send('logSignatures', w3.eth.accounts[0], list(args[0::2]), list(args[1::2]))
+                measured['logSignatures'].append((args, gas))
+
+    # A post-Prague chain charges the calldata floor when it exceeds the metered cost;
+    # samples that hit it exactly carry no execution information
+    calldata_floor = any(
+        gas == intrinsic_gas(calldata(fn_name, payloads=args), floor=True)[1]
+        for fn_name, samples in measured.items() for args, gas in samples
+    )
+
+    coefficients = {}
+    residuals = {}
+    for fn_name, samples in measured.items():
+        rows = []
+        for args, gas in samples:
+            standard, floor_gas = intrinsic_gas(calldata(fn_name, payloads=args), calldata_floor)
+            if calldata_floor and gas == floor_gas:
+                continue
+            rows.append((_features(fn_name, *(len(a) for a in args)), gas - standard))
+        if not rows:
+            raise Exception(f"Every {fn_name} sample paid the calldata floor; add smaller calibration sizes")
+        coefficients[fn_name], residuals[fn_name] = _fit(rows)
+
+    return GasModel(coefficients, calldata_floor, residuals=residuals, calibrated=datetime.now().isoformat())
+
+def algorithm_gas_table(model, message_size=151):
+    """
+    Predicted registration and logSignature gas for every registered algorithm
+
+    Variable-size (FALCON) signatures are predicted at their typical size
+    (signature_size), the same size compare_algorithms.py falls back to.
+
+    Returns:
+        list: dicts with algorithm, sizes, registration_gas and transaction_gas
+    """
+    table = []
+    for name, info in ALGORITHMS.items():
+        signature_size = info["signature_size"]
+        table.append({
+            'algorithm': name,
+            'public_key_size': info["public_key_size"],
+            'signature_size': signature_size,
+            'registration_gas': model.predict_registration(info["public_key_size"]),
+            'transaction_gas': model.predict_log_signature(signature_size, message_size),
+        })
+    return table
+
+def main():
+    """Calibrate the gas model and print per-algorithm predictions"""
+    import argparse
+    from chain_backend import connect, load_registry, ETH_TESTER_AVAILABLE
+    from web3_client import get_contract
+
+    parser = argparse.ArgumentParser(description="Calibrate (on the in-process eth-tester chain) and query "
+                                                 "the KeyRegistry gas model")
+    parser.add_argument(
+        "--no-calibrate",
+        action="store_true",
+        help=f"Use the saved calibration ({GAS_MODEL_FILE}) instead of sending transactions"
+    )
+    parser.add_argument(
+        "--message-size",
+        type=int,
+        default=151,
+        help="Message size for logSignature predictions (default: 151, the benchmark message)"
+    )
+
+    args = parser.parse_args()
+
+    if args.no_calibrate:
+        model = load_gas_model()
+        if model is None:
+            print(f"[ERROR] No gas model calibration found at {GAS_MODEL_FILE}")
+            sys.exit(1)
+    else:
+        if not ETH_TESTER_AVAILABLE:
+            print("[ERROR] Calibration runs on the in-process chain only (it registers junk keys)")
+            print("        Install eth-tester: pip install \"eth-tester[py-evm]\", or use --no-calibrate")
+            sys.exit(1)
+        w3 = connect("eth-tester")
+        contract_address, abi = load_registry(w3, "eth-tester")
+        print("Calibrating gas model on eth-tester...")
+        model = calibrate(w3, get_contract(w3, contract_address, abi))
+        model.backend = "eth-tester"
+        save_gas_model(model)
+        print(f"[OK] Gas model saved to {GAS_MODEL_FILE}")
+
+    print(f"\nBackend: {model.backend}, calibrated {model.calibrated}, "
+          f"calldata floor: {'yes' if model.calldata_floor else 'no'}")
+    for fn_name, residual in model.residuals.items():
+        print(f"  {fn_name:<15} max residual {residual:.1f} gas")
+    print(f"  Storage cost per 32-byte key word: ~{model.sstore_per_word():,.0f} gas")
+
+    print(f"\n{'Algorithm':<15} {'PubKey':>8} {'Sig':>8} {'Register':>12} {'logSignature':>14}")
+    for row in algorithm_gas_table(model, args.message_size):
+        print(f"{row['algorithm']:<15} {row['public_key_size']:>8} {row['signature_size']:>8} "
+              f"{row['registration_gas']:>12,} {row['transaction_gas']:>14,}")
+
+if __name__ == "__main__":
+    main()
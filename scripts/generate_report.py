@@ -4,7 +4,6 @@ Creates comprehensive report with tables, statistics, and analysis
 """
 import os
 import sys
-import json
 from datetime import datetime
 
 # Get project root and change to it
@@ -12,6 +11,7 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 os.chdir(PROJECT_ROOT)
 
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "scripts"))
+from sample_store import load_results_index
 
 RESULTS_DIR = os.path.join(PROJECT_ROOT, "data", "benchmarks")
 
@@ -27,8 +27,7 @@ def load_latest_benchmark():
     latest_file = sorted(benchmark_files)[-1]
     filepath = os.path.join(RESULTS_DIR, latest_file)
     
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    return load_results_index(filepath)
 
 def generate_html_report(benchmark_data):
     """Generate HTML report for research paper"""
@@ -0,0 +1,165 @@
+"""
+Public key cache for off-chain signature verification
+Avoids one getPQCKey eth_call per event; invalidated by PQCKeyRegistered events
+"""
+import os
+import json
+
+from event_indexer import iter_event_pages, DEFAULT_PAGE_SIZE
+from rpc_batch import call_many, DEFAULT_BATCH_SIZE
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KEY_CACHE_FILE = os.path.join(PROJECT_ROOT, "data", "key_cache.json")
+
+class PublicKeyCache:
+    """
+    Cache of registered PQC public keys keyed by address
+
+    The registry stores one key per address, whatever algorithm it is used
+    with, so one entry serves every lookup of that address.
+
+    Keys are read at a pinned block (`synced_block`), so the cache is always a
+    consistent snapshot of the registry. `sync` moves the snapshot forward and
+    drops entries for every address that registered a new key in between.
+    Unregistered addresses are cached as None and invalidated the same way.
+    """
+
+    def __init__(self, contract, rpc_batch_size=DEFAULT_BATCH_SIZE):
+        self.contract = contract
+        self.rpc_batch_size = rpc_batch_size
+        self.synced_block = None
+        self.hits = 0
+        self.misses = 0
+        self._keys = {}
+
+    def sync(self, w3, to_block, page_size=DEFAULT_PAGE_SIZE):
+        """
+        Advance the snapshot to to_block, invalidating re-registered addresses
+
+        Args:
+            w3: Web3 instance
+            to_block: Block the cache should reflect
+            page_size: Number of blocks per get_logs request
+
+        Returns:
+            int: Number of cached entries invalidated
+        """
+        invalidated = 0
+        if self.synced_block is not None and to_block < self.synced_block:
+            # Chain was reset below the snapshot; nothing cached can be trusted
+            invalidated = len(self._keys)
+            self._keys.clear()
+        elif self.synced_block is not None and self._keys and to_block > self.synced_block:
+            for _, _, events in iter_event_pages(w3, self.contract, self.synced_block + 1, to_block,
+                                                 page_size, event_name="PQCKeyRegistered"):
+                for event in events:
+                    invalidated += self.invalidate(event['args']['user'])
+        self.synced_block = to_block
+        return invalidated
+
+    def invalidate(self, address):
+        """
+        Drop the cached entry for an address
+
+        Returns:
+            int: Number of entries removed (0 or 1)
+        """
+        if address not in self._keys:
+            return 0
+        del self._keys[address]
+        return 1
+
+    def get(self, address):
+        """
+        Get the registered public key for an address
+
+        Args:
+            address: User's Ethereum address
+
+        Returns:
+            Public key bytes or None if not registered
+        """
+        try:
+            public_key = self._keys[address]
+            self.hits += 1
+            return public_key
+        except KeyError:
+            pass
+
+        self.misses += 1
+        public_key = self._fetch(address)
+        self._keys[address] = public_key
+        return public_key
+
+    def _fetch(self, address):
+        """Read a key from the registry at the snapshot block"""
+        block_identifier = self.synced_block if self.synced_block is not None else 'latest'
+        public_key = self.contract.functions.getPQCKey(address).call(block_identifier=block_identifier)
+        return public_key if len(public_key) > 0 else None
+
+    def prefetch(self, addresses):
+        """
+        Fetch every uncached key of a set of addresses with batched eth_calls
+
+        May run on another thread than get(): entries are only ever added, so
+        the worst case of an overlap is one redundant fetch.
+
+        Args:
+            addresses: Addresses about to be looked up
+
+        Returns:
+            int: Number of keys fetched
+        """
+        missing = list(dict.fromkeys(a for a in addresses if a not in self._keys))
+        if not missing:
+            return 0
+        block_identifier = self.synced_block if self.synced_block is not None else 'latest'
+        public_keys = call_many(self.contract, "getPQCKey", ([a] for a in missing),
+                                block_identifier=block_identifier, batch_size=self.rpc_batch_size)
+        for address, public_key in zip(missing, public_keys):
+            self._keys[address] = public_key if len(public_key) > 0 else None
+        self.misses += len(missing)
+        return len(missing)
+
+    def save(self, path=KEY_CACHE_FILE):
+        """Persist the cache so later runs only re-fetch invalidated keys"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {
+            'contract_address': self.contract.address,
+            'synced_block': self.synced_block,
+            'entries': [
+                [address, public_key.hex() if public_key is not None else None]
+                for address, public_key in self._keys.items()
+            ]
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def load(self, path=KEY_CACHE_FILE):
+        """
+        Load a persisted cache for the same contract
+
+        Call sync() afterwards to invalidate keys registered since it was saved.
+
+        Returns:
+            bool: True if entries were loaded
+        """
+        if not os.path.exists(path):
+            return False
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get('contract_address') != self.contract.address:
+            return False
+
+        self.synced_block = data.get('synced_block')
+        # Files from before per-address keying hold [address, algorithm, key] entries
+        self._keys = {
+            entry[0]: bytes.fromhex(entry[-1]) if entry[-1] is not None else None
+            for entry in data.get('entries', [])
+        }
+        return True
+
+    def __len__(self):
+        return len(self._keys)
@@ -0,0 +1,152 @@
+"""
+Reusable key and signature fixtures for batch benchmarks
+Keypairs and signatures are generated once per algorithm on a process pool, stored
+as a content-addressed record file and memory-mapped by later phases and runs
+"""
+import os
+import json
+import hashlib
+from datetime import datetime
+
+import numpy as np
+
+from algorithm_registry import get_algorithm_info, resolve_algorithm_name
+from batch_executor import BatchEngine
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(PROJECT_ROOT, "data", "fixtures")
+FIXTURES_INDEX_FILE = os.path.join(FIXTURES_DIR, "index.json")
+
+# Bump when the record layout or message scheme changes; older objects are ignored
+FIXTURES_VERSION = 1
+
+def fixture_message(index):
+    """Message signed by fixture `index` (deterministic, so it is not stored)"""
+    return f"Batch test message {index+1}".encode('utf-8')
+
+def fixture_dtype(algorithm):
+    """
+    Fixed-size record layout for an algorithm's fixtures
+
+    Variable-length (FALCON) signatures are stored in a max-size field with their length.
+    """
+    info = get_algorithm_info(algorithm)
+    max_signature_size = info.get("signature_size_range", (0, info["signature_size"]))[1]
+    return np.dtype([
+        ('public_key', 'u1', (info["public_key_size"],)),
+        ('private_key', 'u1', (info["private_key_size"],)),
+        ('signature', 'u1', (max_signature_size,)),
+        ('signature_size', '<u4'),
+    ])
+
+def _load_index():
+    if not os.path.exists(FIXTURES_INDEX_FILE):
+        return {}
+    with open(FIXTURES_INDEX_FILE, 'r') as f:
+        return json.load(f)
+
+def _save_index(index):
+    tmp = FIXTURES_INDEX_FILE + ".tmp"
+    with open(tmp, 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp, FIXTURES_INDEX_FILE)
+
+def _object_path(digest):
+    return os.path.join(FIXTURES_DIR, "objects", f"{digest}.npy")
+
+class KeyFixtures:
+    """
+    Memory-mapped keypairs, messages and signatures for one algorithm
+
+    Accessors return the first `count` entries as bytes; only the slices
+    requested are read from disk.
+    """
+
+    def __init__(self, algorithm, records, digest):
+        self.algorithm = algorithm
+        self.records = records
+        self.digest = digest
+
+    def __len__(self):
+        return len(self.records)
+
+    def public_keys(self, count=None):
+        return [row.tobytes() for row in self.records['public_key'][:count]]
+
+    def private_keys(self, count=None):
+        return [row.tobytes() for row in self.records['private_key'][:count]]
+
+    def messages(self, count=None):
+        return [fixture_message(i) for i in range(len(self.records[:count]))]
+
+    def signatures(self, count=None):
+        records = self.records[:count]
+        return [sig[:size].tobytes() for sig, size in zip(records['signature'], records['signature_size'])]
+
+def _generate_records(algorithm, start, count, workers=None):
+    """Generate `count` fixtures (message indices start..start+count) on a process pool"""
+    messages = [fixture_message(i) for i in range(start, start + count)]
+    with BatchEngine(algorithm, executor="process", workers=workers) as engine:
+        public_keys, private_keys, _ = engine.keygen(count)
+        signatures, _ = engine.sign(private_keys, messages)
+
+    records = np.zeros(count, dtype=fixture_dtype(algorithm))
+    for i, (pk, sk, sig) in enumerate(zip(public_keys, private_keys, signatures)):
+        records['public_key'][i] = np.frombuffer(pk, dtype=np.uint8)
+        records['private_key'][i] = np.frombuffer(sk, dtype=np.uint8)
+        records['signature'][i, :len(sig)] = np.frombuffer(sig, dtype=np.uint8)
+        records['signature_size'][i] = len(sig)
+    return records
+
+def _store_records(records):
+    """Write records under their content hash; returns the digest"""
+    digest = hashlib.sha256(records.tobytes()).hexdigest()
+    path = _object_path(digest)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp.npy"
+        np.save(tmp, records)
+        os.replace(tmp, path)
+    return digest
+
+def load_fixtures(algorithm, count, workers=None):
+    """
+    Get at least `count` fixtures for an algorithm, generating only what is missing
+
+    Args:
+        algorithm: Algorithm name or alias
+        count: Number of keypairs/signatures needed
+        workers: Process pool size used for generation (default: one per core)
+
+    Returns:
+        KeyFixtures: Memory-mapped fixtures (may hold more than `count` entries)
+    """
+    algorithm = resolve_algorithm_name(algorithm)
+    index = _load_index()
+    entry = index.get(algorithm)
+    existing = None
+    if entry and entry.get('version') == FIXTURES_VERSION and os.path.exists(_object_path(entry['digest'])):
+        existing = np.load(_object_path(entry['digest']), mmap_mode='r')
+        if len(existing) >= count:
+            return KeyFixtures(algorithm, existing, entry['digest'])
+
+    have = len(existing) if existing is not None else 0
+    print(f"  Generating {count - have} {algorithm} fixture keypairs and signatures...")
+    records = _generate_records(algorithm, have, count - have, workers)
+    if existing is not None:
+        records = np.concatenate([np.asarray(existing), records])
+
+    digest = _store_records(records)
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    index[algorithm] = {
+        'version': FIXTURES_VERSION,
+        'digest': digest,
+        'count': len(records),
+        'created': datetime.now().isoformat(),
+    }
+    _save_index(index)
+
+    if entry and entry.get('digest') != digest and os.path.exists(_object_path(entry['digest'])):
+        os.remove(_object_path(entry['digest']))
+
+    return KeyFixtures(algorithm, np.load(_object_path(digest), mmap_mode='r'), digest)
@@ -12,8 +12,11 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 os.chdir(PROJECT_ROOT)
 
-from web3 import Web3
+from web3_client import get_web3, get_contract
 from contract_utils import load_contract_info
+from algorithm_registry import get_algorithm, SUPPORTED_ALGORITHMS
+from reporting import console_reporter
+from tx_submitter import TransactionSubmitter
 
 # Try to import QuantCrypt
 try:
@@ -27,12 +30,19 @@ except ImportError:
 # Configuration
 GANACHE_URL = "http://127.0.0.1:8545"
 
-def generate_pqc_keypair(algorithm="dilithium3"):
+# Gas limit used when registration gas cannot be estimated (large PQC keys)
+DEFAULT_REGISTRATION_GAS = 1000000
+
+def generate_pqc_keypair(algorithm="dilithium3", reporter=None):
     """
     Generate a PQC key pair using QuantCrypt
     
+    The call performs no console I/O; pass a reporter (e.g.
+    reporting.console_reporter) to get progress output after the timed call.
+    
     Args:
         algorithm: PQC algorithm to use ("dilithium3", "dilithium2", "sphincs")
+        reporter: Optional callable(event, **fields) for progress/log output
     
     Returns:
         tuple: (public_key, private_key, algorithm_instance)
@@ -40,48 +50,23 @@ def generate_pqc_keypair(algorithm="dilithium3"):
     if not QUANTCRYPT_AVAILABLE:
         raise ImportError("QuantCrypt library not available. Install with: pip install quantcrypt")
     
-    print(f"Generating {algorithm} key pair...")
-    start_time = time.perf_counter()
-    
     try:
-        # QuantCrypt uses algorithm classes directly with keygen() method
-        # NIST ML-DSA (Dilithium) algorithms
-        if algorithm == "dilithium3" or algorithm == "dilithium65" or algorithm == "mldsa65":
-            alg = dss.MLDSA_65()
-        elif algorithm == "dilithium2" or algorithm == "dilithium44" or algorithm == "mldsa44":
-            alg = dss.MLDSA_44()
-        elif algorithm == "dilithium5" or algorithm == "dilithium87" or algorithm == "mldsa87":
-            alg = dss.MLDSA_87()
-        # NIST SLH-DSA (SPHINCS+) algorithms
-        elif algorithm == "sphincs" or algorithm == "sphincs128f" or algorithm == "sphincs_small":
-            alg = dss.SMALL_SPHINCS()
-        elif algorithm == "sphincs192f" or algorithm == "sphincs256f" or algorithm == "sphincs_fast":
-            alg = dss.FAST_SPHINCS()
-        # NIST FALCON algorithms
-        elif algorithm == "falcon512" or algorithm == "falcon_512":
-            alg = dss.FALCON_512()
-        elif algorithm == "falcon1024" or algorithm == "falcon_1024":
-            alg = dss.FALCON_1024()
-        else:
-            raise ValueError(
-                f"Unknown algorithm: {algorithm}. Supported: "
-                "dilithium2, dilithium3, dilithium5, "
-                "sphincs128f, sphincs_fast, "
-                "falcon512, falcon1024"
-            )
+        alg = get_algorithm(algorithm)
         
+        start_time = time.perf_counter()
         pk, sk = alg.keygen()
         keygen_time = time.perf_counter() - start_time
-        
-        print(f"[OK] Key pair generated in {keygen_time:.4f} seconds")
-        print(f"     Public key size: {len(pk)} bytes")
-        print(f"     Private key size: {len(sk)} bytes")
-        
-        return pk, sk, alg
     
     except Exception as e:
-        print(f"[ERROR] Failed to generate key pair: {e}")
+        if reporter is not None:
+            reporter("error", operation="Key generation", error=e)
         raise
+    
+    if reporter is not None:
+        reporter("keygen", algorithm=algorithm, elapsed=keygen_time,
+                 public_key_size=len(pk), private_key_size=len(sk))
+    
+    return pk, sk, alg
 
 def register_key_on_chain(w3, account, contract_address, abi, public_key):
     """
@@ -99,37 +84,25 @@ def register_key_on_chain(w3, account, contract_address, abi, public_key):
     """
     print("Registering PQC public key on-chain...")
     
+    submitter = None
     try:
-        contract = w3.eth.contract(address=contract_address, abi=abi)
+        contract = get_contract(w3, contract_address, abi)
+        # Same nonce/gas path as the gas benchmarks, with a 50% buffer for large PQC keys
+        submitter = TransactionSubmitter(w3, account, contract, gas_buffer=1.5)
         
-        # Get current nonce
-        nonce = w3.eth.get_transaction_count(account)
-        
-        # Estimate gas first, then add buffer for large PQC keys
         try:
-            estimated_gas = contract.functions.registerPQCKey(public_key).estimate_gas({
-                'from': account
-            })
-            gas_limit = int(estimated_gas * 1.5)  # 50% buffer
+            submitter.estimate_gas("registerPQCKey", public_key)
+            gas_limit = None
         except Exception:
             # If estimation fails, use a large default for PQC keys
-            gas_limit = 1000000  # 1M gas should be enough for large keys
+            gas_limit = DEFAULT_REGISTRATION_GAS
         
-        # Build and send transaction
-        tx_hash = contract.functions.registerPQCKey(public_key).transact({
-            'from': account,
-            'nonce': nonce,
-            'gas': gas_limit,
-            'gasPrice': w3.eth.gas_price
-        })
+        tx_hash = submitter.submit("registerPQCKey", public_key, gas=gas_limit)
         
         print(f"Transaction sent: {tx_hash.hex()}")
         print("Waiting for confirmation...")
         
-        tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-        
-        if tx_receipt.status != 1:
-            raise Exception("Transaction failed")
+        tx_receipt = submitter.collect()[0]
         
         print(f"[OK] Key registered successfully!")
         print(f"     Transaction hash: {tx_hash.hex()}")
@@ -148,6 +121,9 @@ def register_key_on_chain(w3, account, contract_address, abi, public_key):
     except Exception as e:
         print(f"[ERROR] Failed to register key: {e}")
         raise
+    finally:
+        if submitter is not None:
+            submitter.close()
 
 def save_keypair_to_file(account, public_key, private_key, algorithm_name):
     """
@@ -178,11 +154,7 @@ def main():
     parser = argparse.ArgumentParser(description="Register PQC public key on-chain")
     parser.add_argument(
         "--algorithm",
-        choices=[
-            "dilithium2", "dilithium3", "dilithium5",
-            "sphincs128f", "sphincs_fast",
-            "falcon512", "falcon1024"
-        ],
+        choices=SUPPORTED_ALGORITHMS,
         default="dilithium3",
         help="PQC algorithm to use (default: dilithium3). "
              "Options: dilithium2/3/5, sphincs128f/fast, falcon512/1024"
@@ -210,7 +182,7 @@ def main():
     try:
         # Connect to Ganache
         print(f"Connecting to Ganache at {GANACHE_URL}...")
-        w3 = Web3(Web3.HTTPProvider(GANACHE_URL))
+        w3 = get_web3(GANACHE_URL)
         
         if not w3.is_connected():
             print("[ERROR] Could not connect to Ganache")
@@ -244,7 +216,8 @@ def main():
         
         # Generate PQC key pair
         print("-" * 60)
-        public_key, private_key, algorithm = generate_pqc_keypair(args.algorithm)
+        print(f"Generating {args.algorithm} key pair...")
+        public_key, private_key, algorithm = generate_pqc_keypair(args.algorithm, reporter=console_reporter)
         print()
         
         # Register key on-chain
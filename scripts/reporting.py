@@ -0,0 +1,31 @@
+"""
+Pluggable reporting for the PQC primitives
+Keeps console output out of the timed keygen/sign/verify calls
+"""
+
+def quiet_reporter(event, **fields):
+    """Reporter that discards every event (default for benchmarks and batch loops)"""
+    pass
+
+def console_reporter(event, **fields):
+    """
+    Reporter that prints events in the CLI scripts' console format
+
+    Args:
+        event: Event name ("keygen", "sign", "verify" or "error")
+        **fields: Event data (timings in seconds, sizes in bytes)
+    """
+    if event == "keygen":
+        print(f"[OK] Key pair generated in {fields['elapsed']:.4f} seconds")
+        print(f"     Public key size: {fields['public_key_size']} bytes")
+        print(f"     Private key size: {fields['private_key_size']} bytes")
+    elif event == "sign":
+        print(f"[OK] Message signed in {fields['elapsed']:.4f} seconds")
+        print(f"     Signature size: {fields['signature_size']} bytes")
+    elif event == "verify":
+        print(f"     Verification time: {fields['elapsed']:.4f} seconds")
+        print(f"     Signature valid: {fields['valid']}")
+    elif event == "error":
+        print(f"[ERROR] {fields['operation']} failed: {fields['error']}")
+    else:
+        print(f"[INFO] {event}: {fields}")
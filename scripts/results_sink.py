@@ -0,0 +1,274 @@
+"""
+Buffered results sink for signature verification records
+Appends batches to CSV, Arrow IPC (when pyarrow is available) or a compact binary record file
+"""
+import os
+import csv
+import time
+import itertools
+
+# numpy is needed for the binary format and for columnar loading
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# Try to import pyarrow (optional, enables the Arrow IPC format)
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_FILE = os.path.join(PROJECT_ROOT, "data", "results.csv")
+RESULTS_ARROW_DIR = os.path.join(PROJECT_ROOT, "data", "results_arrow")
+RESULTS_BINARY_FILE = os.path.join(PROJECT_ROOT, "data", "results.bin")
+
+RESULTS_FIELDNAMES = [
+    'algorithm', 'keygen_time', 'sign_time', 'verify_time',
+    'public_key_size', 'signature_size', 'gas_used', 'valid', 'block_number'
+]
+
+SINK_FORMATS = ["csv", "arrow", "binary"]
+
+# Rows buffered before a flush
+DEFAULT_BATCH_SIZE = 256
+
+# Distinguishes Arrow parts opened by one process within the same second
+_ARROW_PART_SEQ = itertools.count()
+
+# Binary format: magic header followed by fixed-size little-endian records.
+# Missing times are NaN, missing gas is -1.
+BINARY_MAGIC = b"PQCRES01"
+if NUMPY_AVAILABLE:
+    RESULT_DTYPE = np.dtype([
+        ('algorithm', 'S16'),
+        ('keygen_time', '<f8'),
+        ('sign_time', '<f8'),
+        ('verify_time', '<f8'),
+        ('public_key_size', '<i4'),
+        ('signature_size', '<i4'),
+        ('gas_used', '<i8'),
+        ('valid', '?'),
+        ('block_number', '<i8'),
+    ])
+else:
+    RESULT_DTYPE = None
+
+if PYARROW_AVAILABLE:
+    RESULT_ARROW_SCHEMA = pa.schema([
+        ('algorithm', pa.string()),
+        ('keygen_time', pa.float64()),
+        ('sign_time', pa.float64()),
+        ('verify_time', pa.float64()),
+        ('public_key_size', pa.int32()),
+        ('signature_size', pa.int32()),
+        ('gas_used', pa.int64()),
+        ('valid', pa.bool_()),
+        ('block_number', pa.int64()),
+    ])
+else:
+    RESULT_ARROW_SCHEMA = None
+
+_FLOAT_FIELDS = ('keygen_time', 'sign_time', 'verify_time')
+_INT_FIELDS = ('public_key_size', 'signature_size', 'gas_used', 'block_number')
+
+def _to_float(value):
+    return float(value) if value not in ('', None) else float('nan')
+
+def _to_int(value):
+    return int(value) if value not in ('', None) else -1
+
+def _to_bool(value):
+    return value if isinstance(value, bool) else str(value) == 'True'
+
+def _rows_to_columns(rows):
+    """Convert result dicts (CSV-style values) to typed column lists"""
+    columns = {'algorithm': [str(row['algorithm']) for row in rows]}
+    for field in _FLOAT_FIELDS:
+        columns[field] = [_to_float(row.get(field)) for row in rows]
+    for field in _INT_FIELDS:
+        columns[field] = [_to_int(row.get(field)) for row in rows]
+    columns['valid'] = [_to_bool(row.get('valid')) for row in rows]
+    return columns
+
+def resolve_sink_format(fmt):
+    """
+    Check that a results format can be written in this environment
+
+    Returns:
+        str: The format name
+    """
+    if fmt not in SINK_FORMATS:
+        raise ValueError(f"Unknown results format: {fmt}. Supported: {', '.join(SINK_FORMATS)}")
+    if fmt == "arrow" and not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow not available. Install with: pip install pyarrow")
+    if fmt == "binary" and not NUMPY_AVAILABLE:
+        raise ImportError("numpy not available. Install with: pip install numpy")
+    return fmt
+
+def results_location(fmt):
+    """Path results of a format are appended to"""
+    return {"csv": RESULTS_FILE, "arrow": RESULTS_ARROW_DIR, "binary": RESULTS_BINARY_FILE}[fmt]
+
+class ResultsSink:
+    """
+    Append-only, buffered writer for verification results
+
+    Rows are buffered and written in batches; every format only ever appends,
+    so flushed rows are durable before a checkpoint is advanced. Arrow output
+    is one IPC stream per run under data/results_arrow/.
+
+    Usage:
+        with ResultsSink("binary") as sink:
+            sink.write(row)
+            sink.flush()
+    """
+
+    def __init__(self, fmt="csv", batch_size=DEFAULT_BATCH_SIZE):
+        self.format = resolve_sink_format(fmt)
+        self.batch_size = batch_size
+        self.path = results_location(fmt)
+        self.rows_written = 0
+        self._buffer = []
+        self._file = None
+        self._arrow_writer = None
+
+    def _open(self):
+        if self.format == "arrow":
+            os.makedirs(self.path, exist_ok=True)
+            part = os.path.join(self.path, f"part-{time.strftime('%Y%m%d_%H%M%S')}-{os.getpid()}"
+                                           f"-{next(_ARROW_PART_SEQ):04d}.arrows")
+            self._file = open(part, "xb")
+            self._arrow_writer = pa.ipc.new_stream(self._file, RESULT_ARROW_SCHEMA)
+        else:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            if self.format == "csv":
+                self._file = open(self.path, "a", newline="")
+                self._csv_writer = csv.DictWriter(self._file, fieldnames=RESULTS_FIELDNAMES)
+                if new_file:
+                    self._csv_writer.writeheader()
+            else:
+                self._file = open(self.path, "ab")
+                if new_file:
+                    self._file.write(BINARY_MAGIC)
+
+    def write(self, row):
+        """Buffer one result row, flushing once the batch is full"""
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_batch(self, rows):
+        """Append rows and flush them immediately"""
+        self._buffer.extend(rows)
+        self.flush()
+
+    def flush(self):
+        """Write every buffered row to disk"""
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._open()
+
+        if self.format == "csv":
+            self._csv_writer.writerows(self._buffer)
+        elif self.format == "arrow":
+            batch = pa.record_batch(_rows_to_columns(self._buffer), schema=RESULT_ARROW_SCHEMA)
+            self._arrow_writer.write_batch(batch)
+        else:
+            columns = _rows_to_columns(self._buffer)
+            records = np.empty(len(self._buffer), dtype=RESULT_DTYPE)
+            for field in RESULT_DTYPE.names:
+                values = columns[field]
+                records[field] = [v.encode() for v in values] if field == 'algorithm' else values
+            records.tofile(self._file)
+
+        self._file.flush()
+        self.rows_written += len(self._buffer)
+        self._buffer.clear()
+
+    def close(self):
+        """Flush remaining rows and close the output"""
+        self.flush()
+        if self._arrow_writer is not None:
+            self._arrow_writer.close()
+            self._arrow_writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _load_csv(path):
+    with open(path, "r", newline="") as f:
+        rows = list(csv.DictReader(f))
+    columns = _rows_to_columns(rows)
+    return {field: np.asarray(values) for field, values in columns.items()}
+
+def _load_binary(path):
+    with open(path, "rb") as f:
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a results record file")
+    count = (os.path.getsize(path) - len(BINARY_MAGIC)) // RESULT_DTYPE.itemsize
+    records = np.memmap(path, dtype=RESULT_DTYPE, mode="r", offset=len(BINARY_MAGIC), shape=(count,))
+    columns = {field: records[field] for field in RESULT_DTYPE.names}
+    columns['algorithm'] = columns['algorithm'].astype(str)
+    return columns
+
+def _load_arrow(directory):
+    tables = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".arrows"):
+            continue
+        with pa.OSFile(os.path.join(directory, name), "rb") as source:
+            tables.append(pa.ipc.open_stream(source).read_all())
+    if not tables:
+        return None
+    table = pa.concat_tables(tables)
+    return {field: table.column(field).to_numpy(zero_copy_only=False) for field in RESULTS_FIELDNAMES}
+
+def load_results_columns(formats=None):
+    """
+    Load every stored verification result as columns
+
+    Args:
+        formats: Formats to read (default: every format present on disk)
+
+    Returns:
+        dict: Field name -> numpy array (missing times are NaN, missing gas is -1),
+              or None if no results exist
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not available. Install with: pip install numpy")
+
+    loaded = []
+    for fmt in formats or SINK_FORMATS:
+        path = results_location(fmt)
+        if not os.path.exists(path):
+            continue
+        if fmt == "csv":
+            loaded.append(_load_csv(path))
+        elif fmt == "binary":
+            loaded.append(_load_binary(path))
+        elif PYARROW_AVAILABLE:
+            columns = _load_arrow(path)
+            if columns is not None:
+                loaded.append(columns)
+        else:
+            print(f"[WARNING] Skipping Arrow results in {path}: pyarrow not available")
+
+    if not loaded:
+        return None
+    if len(loaded) == 1:
+        return loaded[0]
+    return {field: np.concatenate([columns[field] for columns in loaded]) for field in RESULTS_FIELDNAMES}
@@ -0,0 +1,187 @@
+"""
+JSON-RPC request batching for read-heavy chain queries
+Coalesces many eth_getBlockByNumber / eth_getTransactionReceipt / eth_call requests
+into JSON-RPC batch payloads sent over the shared keep-alive pool
+"""
+import itertools
+
+from web3_client import get_session, run_concurrently
+
+# Requests per batch payload (most nodes accept at least 100; Ganache has no limit)
+DEFAULT_BATCH_SIZE = 100
+
+class RpcError(Exception):
+    """A request inside a JSON-RPC batch returned an error object"""
+
+    def __init__(self, method, params, error):
+        self.method = method
+        self.params = params
+        self.error = error
+        message = error.get('message', error) if isinstance(error, dict) else error
+        super().__init__(f"{method} failed: {message}")
+
+class RpcBatcher:
+    """
+    Queue of raw JSON-RPC requests flushed as batch payloads
+
+    Results are raw JSON values (hex quantities, hex data), not web3-formatted.
+    Providers without an HTTP endpoint (e.g. the in-process eth-tester backend)
+    fall back to one request at a time through web3, whose results are already
+    decoded (ints, HexBytes); to_int() and the helpers below accept both.
+    """
+
+    def __init__(self, w3, batch_size=DEFAULT_BATCH_SIZE):
+        self.w3 = w3
+        self.batch_size = max(1, batch_size)
+        self.endpoint = getattr(w3.provider, 'endpoint_uri', None)
+        self.session = get_session(self.endpoint) if self.endpoint else None
+        self.round_trips = 0
+        self._queue = []
+        self._ids = itertools.count(1)
+
+    def add(self, method, params):
+        """
+        Queue a request
+
+        Returns:
+            int: Position of the request's result in the list returned by execute()
+        """
+        self._queue.append((method, list(params)))
+        return len(self._queue) - 1
+
+    def execute(self):
+        """
+        Send every queued request, batch_size requests per payload
+
+        Returns:
+            list: Results in the order requests were added
+
+        Raises:
+            RpcError: If any request returned an error
+        """
+        queue, self._queue = self._queue, []
+        if not queue:
+            return []
+        if self.session is None:
+            return [self._send_one(method, params) for method, params in queue]
+
+        chunks = [queue[i:i + self.batch_size] for i in range(0, len(queue), self.batch_size)]
+        # Counted here, not in the concurrently running senders
+        self.round_trips += len(chunks)
+        results = run_concurrently(lambda chunk=chunk: self._send_batch(chunk) for chunk in chunks)
+        return [result for chunk_results in results for result in chunk_results]
+
+    def _send_one(self, method, params):
+        self.round_trips += 1
+        return self.w3.manager.request_blocking(method, params)
+
+    def _send_batch(self, chunk):
+        ids = [next(self._ids) for _ in chunk]
+        payload = [
+            {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+            for request_id, (method, params) in zip(ids, chunk)
+        ]
+        response = self.session.post(self.endpoint, json=payload)
+        response.raise_for_status()
+        body = response.json()
+        if isinstance(body, dict):
+            # Whole batch rejected (e.g. batch requests disabled on the node)
+            raise RpcError("batch", [], body.get('error', body))
+
+        # Responses may come back in any order
+        by_id = {item.get('id'): item for item in body}
+        results = []
+        for request_id, (method, params) in zip(ids, chunk):
+            item = by_id.get(request_id)
+            if item is None:
+                raise RpcError(method, params, "missing from batch response")
+            if item.get('error') is not None:
+                raise RpcError(method, params, item['error'])
+            results.append(item.get('result'))
+        return results
+
+    def map(self, method, params_list):
+        """
+        Send one method for many parameter lists
+
+        Args:
+            method: JSON-RPC method name
+            params_list: Iterable of parameter lists
+
+        Returns:
+            list: Results in the order of params_list
+        """
+        for params in params_list:
+            self.add(method, params)
+        return self.execute()
+
+def to_int(quantity):
+    """Decode a JSON-RPC hex quantity (None stays None)"""
+    if quantity is None or isinstance(quantity, int):
+        return quantity
+    return int(quantity, 16)
+
+def get_blocks(w3, block_numbers, full_transactions=False, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Fetch blocks with batched eth_getBlockByNumber
+
+    Args:
+        w3: Web3 instance
+        block_numbers: Block numbers to fetch
+        full_transactions: Include transaction objects instead of hashes
+        batch_size: Requests per batch payload
+
+    Returns:
+        list: Raw block dicts (None for blocks the node does not have)
+    """
+    batcher = RpcBatcher(w3, batch_size)
+    return batcher.map("eth_getBlockByNumber", ([hex(n), full_transactions] for n in block_numbers))
+
+def get_receipts(w3, tx_hashes, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Fetch transaction receipts with batched eth_getTransactionReceipt
+
+    Args:
+        w3: Web3 instance
+        tx_hashes: Transaction hashes (hex strings or bytes)
+        batch_size: Requests per batch payload
+
+    Returns:
+        list: Raw receipt dicts (None for pending/unknown transactions)
+    """
+    batcher = RpcBatcher(w3, batch_size)
+    return batcher.map("eth_getTransactionReceipt",
+                       ([h if isinstance(h, str) else "0x" + bytes(h).hex()] for h in tx_hashes))
+
+def call_many(contract, fn_name, args_list, block_identifier='latest', batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Call one view function of a contract for many argument lists with batched eth_call
+
+    Args:
+        contract: Web3 contract object
+        fn_name: View function name
+        args_list: Iterable of argument lists
+        block_identifier: Block number or tag every call is made at
+        batch_size: Requests per batch payload
+
+    Returns:
+        list: Decoded return values (a single value for single-output functions)
+    """
+    w3 = contract.w3
+    # web3 v7+ renamed encodeABI to encode_abi; the first positional argument is the same
+    encode = getattr(contract, 'encode_abi', None) or contract.encodeABI
+    function = contract.get_function_by_name(fn_name)
+    output_types = [output['type'] for output in function.abi['outputs']]
+    block = hex(block_identifier) if isinstance(block_identifier, int) else block_identifier
+
+    batcher = RpcBatcher(w3, batch_size)
+    results = batcher.map("eth_call", (
+        [{'to': contract.address, 'data': encode(fn_name, args=list(args))}, block]
+        for args in args_list
+    ))
+    decoded = []
+    for result in results:
+        data = bytes.fromhex(result[2:]) if isinstance(result, str) else bytes(result)
+        values = w3.codec.decode(output_types, data)
+        decoded.append(values[0] if len(values) == 1 else values)
+    return decoded
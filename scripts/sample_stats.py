@@ -0,0 +1,303 @@
+"""
+Vectorized summary statistics for benchmark timing samples
+One routine shared by every benchmark: central tendency, tail percentiles, MAD,
+bootstrap confidence interval and outlier flags; plus adaptive sample collection
+"""
+import time
+import timeit
+
+import numpy as np
+
+# Percentiles reported by summarize(), as (result key, percentile)
+PERCENTILES = (('p50', 50.0), ('p90', 90.0), ('p99', 99.0), ('p99_9', 99.9))
+
+# Modified z-score above which a sample is flagged as an outlier (Iglewicz & Hoaglin)
+OUTLIER_Z = 3.5
+
+BOOTSTRAP_RESAMPLES = 1000
+CONFIDENCE_LEVEL = 0.95
+
+# Bootstrap resamples drawn per vectorized block (bounds temporary memory)
+_BOOTSTRAP_BLOCK_ELEMENTS = 2_000_000
+
+# Adaptive sampling defaults: discarded warmup runs, sample bounds, target
+# relative half-width of the 95% CI of the mean, and time budget (seconds)
+DEFAULT_WARMUP = 3
+DEFAULT_MIN_SAMPLES = 10
+DEFAULT_MAX_SAMPLES = 5000
+DEFAULT_TARGET_REL_CI = 0.01
+DEFAULT_TIME_BUDGET = 5.0
+
+# z value for the cheap normal-approximation CI used as the stopping rule
+_STOP_Z = 1.96
+
+# Batch timing: timed loops per measurement and minimum duration of one loop (seconds)
+DEFAULT_BATCH_REPEATS = 7
+DEFAULT_MIN_LOOP_TIME = 0.05
+
+class SampleBuffer:
+    """
+    Growable float64 buffer for timing samples
+
+    Appends amortize to O(1) without boxing every sample in a Python float list;
+    `values` is a view of the recorded samples.
+    """
+
+    def __init__(self, capacity=64):
+        self._data = np.empty(max(capacity, 1), dtype=np.float64)
+        self._size = 0
+
+    def append(self, value):
+        if self._size == len(self._data):
+            self._data = np.resize(self._data, len(self._data) * 2)
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        needed = self._size + len(values)
+        if needed > len(self._data):
+            self._data = np.resize(self._data, max(needed, len(self._data) * 2))
+        self._data[self._size:needed] = values
+        self._size = needed
+
+    @property
+    def values(self):
+        return self._data[:self._size]
+
+    def __len__(self):
+        return self._size
+
+def outlier_flags(samples):
+    """
+    Flag outliers by modified z-score (robust to the outliers themselves)
+
+    Returns:
+        numpy bool array, True where the sample is an outlier
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    median = np.median(samples)
+    mad = np.median(np.abs(samples - median))
+    if mad == 0:
+        return np.zeros(len(samples), dtype=bool)
+    return np.abs(0.6745 * (samples - median) / mad) > OUTLIER_Z
+
+def bootstrap_ci(samples, statistic=np.mean, resamples=BOOTSTRAP_RESAMPLES, confidence=CONFIDENCE_LEVEL, seed=0):
+    """
+    Percentile bootstrap confidence interval of a statistic
+
+    Returns:
+        tuple: (low, high)
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    n = len(samples)
+    if n < 2:
+        value = float(samples[0]) if n else 0.0
+        return value, value
+
+    rng = np.random.default_rng(seed)
+    block = max(1, _BOOTSTRAP_BLOCK_ELEMENTS // n)
+    estimates = np.empty(resamples, dtype=np.float64)
+    for start in range(0, resamples, block):
+        stop = min(start + block, resamples)
+        indices = rng.integers(0, n, size=(stop - start, n))
+        estimates[start:stop] = statistic(samples[indices], axis=1)
+
+    alpha = (1.0 - confidence) / 2.0
+    low, high = np.quantile(estimates, [alpha, 1.0 - alpha])
+    return float(low), float(high)
+
+def summarize(samples, confidence=CONFIDENCE_LEVEL, resamples=BOOTSTRAP_RESAMPLES):
+    """
+    Summarize timing samples in one vectorized pass
+
+    Args:
+        samples: SampleBuffer, numpy array or list of samples (seconds)
+        confidence: Bootstrap confidence level for the mean
+        resamples: Number of bootstrap resamples
+
+    Returns:
+        dict: mean, median, std_dev, min, max, p50, p90, p99, p99_9, mad,
+              ci_low/ci_high (bootstrap CI of the mean), ci_level, outlier count
+              and outlier_indices (positions flagged by outlier_flags())
+    """
+    if isinstance(samples, SampleBuffer):
+        samples = samples.values
+    samples = np.asarray(samples, dtype=np.float64)
+    n = len(samples)
+    if n == 0:
+        summary = dict.fromkeys(['mean', 'median', 'std_dev', 'min', 'max', 'mad', 'ci_low', 'ci_high'], 0)
+        summary.update({key: 0 for key, _ in PERCENTILES})
+        summary.update({'ci_level': confidence, 'outliers': 0, 'outlier_indices': []})
+        return summary
+
+    # min, percentiles and max from a single partition of the data
+    quantiles = np.percentile(samples, [0.0] + [q for _, q in PERCENTILES] + [100.0])
+    median = quantiles[1]
+    mad = np.median(np.abs(samples - median))
+    ci_low, ci_high = bootstrap_ci(samples, resamples=resamples, confidence=confidence)
+    outlier_indices = np.flatnonzero(outlier_flags(samples))
+
+    summary = {
+        'mean': float(samples.mean()),
+        'median': float(median),
+        'std_dev': float(samples.std(ddof=1)) if n > 1 else 0.0,
+        'min': float(quantiles[0]),
+        'max': float(quantiles[-1]),
+    }
+    summary.update({key: float(value) for (key, _), value in zip(PERCENTILES, quantiles[1:-1])})
+    summary.update({
+        'mad': float(mad),
+        'ci_low': ci_low,
+        'ci_high': ci_high,
+        'ci_level': confidence,
+        'outliers': len(outlier_indices),
+        'outlier_indices': outlier_indices.tolist(),
+    })
+    return summary
+
+class SamplingPlan:
+    """
+    How many samples a benchmark collects
+
+    Adaptive plans run warmup iterations (discarded), then sample until the
+    relative CI half-width of the mean drops below target_rel_ci or the time
+    budget is spent, bounded by min_samples/max_samples. Fixed plans collect
+    exactly min_samples samples.
+    """
+
+    def __init__(self, warmup=DEFAULT_WARMUP, min_samples=DEFAULT_MIN_SAMPLES, max_samples=DEFAULT_MAX_SAMPLES,
+                 target_rel_ci=DEFAULT_TARGET_REL_CI, time_budget=DEFAULT_TIME_BUDGET):
+        self.warmup = warmup
+        self.min_samples = min_samples
+        self.max_samples = max(max_samples, min_samples)
+        self.target_rel_ci = target_rel_ci
+        self.time_budget = time_budget
+
+    @classmethod
+    def fixed(cls, iterations, warmup=0):
+        """Plan that collects exactly `iterations` samples"""
+        return cls(warmup=warmup, min_samples=iterations, max_samples=iterations,
+                   target_rel_ci=None, time_budget=None)
+
+    @property
+    def adaptive(self):
+        return self.min_samples < self.max_samples
+
+    def describe(self):
+        if not self.adaptive:
+            return f"{self.min_samples} iterations"
+        budget = f", {self.time_budget:g}s budget" if self.time_budget else ""
+        return f"adaptive, {self.warmup} warmup, target CI ±{self.target_rel_ci * 100:g}%{budget}"
+
+def _relative_ci(values):
+    mean = values.mean()
+    if len(values) < 2 or mean <= 0:
+        return float('inf')
+    return float(_STOP_Z * values.std(ddof=1) / np.sqrt(len(values)) / mean)
+
+def collect_samples(measure, plan):
+    """
+    Collect timing samples according to a sampling plan
+
+    Args:
+        measure: Callable() -> elapsed seconds, or None if the iteration failed
+        plan: SamplingPlan
+
+    Returns:
+        tuple: (SampleBuffer, sampling info dict with warmup, samples, failures,
+                stop_reason, rel_ci and elapsed seconds)
+    """
+    for _ in range(plan.warmup):
+        measure()
+
+    samples = SampleBuffer(min(plan.max_samples, 1024))
+    failures = 0
+    next_check = plan.min_samples
+    stop_reason = 'max_samples'
+    rel_ci = None
+    start = time.perf_counter()
+
+    # Every iteration may fail; give up once failures alone would fill the plan
+    while len(samples) < plan.max_samples and failures < plan.max_samples:
+        elapsed = measure()
+        if elapsed is None:
+            failures += 1
+            continue
+        samples.append(elapsed)
+
+        if not plan.adaptive or len(samples) < next_check:
+            continue
+        # Check geometrically so the stopping rule stays O(n) overall
+        next_check = len(samples) + max(1, len(samples) // 4)
+        rel_ci = _relative_ci(samples.values)
+        if plan.target_rel_ci is not None and rel_ci <= plan.target_rel_ci:
+            stop_reason = 'target_ci'
+            break
+        if plan.time_budget is not None and time.perf_counter() - start >= plan.time_budget:
+            stop_reason = 'time_budget'
+            break
+
+    if len(samples) > 1 and rel_ci is None:
+        rel_ci = _relative_ci(samples.values)
+    if not plan.adaptive:
+        stop_reason = 'fixed'
+
+    return samples, {
+        'warmup': plan.warmup,
+        'samples': len(samples),
+        'failures': failures,
+        'stop_reason': stop_reason,
+        'rel_ci': rel_ci,
+        'target_rel_ci': plan.target_rel_ci,
+        'time_budget': plan.time_budget,
+        'elapsed': time.perf_counter() - start,
+    }
+
+def _noop():
+    pass
+
+def autorange_loops(timer, min_loop_time=DEFAULT_MIN_LOOP_TIME):
+    """
+    Find a loop count (1, 2, 5, 10, 20, ...) whose loop takes at least min_loop_time
+
+    Same sequence as timeit.Timer.autorange, with a configurable threshold.
+    """
+    loops = 1
+    while True:
+        for factor in (1, 2, 5):
+            number = loops * factor
+            if timer.timeit(number) >= min_loop_time:
+                return number
+        loops *= 10
+
+def time_batched(func, repeats=DEFAULT_BATCH_REPEATS, min_loop_time=DEFAULT_MIN_LOOP_TIME):
+    """
+    Time a fast operation in tight loops instead of one timer read per call
+
+    Each of `repeats` measurements times `loops` back-to-back calls; the cost
+    of an empty call loop of the same length is subtracted, so the result is
+    not dominated by timer and interpreter loop overhead.
+
+    Args:
+        func: Zero-argument callable performing one operation
+        repeats: Number of timed loops
+        min_loop_time: Minimum duration of one loop (seconds), sets `loops`
+
+    Returns:
+        tuple: (per-loop seconds per operation as numpy array, batch info dict
+                with loops, repeats, ns_per_op, ns_per_op_std and baseline_ns_per_op)
+    """
+    timer = timeit.Timer(func)
+    loops = autorange_loops(timer, min_loop_time)
+    loop_times = np.array(timer.repeat(repeats, loops))
+    baseline = min(timeit.Timer(_noop).repeat(repeats, loops))
+    per_op = np.maximum(loop_times - baseline, 0.0) / loops
+
+    return per_op, {
+        'loops': loops,
+        'repeats': repeats,
+        'ns_per_op': float(np.median(per_op) * 1e9),
+        'ns_per_op_std': float(per_op.std(ddof=1) * 1e9) if repeats > 1 else 0.0,
+        'baseline_ns_per_op': baseline / loops * 1e9,
+    }
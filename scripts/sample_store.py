@@ -0,0 +1,135 @@
+"""
+Compact storage for benchmark results
+Summaries stay in a small JSON index; raw timing samples go to a float64 .npy sidecar
+and outlier positions to an int64 one, memory-mapped and sliced only when a consumer asks for them
+"""
+import os
+import json
+
+# Try to import numpy (without it, samples stay inline in the JSON as before)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+SAMPLE_KEY = 'times'
+OUTLIER_KEY = 'outlier_indices'
+
+# Per-sample arrays kept out of the JSON index:
+# entry key -> (reference key, sidecar suffix, index key of the sidecar file, dtype)
+SIDECARS = {
+    SAMPLE_KEY: ('samples', ".samples.npy", 'samples_file', 'float64'),
+    OUTLIER_KEY: ('outlier_samples', ".outliers.npy", 'outliers_file', 'int64'),
+}
+
+def _sidecar_path(json_path, suffix):
+    return os.path.splitext(json_path)[0] + suffix
+
+def _externalize(node, chunks):
+    """Copy node with every sidecar array replaced by an (offset, count) reference into chunks[key]"""
+    if isinstance(node, dict):
+        copy = {}
+        for key, value in node.items():
+            if key in SIDECARS and isinstance(value, (list, np.ndarray)):
+                key_chunks = chunks.setdefault(key, [])
+                offset = sum(len(chunk) for chunk in key_chunks)
+                copy[SIDECARS[key][0]] = {'offset': offset, 'count': len(value)}
+                key_chunks.append(value)
+            else:
+                copy[key] = _externalize(value, chunks)
+        return copy
+    if isinstance(node, list):
+        return [_externalize(value, chunks) for value in node]
+    return node
+
+def save_results_index(output, json_path):
+    """
+    Save benchmark output as a JSON summary index plus raw samples and outlier files
+
+    Args:
+        output: Results dictionary; `times` lists are written to the samples file
+                and `outlier_indices` lists to the outliers file
+        json_path: Path of the JSON index
+    """
+    if NUMPY_AVAILABLE:
+        chunks = {}
+        output = _externalize(output, chunks)
+        for key, key_chunks in chunks.items():
+            _, suffix, file_key, dtype = SIDECARS[key]
+            if sum(len(chunk) for chunk in key_chunks):
+                path = _sidecar_path(json_path, suffix)
+                np.save(path, np.concatenate([np.asarray(chunk, dtype=dtype) for chunk in key_chunks]))
+                output[file_key] = os.path.basename(path)
+
+    with open(json_path, 'w') as f:
+        json.dump(output, f, indent=2)
+
+def load_results_index(json_path):
+    """
+    Load a benchmark JSON index without touching raw samples
+
+    Returns:
+        dict: Results data; pass it to load_samples() / load_outlier_indices()
+              to read an entry's arrays
+    """
+    with open(json_path, 'r') as f:
+        data = json.load(f)
+    for _, _, file_key, _ in SIDECARS.values():
+        if file_key in data:
+            data[file_key] = os.path.join(os.path.dirname(os.path.abspath(json_path)), data[file_key])
+    return data
+
+_SAMPLE_MAPS = {}
+
+def load_samples(data, entry):
+    """
+    Get the raw timing samples of one result entry
+
+    Args:
+        data: Results data from load_results_index()
+        entry: Operation result dictionary (e.g. result['signing'])
+
+    Returns:
+        numpy array (memory-mapped) or list of samples, or None if not recorded
+    """
+    return _load_sidecar(data, entry, SAMPLE_KEY)
+
+def load_outlier_indices(data, entry):
+    """
+    Get the positions of one result entry's samples flagged as outliers
+
+    Args:
+        data: Results data from load_results_index()
+        entry: Operation result dictionary (e.g. result['signing'])
+
+    Returns:
+        numpy array (memory-mapped) or list of sample positions, or None if not recorded
+    """
+    return _load_sidecar(data, entry, OUTLIER_KEY)
+
+def _load_sidecar(data, entry, key):
+    ref_key, _, file_key, dtype = SIDECARS[key]
+    if key in entry:
+        # Older result files keep the arrays inline
+        values = entry[key]
+        return np.asarray(values, dtype=dtype) if NUMPY_AVAILABLE else values
+
+    ref = entry.get(ref_key)
+    if ref is None:
+        return None
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not available. Install with: pip install numpy")
+    if ref['count'] == 0:
+        # Nothing to read (no sidecar is written when every array is empty)
+        return np.empty(0, dtype=dtype)
+    if file_key not in data:
+        return None
+
+    path = data[file_key]
+    values = _SAMPLE_MAPS.get(path)
+    if values is None:
+        values = np.load(path, mmap_mode='r')
+        _SAMPLE_MAPS[path] = values
+    return values[ref['offset']:ref['offset'] + ref['count']]
@@ -12,10 +12,14 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 os.chdir(PROJECT_ROOT)
 
 import time
-from web3 import Web3
+from web3_client import get_web3, get_contract
 from contract_utils import load_contract_info
 from key_utils import load_keypair, load_key_info
 from register_key import generate_pqc_keypair
+from algorithm_registry import get_algorithm
+from reporting import console_reporter
+from gas_model import GasModel, load_gas_model
+from tx_submitter import TransactionSubmitter
 
 # Try to import QuantCrypt
 try:
@@ -29,74 +33,58 @@ except ImportError:
 # Configuration
 GANACHE_URL = "http://127.0.0.1:8545"
 
+# Gas budget per batched logSignatures transaction (below Ganache's legacy 6.7M block gas limit)
+DEFAULT_BATCH_GAS_BUDGET = 6_000_000
+
 def get_algorithm_instance(algorithm_name):
     """
     Get algorithm instance from name
     
+    Instances are shared through the algorithm registry, so repeated calls
+    do not construct new QuantCrypt objects.
+    
     Args:
         algorithm_name: Name of the algorithm
     
     Returns:
         Algorithm instance
     """
-    if not QUANTCRYPT_AVAILABLE:
-        raise ImportError("QuantCrypt library not available")
-    
-    # QuantCrypt uses algorithm classes directly
-    # NIST ML-DSA (Dilithium)
-    if algorithm_name in ["dilithium3", "dilithium65", "mldsa65"]:
-        return dss.MLDSA_65()
-    elif algorithm_name in ["dilithium2", "dilithium44", "mldsa44"]:
-        return dss.MLDSA_44()
-    elif algorithm_name in ["dilithium5", "dilithium87", "mldsa87"]:
-        return dss.MLDSA_87()
-    # NIST SLH-DSA (SPHINCS+)
-    elif algorithm_name in ["sphincs", "sphincs128f", "sphincs_small"]:
-        return dss.SMALL_SPHINCS()
-    elif algorithm_name in ["sphincs192f", "sphincs256f", "sphincs_fast"]:
-        return dss.FAST_SPHINCS()
-    # NIST FALCON
-    elif algorithm_name in ["falcon512", "falcon_512"]:
-        return dss.FALCON_512()
-    elif algorithm_name in ["falcon1024", "falcon_1024"]:
-        return dss.FALCON_1024()
-    else:
-        raise ValueError(
-            f"Unknown algorithm: {algorithm_name}. Supported: "
-            "dilithium2/3/5, sphincs128f/fast, falcon512/1024"
-        )
+    return get_algorithm(algorithm_name)
 
-def sign_message_pqc(algorithm, private_key, message):
+def sign_message_pqc(algorithm, private_key, message, reporter=None):
     """
     Sign a message using PQC algorithm
     
+    The call performs no console I/O; the returned time covers only the
+    sign operation. Pass a reporter for progress output after the call.
+    
     Args:
         algorithm: Algorithm instance or name
         private_key: PQC private key bytes
         message: Message to sign (bytes)
+        reporter: Optional callable(event, **fields) for progress/log output
     
     Returns:
         tuple: (signature_bytes, signing_time_seconds)
     """
-    print("Signing message with PQC...")
-    start_time = time.perf_counter()
-    
     try:
         # If algorithm is a string, get the instance
         if isinstance(algorithm, str):
-            algorithm = get_algorithm_instance(algorithm)
+            algorithm = get_algorithm(algorithm)
         
+        start_time = time.perf_counter()
         signature = algorithm.sign(private_key, message)
         sign_time = time.perf_counter() - start_time
-        
-        print(f"[OK] Message signed in {sign_time:.4f} seconds")
-        print(f"     Signature size: {len(signature)} bytes")
-        
-        return signature, sign_time
     
     except Exception as e:
-        print(f"[ERROR] Failed to sign message: {e}")
+        if reporter is not None:
+            reporter("error", operation="Signing", error=e)
         raise
+    
+    if reporter is not None:
+        reporter("sign", elapsed=sign_time, signature_size=len(signature))
+    
+    return signature, sign_time
 
 def send_hybrid_transaction(w3, account, contract_address, abi, message, pqc_signature):
     """
@@ -116,8 +104,9 @@ def send_hybrid_transaction(w3, account, contract_address, abi, message, pqc_sig
     """
     print("Sending hybrid transaction...")
     
+    submitter = None
     try:
-        contract = w3.eth.contract(address=contract_address, abi=abi)
+        contract = get_contract(w3, contract_address, abi)
         
         # Convert message to bytes if needed
         if isinstance(message, str):
@@ -125,30 +114,15 @@ def send_hybrid_transaction(w3, account, contract_address, abi, message, pqc_sig
         else:
             message_bytes = message
         
-        # Get nonce
-        nonce = w3.eth.get_transaction_count(account)
-        
-        # Estimate gas (with buffer for large signatures)
-        estimated_gas = contract.functions.logSignature(pqc_signature, message_bytes).estimate_gas({
-            'from': account
-        })
-        gas_limit = int(estimated_gas * 1.2)  # 20% buffer
-        
-        # Call logSignature function (ECDSA signs the transaction)
-        tx_hash = contract.functions.logSignature(pqc_signature, message_bytes).transact({
-            'from': account,
-            'nonce': nonce,
-            'gas': gas_limit,
-            'gasPrice': w3.eth.gas_price
-        })
+        # Call logSignature function (ECDSA signs the transaction); nonce, gas price and
+        # the buffered gas estimate come from the same submitter as the gas benchmarks
+        submitter = TransactionSubmitter(w3, account, contract)
+        tx_hash = submitter.submit("logSignature", pqc_signature, message_bytes)
         
         print(f"Transaction sent: {tx_hash.hex()}")
         print("Waiting for confirmation...")
         
-        tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-        
-        if tx_receipt.status != 1:
-            raise Exception("Transaction failed")
+        tx_receipt = submitter.collect()[0]
         
         print(f"[OK] Hybrid transaction confirmed!")
         print(f"     Transaction hash: {tx_hash.hex()}")
@@ -160,6 +134,109 @@ def send_hybrid_transaction(w3, account, contract_address, abi, message, pqc_sig
     except Exception as e:
         print(f"[ERROR] Failed to send transaction: {e}")
         raise
+    finally:
+        if submitter is not None:
+            submitter.close()
+
+def pack_signature_batches(entries, gas_budget=DEFAULT_BATCH_GAS_BUDGET, gas_model=None):
+    """
+    Pack (message, signature) entries into consecutive logSignatures batches
+    
+    Each batch is the longest run of entries whose predicted gas fits the
+    budget; an entry that exceeds the budget on its own still gets a batch.
+    
+    Args:
+        entries: List of (message, signature) pairs (bytes)
+        gas_budget: Maximum predicted gas per transaction
+        gas_model: Calibrated GasModel (default: intrinsic gas only, a lower bound)
+    
+    Returns:
+        list: Batches (lists of entries) in the original order
+    """
+    model = gas_model or GasModel.intrinsic_only()
+    fits = lambda start, end: model.predict_log_signatures(entries[start:end]) <= gas_budget
+    
+    batches = []
+    start = 0
+    while start < len(entries):
+        # Double the batch until it no longer fits, then bisect the last step
+        good, bad = 1, None
+        while start + good < len(entries):
+            size = min(good * 2, len(entries) - start)
+            if not fits(start, start + size):
+                bad = size
+                break
+            good = size
+        while bad is not None and bad - good > 1:
+            middle = (good + bad) // 2
+            if fits(start, start + middle):
+                good = middle
+            else:
+                bad = middle
+        batches.append(entries[start:start + good])
+        start += good
+    return batches
+
+def send_hybrid_batch(w3, account, contract_address, abi, entries, gas_budget=DEFAULT_BATCH_GAS_BUDGET,
+                      gas_model=None):
+    """
+    Log many PQC signatures with as few transactions as the gas budget allows
+    
+    Entries are packed into logSignatures calls whose gas-model prediction fits
+    gas_budget; a batch whose node estimate still exceeds the budget is split in half.
+    Single-entry batches are sent with logSignature. Every transaction goes through
+    one TransactionSubmitter, so batches are sent back-to-back and confirmed together.
+    
+    Args:
+        w3: Web3 instance
+        account: Ethereum account address
+        contract_address: Contract address (a KeyRegistry with logSignatures)
+        abi: Contract ABI
+        entries: List of (message, signature) pairs; str messages are UTF-8 encoded
+        gas_budget: Maximum gas per transaction
+        gas_model: GasModel used for packing (default: the saved calibration, or
+                   intrinsic gas only if there is none)
+    
+    Returns:
+        list: (number of entries, transaction receipt) per transaction sent
+    """
+    contract = get_contract(w3, contract_address, abi)
+    entries = [(m.encode('utf-8') if isinstance(m, str) else m, sig) for m, sig in entries]
+    pending = pack_signature_batches(entries, gas_budget, gas_model or load_gas_model())
+    print(f"Sending {len(entries)} signature(s) in {len(pending)} batch(es) "
+          f"(gas budget {gas_budget:,} per transaction)...")
+    
+    submitter = TransactionSubmitter(w3, account, contract)
+    sizes = []
+    try:
+        while pending:
+            batch = pending.pop(0)
+            if len(batch) == 1:
+                message, signature = batch[0]
+                submitter.submit("logSignature", signature, message)
+                sizes.append(1)
+                continue
+            
+            messages = [message for message, _ in batch]
+            signatures = [signature for _, signature in batch]
+            estimated_gas = submitter.estimate_gas("logSignatures", signatures, messages)
+            if estimated_gas > gas_budget:
+                half = len(batch) // 2
+                pending[:0] = [batch[:half], batch[half:]]
+                continue
+            
+            submitter.submit("logSignatures", signatures, messages,
+                             gas=min(int(estimated_gas * 1.2), max(gas_budget, estimated_gas)))
+            sizes.append(len(batch))
+        
+        receipts = submitter.collect()
+    finally:
+        submitter.close()
+    
+    for size, tx_receipt in zip(sizes, receipts):
+        print(f"[OK] Batch of {size} signature(s) confirmed (gas used: {tx_receipt['gasUsed']:,}, "
+              f"{tx_receipt['gasUsed'] / size:,.0f} per signature)")
+    return list(zip(sizes, receipts))
 
 def main():
     """Main function for sending hybrid transactions"""
@@ -195,7 +272,7 @@ def main():
     try:
         # Connect to Ganache
         print(f"Connecting to Ganache at {GANACHE_URL}...")
-        w3 = Web3(Web3.HTTPProvider(GANACHE_URL))
+        w3 = get_web3(GANACHE_URL)
         
         if not w3.is_connected():
             print("[ERROR] Could not connect to Ganache")
@@ -258,7 +335,9 @@ def main():
         print("-" * 60)
         print(f"Message: {args.message}")
         message_bytes = args.message.encode('utf-8')
-        pqc_signature, sign_time = sign_message_pqc(algorithm, private_key, message_bytes)
+        print("Signing message with PQC...")
+        pqc_signature, sign_time = sign_message_pqc(algorithm, private_key, message_bytes,
+                                                    reporter=console_reporter)
         print()
         
         # Send hybrid transaction
@@ -7,7 +7,7 @@ import sys
 # Add scripts directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from web3 import Web3
+from web3_client import get_web3
 from contract_utils import load_contract_info
 
 GANACHE_URL = "http://127.0.0.1:8545"
@@ -16,7 +16,7 @@ def test_ganache_connection():
     """Test connection to Ganache"""
     print("Testing Ganache connection...")
     try:
-        w3 = Web3(Web3.HTTPProvider(GANACHE_URL))
+        w3 = get_web3(GANACHE_URL)
         
         if not w3.is_connected():
             print(f"❌ Failed to connect to Ganache at {GANACHE_URL}")
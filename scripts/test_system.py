@@ -16,13 +16,13 @@ sys.path.insert(0, SCRIPT_DIR)
 # Change to project root to ensure relative paths work correctly
 os.chdir(PROJECT_ROOT)
 
-from web3 import Web3
+from web3_client import get_web3, get_contract, run_concurrently
+from rpc_batch import get_blocks, get_receipts, to_int
 from contract_utils import load_contract_info, save_contract_info
-from solcx import compile_source, install_solc, set_solc_version
+from contract_build import compile_contract as build_contract, SOLIDITY_VERSION
 
 # Configuration
 GANACHE_URL = "http://127.0.0.1:8545"
-SOLIDITY_VERSION = "0.8.0"
 
 # Test results tracking
 test_results = {
@@ -55,7 +55,7 @@ def test_ganache_connection():
     
     try:
         print(f"Attempting to connect to {GANACHE_URL}...")
-        w3 = Web3(Web3.HTTPProvider(GANACHE_URL))
+        w3 = get_web3(GANACHE_URL)
         
         # Try to connect with a timeout
         try:
@@ -72,13 +72,15 @@ def test_ganache_connection():
         
         print_result(True, f"Connected to Ganache at {GANACHE_URL}")
         
-        # Get chain info
-        chain_id = w3.eth.chain_id
-        block_number = w3.eth.block_number
+        # Get chain info and accounts (independent RPCs, issued concurrently)
+        chain_id, block_number, accounts = run_concurrently([
+            lambda: w3.eth.chain_id,
+            lambda: w3.eth.block_number,
+            lambda: w3.eth.accounts,
+        ])
         print_result(True, f"Chain ID: {chain_id}, Block: {block_number}")
         
         # Check accounts
-        accounts = w3.eth.accounts
         if not accounts:
             print_result(False, "No accounts found in Ganache")
             return None
@@ -97,26 +99,10 @@ def test_ganache_connection():
         print_result(False, f"Connection error: {e}")
         return None
 
-def load_contract_source():
-    """Load the Solidity contract source code"""
-    contract_path = os.path.join(os.path.dirname(__file__), "..", "contracts", "KeyRegistry.sol")
-    if not os.path.exists(contract_path):
-        raise FileNotFoundError(f"Contract file not found: {contract_path}")
-    
-    with open(contract_path, "r") as f:
-        return f.read()
-
 def compile_contract():
-    """Compile the KeyRegistry contract"""
+    """Compile the KeyRegistry contract (cached in contracts/build/)"""
     try:
-        install_solc(SOLIDITY_VERSION)
-        set_solc_version(SOLIDITY_VERSION)
-        source_code = load_contract_source()
-        compiled = compile_source(source_code, output_values=['abi', 'bin'])
-        contract_key = f"<stdin>:KeyRegistry"
-        if contract_key not in compiled:
-            raise KeyError(f"Contract 'KeyRegistry' not found")
-        return compiled[contract_key]
+        return build_contract("KeyRegistry", SOLIDITY_VERSION)
     except Exception as e:
         raise Exception(f"Compilation failed: {e}")
 
@@ -184,7 +170,7 @@ def test_contract_interaction(w3, account, contract_address, abi):
     print_test_header("Contract Interaction")
     
     try:
-        contract = w3.eth.contract(address=contract_address, abi=abi)
+        contract = get_contract(w3, contract_address, abi)
         
         # Test 3.1: Get PQC key (may have data from previous test)
         print("\n3.1 Testing getPQCKey()...")
@@ -277,7 +263,7 @@ def test_gas_analysis(w3, contract_address, abi):
     print_test_header("Gas Usage Analysis")
     
     try:
-        contract = w3.eth.contract(address=contract_address, abi=abi)
+        contract = get_contract(w3, contract_address, abi)
         
         # Get recent transactions
         latest_block = w3.eth.block_number
@@ -285,19 +271,18 @@ def test_gas_analysis(w3, contract_address, abi):
         
         print(f"Analyzing transactions from block {start_block} to {latest_block}...")
         
-        total_gas = 0
-        tx_count = 0
+        # Blocks, then the receipts of their contract transactions, in JSON-RPC batches
+        blocks = get_blocks(w3, range(start_block, latest_block + 1), full_transactions=True)
+        tx_hashes = [
+            tx['hash']
+            for block in blocks if block is not None
+            for tx in block['transactions']
+            if tx.get('to') and tx['to'].lower() == contract_address.lower()
+        ]
+        receipts = [receipt for receipt in get_receipts(w3, tx_hashes) if receipt is not None]
         
-        for block_num in range(start_block, latest_block + 1):
-            try:
-                block = w3.eth.get_block(block_num, full_transactions=True)
-                for tx in block.transactions:
-                    if tx.to and tx.to.lower() == contract_address.lower():
-                        receipt = w3.eth.get_transaction_receipt(tx.hash)
-                        total_gas += receipt['gasUsed']
-                        tx_count += 1
-            except:
-                continue
+        total_gas = sum(to_int(receipt['gasUsed']) for receipt in receipts)
+        tx_count = len(receipts)
         
         if tx_count > 0:
             avg_gas = total_gas / tx_count
@@ -318,7 +303,7 @@ def test_error_handling(w3, contract_address, abi):
     print_test_header("Error Handling")
     
     try:
-        contract = w3.eth.contract(address=contract_address, abi=abi)
+        contract = get_contract(w3, contract_address, abi)
         
         # Test with invalid address
         print("\n5.1 Testing with invalid address...")
@@ -0,0 +1,137 @@
+"""
+Pipelined transaction submitter for gas benchmarking
+Tracks nonces locally, sends transactions back-to-back and collects receipts asynchronously
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+def _size_key(value):
+    """Hashable shape of a call argument: lengths for bytes/str, per element for lists"""
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_size_key(item) for item in value)
+    return value
+
+class TransactionSubmitter:
+    """
+    Submit many contract transactions without a round trip per nonce/gas lookup
+
+    The nonce and gas price are fetched once; gas is estimated once per
+    function and argument size (per element for array arguments) and reused. Receipts are awaited on a thread pool
+    while further transactions are being submitted.
+
+    Usage:
+        submitter = TransactionSubmitter(w3, account, contract)
+        for _ in range(100):
+            submitter.submit("logSignature", signature, message)
+        receipts = submitter.collect()
+        print(submitter.stats())
+    """
+
+    def __init__(self, w3, account, contract, gas_buffer=1.2, receipt_workers=8, timeout=120):
+        self.w3 = w3
+        self.account = account
+        self.contract = contract
+        self.gas_buffer = gas_buffer
+        self.timeout = timeout
+        self.nonce = w3.eth.get_transaction_count(account, 'pending')
+        self.gas_price = w3.eth.gas_price
+        self._estimates = {}
+        self._receipt_pool = ThreadPoolExecutor(max_workers=receipt_workers)
+        self._pending = []
+        self._submit_times = []
+        self._confirm_times = []
+        self._first_submit = None
+
+    def estimate_gas(self, fn_name, *args):
+        """
+        Node gas estimate of a call, fetched once per function and argument size
+
+        Returns:
+            int: Estimated gas (without the buffer)
+        """
+        key = (fn_name, _size_key(args))
+        estimated_gas = self._estimates.get(key)
+        if estimated_gas is None:
+            call = getattr(self.contract.functions, fn_name)(*args)
+            estimated_gas = call.estimate_gas({'from': self.account})
+            self._estimates[key] = estimated_gas
+        return estimated_gas
+
+    def _wait_for_receipt(self, tx_hash):
+        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=self.timeout, poll_latency=0.05)
+        self._confirm_times.append(time.perf_counter())
+        return receipt
+
+    def submit(self, fn_name, *args, gas=None):
+        """
+        Submit a contract transaction without waiting for it to be mined
+
+        Args:
+            fn_name: Contract function name (e.g. "logSignature", "registerPQCKey")
+            *args: Function arguments
+            gas: Gas limit (default: the buffered estimate)
+
+        Returns:
+            Transaction hash
+        """
+        call = getattr(self.contract.functions, fn_name)(*args)
+        gas_limit = gas if gas is not None else int(self.estimate_gas(fn_name, *args) * self.gas_buffer)
+
+        if self._first_submit is None:
+            self._first_submit = time.perf_counter()
+
+        try:
+            tx_hash = call.transact({
+                'from': self.account,
+                'nonce': self.nonce,
+                'gas': gas_limit,
+                'gasPrice': self.gas_price
+            })
+        except Exception:
+            # Resynchronize with the node so the next submission uses a valid nonce
+            self.nonce = self.w3.eth.get_transaction_count(self.account, 'pending')
+            raise
+
+        self.nonce += 1
+        self._submit_times.append(time.perf_counter())
+        self._pending.append(self._receipt_pool.submit(self._wait_for_receipt, tx_hash))
+        return tx_hash
+
+    def collect(self):
+        """
+        Wait for every submitted transaction to be confirmed
+
+        Returns:
+            list: Transaction receipts in submission order
+        """
+        receipts = [future.result() for future in self._pending]
+        failed = [r for r in receipts if r.status != 1]
+        if failed:
+            raise Exception(f"{len(failed)} of {len(receipts)} transaction(s) failed")
+        return receipts
+
+    def stats(self):
+        """
+        Submitted-vs-confirmed throughput for everything submitted so far
+
+        Returns:
+            dict: Counts, durations (seconds) and rates (transactions/second)
+        """
+        submitted = len(self._submit_times)
+        confirmed = len(self._confirm_times)
+        submit_duration = (self._submit_times[-1] - self._first_submit) if submitted else 0.0
+        confirm_duration = (max(self._confirm_times) - self._first_submit) if confirmed else 0.0
+        return {
+            'submitted': submitted,
+            'confirmed': confirmed,
+            'submit_duration': submit_duration,
+            'confirm_duration': confirm_duration,
+            'submitted_tps': submitted / submit_duration if submit_duration > 0 else 0,
+            'confirmed_tps': confirmed / confirm_duration if confirm_duration > 0 else 0,
+        }
+
+    def close(self):
+        """Stop the receipt collection threads"""
+        self._receipt_pool.shutdown(wait=True)
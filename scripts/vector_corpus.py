@@ -0,0 +1,398 @@
+"""
+Deterministic, versioned test-vector corpus for reproducible benchmarks
+Seeded messages of configurable sizes, keypairs, signatures and invalid signatures
+in one binary container with a fixed-size record index, read memory-mapped
+"""
+import os
+import sys
+import json
+import zlib
+import hashlib
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from algorithm_registry import SUPPORTED_ALGORITHMS, resolve_algorithm_name
+from batch_executor import BatchEngine
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_DIR = os.path.join(PROJECT_ROOT, "data", "corpus")
+
+# Container layout:
+#   magic (8 bytes) | header length (<u4) | JSON header | padding to 8 bytes |
+#   index records (VECTOR_DTYPE) | blob area (messages, keys, signatures)
+# Bump CORPUS_VERSION whenever the layout or the generation scheme changes.
+CORPUS_MAGIC = b"PQCVEC01"
+CORPUS_VERSION = 1
+
+VECTOR_KINDS = ['valid', 'tampered', 'truncated', 'wrong_key']
+INVALID_KINDS = VECTOR_KINDS[1:]
+
+DEFAULT_SEED = 0
+DEFAULT_MESSAGE_SIZES = [32, 256, 4096]
+DEFAULT_VECTORS = 64
+DEFAULT_KEYPAIRS = 8
+
+# Offsets/sizes point into the blob area; truncated and wrong_key vectors
+# reuse the blobs of their valid vector, only tampered signatures are copied
+VECTOR_DTYPE = np.dtype([
+    ('algorithm', 'u1'),
+    ('kind', 'u1'),
+    ('valid', '?'),
+    ('keypair', '<u4'),
+    ('message_offset', '<u8'),
+    ('message_size', '<u4'),
+    ('public_key_offset', '<u8'),
+    ('public_key_size', '<u4'),
+    ('private_key_offset', '<u8'),
+    ('private_key_size', '<u4'),
+    ('signature_offset', '<u8'),
+    ('signature_size', '<u4'),
+])
+
+def default_corpus_path(seed=DEFAULT_SEED):
+    """Default container path for a seed"""
+    return os.path.join(CORPUS_DIR, f"corpus_v{CORPUS_VERSION}_seed{seed}.pqcv")
+
+def _padded(length):
+    return -(-length // 8) * 8
+
+def _message_rng(seed, size):
+    # Messages depend only on (seed, size), so every algorithm signs the same bytes
+    return np.random.default_rng([CORPUS_VERSION, seed, size])
+
+def _tamper_rng(seed, algorithm):
+    return np.random.default_rng([CORPUS_VERSION, seed, zlib.crc32(algorithm.encode())])
+
+def mutate(kind, public_key, signature, rng, wrong_public_key=None):
+    """
+    Derive an invalid (public_key, signature) pair from a valid one
+
+    Args:
+        kind: 'tampered' (one bit flipped), 'truncated' (random-length prefix)
+              or 'wrong_key' (checked against wrong_public_key)
+        public_key: Public key the signature is valid for
+        signature: Valid signature bytes
+        rng: numpy Generator choosing the flipped bit / truncated length
+        wrong_public_key: Another key of the same algorithm (required for 'wrong_key')
+
+    Returns:
+        tuple: (public_key, signature) that must be rejected
+    """
+    if kind == 'tampered':
+        tampered = bytearray(signature)
+        position = int(rng.integers(len(tampered)))
+        tampered[position] ^= 1 << int(rng.integers(8))
+        return public_key, bytes(tampered)
+    if kind == 'truncated':
+        return public_key, signature[:int(rng.integers(1, len(signature)))]
+    if kind == 'wrong_key':
+        if wrong_public_key is None:
+            raise ValueError("wrong_key mutation needs a second public key")
+        return wrong_public_key, signature
+    raise ValueError(f"Unknown invalid signature kind: {kind}. Supported: {', '.join(INVALID_KINDS)}")
+
+def iter_invalid_inputs(kind, public_key, signature, seed=DEFAULT_SEED, wrong_public_key=None):
+    """Endless seeded stream of invalid (public_key, signature) pairs of one kind"""
+    rng = np.random.default_rng([CORPUS_VERSION, seed, zlib.crc32(kind.encode())])
+    while True:
+        yield mutate(kind, public_key, signature, rng, wrong_public_key)
+
+class _Blob:
+    """Append-only byte area that returns (offset, size) references"""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def add(self, value):
+        offset = len(self.data)
+        self.data += value
+        return offset, len(value)
+
+def build_corpus(path=None, algorithms=None, message_sizes=None, vectors=DEFAULT_VECTORS,
+                 keypairs=DEFAULT_KEYPAIRS, seed=DEFAULT_SEED, invalid_kinds=None, workers=None):
+    """
+    Generate a test-vector corpus and write it to a container file
+
+    Messages and invalid-signature mutations are derived from the seed. PQC key
+    generation cannot be seeded, so keypairs and signatures are recorded in the
+    container; share the container file to reproduce a run elsewhere.
+
+    Args:
+        path: Output path (default: data/corpus/corpus_v<version>_seed<seed>.pqcv)
+        algorithms: Algorithm names (default: all supported)
+        message_sizes: Message sizes in bytes
+        vectors: Valid vectors per algorithm and message size
+        keypairs: Keypairs per algorithm (vectors use them round-robin)
+        seed: Seed for messages and mutations
+        invalid_kinds: Invalid variants derived from every valid vector (default: all)
+        workers: Process pool size for keygen/signing (default: one per core)
+
+    Returns:
+        str: Path of the written container
+    """
+    path = path or default_corpus_path(seed)
+    algorithms = [resolve_algorithm_name(name) for name in (algorithms or SUPPORTED_ALGORITHMS)]
+    message_sizes = sorted(message_sizes or DEFAULT_MESSAGE_SIZES)
+    invalid_kinds = INVALID_KINDS if invalid_kinds is None else list(invalid_kinds)
+    if 'wrong_key' in invalid_kinds and keypairs < 2:
+        print("[WARNING] wrong_key vectors need at least 2 keypairs, skipping them")
+        invalid_kinds = [kind for kind in invalid_kinds if kind != 'wrong_key']
+
+    blob = _Blob()
+    records = []
+
+    # Messages are shared by every algorithm
+    messages = {}
+    for size in message_sizes:
+        rng = _message_rng(seed, size)
+        messages[size] = [blob.add(rng.bytes(size)) for _ in range(vectors)]
+    message_at = lambda ref: bytes(blob.data[ref[0]:ref[0] + ref[1]])
+
+    for algorithm_index, algorithm in enumerate(algorithms):
+        print(f"  {algorithm}: {keypairs} keypair(s), {vectors * len(message_sizes)} valid vector(s)...")
+        rng = _tamper_rng(seed, algorithm)
+        with BatchEngine(algorithm, executor="process", workers=workers) as engine:
+            public_keys, private_keys, _ = engine.keygen(keypairs)
+            key_refs = [(blob.add(pk), blob.add(sk)) for pk, sk in zip(public_keys, private_keys)]
+
+            message_refs = [ref for size in message_sizes for ref in messages[size]]
+            signers = [private_keys[i % keypairs] for i in range(len(message_refs))]
+            signatures, _ = engine.sign(signers, [message_at(ref) for ref in message_refs])
+
+        for i, (message_ref, signature) in enumerate(zip(message_refs, signatures)):
+            keypair = i % keypairs
+            (pk_ref, sk_ref) = key_refs[keypair]
+            sig_ref = blob.add(signature)
+            base = (algorithm_index, keypair, message_ref, pk_ref, sk_ref)
+            records.append(base[:1] + (VECTOR_KINDS.index('valid'), True) + base[1:] + (sig_ref,))
+
+            for kind in invalid_kinds:
+                vector_pk, vector_sig = pk_ref, sig_ref
+                if kind == 'wrong_key':
+                    vector_pk = key_refs[(keypair + 1) % keypairs][0]
+                else:
+                    _, invalid_signature = mutate(kind, None, signature, rng)
+                    if kind == 'tampered':
+                        vector_sig = blob.add(invalid_signature)
+                    else:
+                        # A prefix of the valid signature: reuse its blob
+                        vector_sig = (sig_ref[0], len(invalid_signature))
+                records.append((algorithm_index, VECTOR_KINDS.index(kind), False, keypair,
+                                message_ref, vector_pk, sk_ref, vector_sig))
+
+    index = np.zeros(len(records), dtype=VECTOR_DTYPE)
+    for i, (algorithm_index, kind, valid, keypair, message_ref, pk_ref, sk_ref, sig_ref) in enumerate(records):
+        index[i] = (algorithm_index, kind, valid, keypair, *message_ref, *pk_ref, *sk_ref, *sig_ref)
+
+    header = {
+        'version': CORPUS_VERSION,
+        'seed': seed,
+        'algorithms': algorithms,
+        'message_sizes': message_sizes,
+        'vectors': vectors,
+        'keypairs': keypairs,
+        'invalid_kinds': invalid_kinds,
+        'index_count': len(index),
+        'blob_size': len(blob.data),
+        'blob_sha256': hashlib.sha256(blob.data).hexdigest(),
+        'created': datetime.now().isoformat(),
+    }
+    header_bytes = json.dumps(header).encode('utf-8')
+    prefix_size = len(CORPUS_MAGIC) + 4 + len(header_bytes)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(CORPUS_MAGIC)
+        f.write(len(header_bytes).to_bytes(4, 'little'))
+        f.write(header_bytes)
+        f.write(b"\0" * (_padded(prefix_size) - prefix_size))
+        index.tofile(f)
+        f.write(blob.data)
+    os.replace(tmp, path)
+    return path
+
+class VectorCorpus:
+    """
+    Read-only, memory-mapped view of a corpus container
+
+    Vectors are dicts with algorithm, kind, valid, keypair, message,
+    public_key, private_key and signature; only the vectors iterated over
+    are read from disk.
+
+    Usage:
+        corpus = VectorCorpus(path)
+        for batch in corpus.batches(256, algorithm="dilithium3", kind="valid"):
+            ...
+    """
+
+    def __init__(self, path, verify=False):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(CORPUS_MAGIC)) != CORPUS_MAGIC:
+                raise ValueError(f"{path} is not a test-vector corpus")
+            header_size = int.from_bytes(f.read(4), 'little')
+            self.header = json.loads(f.read(header_size).decode('utf-8'))
+        if self.header['version'] != CORPUS_VERSION:
+            raise ValueError(f"Corpus version {self.header['version']} is not supported "
+                             f"(expected {CORPUS_VERSION}); regenerate it with vector_corpus.py")
+
+        index_offset = _padded(len(CORPUS_MAGIC) + 4 + header_size)
+        blob_offset = index_offset + self.header['index_count'] * VECTOR_DTYPE.itemsize
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        self.index = data[index_offset:blob_offset].view(VECTOR_DTYPE)
+        self.blob = data[blob_offset:blob_offset + self.header['blob_size']]
+        self.algorithms = self.header['algorithms']
+
+        if verify and hashlib.sha256(self.blob).hexdigest() != self.header['blob_sha256']:
+            raise ValueError(f"{path} is corrupted (blob checksum mismatch)")
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def digest(self):
+        return self.header['blob_sha256']
+
+    def select(self, algorithm=None, kind=None, message_size=None):
+        """
+        Positions of the vectors matching every given filter
+
+        Returns:
+            numpy int array of vector positions
+        """
+        mask = np.ones(len(self.index), dtype=bool)
+        if algorithm is not None:
+            algorithm = resolve_algorithm_name(algorithm)
+            if algorithm not in self.algorithms:
+                return np.empty(0, dtype=np.int64)
+            mask &= self.index['algorithm'] == self.algorithms.index(algorithm)
+        if kind is not None:
+            mask &= self.index['kind'] == VECTOR_KINDS.index(kind)
+        if message_size is not None:
+            mask &= self.index['message_size'] == message_size
+        return np.flatnonzero(mask)
+
+    def _bytes(self, offset, size):
+        return self.blob[offset:offset + size].tobytes()
+
+    def vector(self, position):
+        """Materialize one vector as a dict"""
+        record = self.index[position]
+        return {
+            'algorithm': self.algorithms[record['algorithm']],
+            'kind': VECTOR_KINDS[record['kind']],
+            'valid': bool(record['valid']),
+            'keypair': int(record['keypair']),
+            'message': self._bytes(record['message_offset'], record['message_size']),
+            'public_key': self._bytes(record['public_key_offset'], record['public_key_size']),
+            'private_key': self._bytes(record['private_key_offset'], record['private_key_size']),
+            'signature': self._bytes(record['signature_offset'], record['signature_size']),
+        }
+
+    def iter_vectors(self, algorithm=None, kind=None, message_size=None):
+        """Stream matching vectors one at a time"""
+        for position in self.select(algorithm, kind, message_size):
+            yield self.vector(position)
+
+    def batches(self, batch_size, algorithm=None, kind=None, message_size=None):
+        """Stream matching vectors in lists of up to batch_size"""
+        positions = self.select(algorithm, kind, message_size)
+        for start in range(0, len(positions), batch_size):
+            yield [self.vector(position) for position in positions[start:start + batch_size]]
+
+    def inputs(self, algorithm, count=None, kind='valid', message_size=None):
+        """
+        Columns of the first `count` matching vectors
+
+        Returns:
+            tuple: (public_keys, private_keys, messages, signatures) lists of bytes
+        """
+        vectors = [self.vector(position) for position in self.select(algorithm, kind, message_size)[:count]]
+        return ([v['public_key'] for v in vectors], [v['private_key'] for v in vectors],
+                [v['message'] for v in vectors], [v['signature'] for v in vectors])
+
+    def describe(self):
+        counts = np.bincount(self.index['kind'], minlength=len(VECTOR_KINDS))
+        kinds = ", ".join(f"{counts[i]} {kind}" for i, kind in enumerate(VECTOR_KINDS) if counts[i])
+        return (f"corpus v{self.header['version']} seed {self.header['seed']} ({self.digest[:12]}): "
+                f"{len(self)} vectors ({kinds}), {len(self.algorithms)} algorithm(s), "
+                f"message sizes {self.header['message_sizes']}")
+
+def main():
+    """Generate a corpus from the command line"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a seeded PQC test-vector corpus")
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        default=SUPPORTED_ALGORITHMS,
+        help=f"Algorithms to include (default: all). Available: {', '.join(SUPPORTED_ALGORITHMS)}"
+    )
+    parser.add_argument(
+        "--message-sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_MESSAGE_SIZES,
+        help=f"Message sizes in bytes (default: {' '.join(map(str, DEFAULT_MESSAGE_SIZES))})"
+    )
+    parser.add_argument(
+        "--vectors",
+        type=int,
+        default=DEFAULT_VECTORS,
+        help=f"Valid vectors per algorithm and message size (default: {DEFAULT_VECTORS})"
+    )
+    parser.add_argument(
+        "--keypairs",
+        type=int,
+        default=DEFAULT_KEYPAIRS,
+        help=f"Keypairs per algorithm (default: {DEFAULT_KEYPAIRS})"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"Seed for messages and invalid-signature mutations (default: {DEFAULT_SEED})"
+    )
+    parser.add_argument(
+        "--invalid-kinds",
+        nargs="*",
+        choices=INVALID_KINDS,
+        default=INVALID_KINDS,
+        help="Invalid variants derived from every valid vector (default: all)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Process pool size for key generation and signing (default: one per core)"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Output path (default: data/corpus/corpus_v<version>_seed<seed>.pqcv)"
+    )
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("PQC Test-Vector Corpus Generation")
+    print("=" * 60)
+    try:
+        path = build_corpus(args.output, args.algorithms, args.message_sizes, args.vectors, args.keypairs,
+                            args.seed, args.invalid_kinds, args.workers)
+    except Exception as e:
+        print(f"[ERROR] Corpus generation failed: {e}")
+        sys.exit(1)
+
+    corpus = VectorCorpus(path, verify=True)
+    print(f"[OK] {corpus.describe()}")
+    print(f"[OK] Corpus saved to: {path} ({os.path.getsize(path):,} bytes)")
+
+if __name__ == "__main__":
+    main()
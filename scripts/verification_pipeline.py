@@ -0,0 +1,396 @@
+"""
+Parallel streaming verification pipeline for on-chain PQC signatures
+Stages: event fetch -> key resolution -> verification worker pool -> batched results writer
+"""
+import time
+import queue
+import itertools
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from algorithm_registry import get_algorithm
+from event_indexer import iter_event_pages, fetch_block_events, DEFAULT_PAGE_SIZE
+
+# Bounded queue sizes between stages (items), verify chunk size (signatures)
+EVENT_QUEUE_SIZE = 1024
+RESULT_QUEUE_SIZE = 1024
+VERIFY_CHUNK_SIZE = 16
+WRITE_BATCH_SIZE = 256
+
+_DONE = object()
+
+def verify_chunk(tasks):
+    """
+    Verify a chunk of signatures (runs inside a pool worker)
+
+    Args:
+        tasks: List of (candidates, public_key, message, signature); candidates
+               are algorithm names tried in order until one accepts
+
+    Returns:
+        list: (algorithm_name, is_valid, verify_time_seconds) per task
+    """
+    results = []
+    for candidates, public_key, message, signature in tasks:
+        algorithm_name, is_valid, verify_time = candidates[0], False, 0.0
+        for candidate in candidates:
+            alg = get_algorithm(candidate)
+            start = time.perf_counter()
+            try:
+                is_valid = alg.verify(public_key, message, signature)
+            except Exception:
+                is_valid = False
+            verify_time += time.perf_counter() - start
+            algorithm_name = candidate
+            if is_valid:
+                break
+        results.append((algorithm_name, is_valid, verify_time))
+    return results
+
+def record_skipped(pending, event):
+    """
+    Remember an event skipped for lack of a registered key
+
+    Args:
+        pending: Address -> block numbers of skipped events (updated in place)
+        event: PQCSignature event
+    """
+    blocks = pending.setdefault(event['args']['from'], [])
+    if event['blockNumber'] not in blocks:
+        blocks.append(event['blockNumber'])
+
+def collect_retry_events(contract, pending, start_block, key_cache):
+    """
+    Pick the previously skipped events that can be verified now
+
+    An event is retried once its sender has a registered key. Pending events at
+    or after start_block are dropped, as the scan from start_block sees them again.
+
+    Args:
+        contract: KeyRegistry contract object
+        pending: Address -> block numbers of skipped events (from event_indexer.load_pending)
+        start_block: First block of this run's scan
+        key_cache: PublicKeyCache used for key resolution
+
+    Returns:
+        tuple: (events to retry, address -> block numbers still pending)
+    """
+    earlier = {address: [b for b in blocks if b < start_block] for address, blocks in pending.items()}
+    earlier = {address: blocks for address, blocks in earlier.items() if blocks}
+    if not earlier:
+        return [], {}
+
+    key_cache.prefetch(earlier)
+    ready = {address for address in earlier if key_cache.get(address) is not None}
+    still_pending = {address: blocks for address, blocks in earlier.items() if address not in ready}
+    blocks = [b for address in ready for b in earlier[address]]
+    retry_events = [event for event in fetch_block_events(contract, blocks) if event['args']['from'] in ready]
+    return retry_events, still_pending
+
+class _PageTracker:
+    """Tracks per-page completion so checkpoints only advance over finished pages"""
+
+    def __init__(self, on_page_complete):
+        self.on_page_complete = on_page_complete
+        self.expected = {}
+        self.done = {}
+        self.page_ends = {}
+        self.next_page = 0
+
+    def page_closed(self, seq, page_end, count):
+        self.expected[seq] = count
+        self.page_ends[seq] = page_end
+        self._advance()
+
+    def item_done(self, seq):
+        self.done[seq] = self.done.get(seq, 0) + 1
+        self._advance()
+
+    def _advance(self):
+        while self.next_page in self.expected and self.done.get(self.next_page, 0) >= self.expected[self.next_page]:
+            seq = self.next_page
+            if self.on_page_complete is not None:
+                self.on_page_complete(self.page_ends[seq])
+            del self.expected[seq], self.page_ends[seq]
+            self.done.pop(seq, None)
+            self.next_page += 1
+
+def run_verification_pipeline(w3, contract, start_block, head_block, key_cache, detect_algorithm,
+                              write_rows, algorithm=None, workers=None, executor="process",
+                              page_size=DEFAULT_PAGE_SIZE, on_page_complete=None, retry_events=None,
+                              on_skip=None):
+    """
+    Verify every PQCSignature event in a block range on a worker pool
+
+    Args:
+        w3: Web3 instance
+        contract: KeyRegistry contract object
+        start_block: First block to fetch
+        head_block: Last block to fetch
+        key_cache: PublicKeyCache used for key resolution
+        detect_algorithm: Callable(public_key, signature) -> candidate algorithm names, cheapest
+                          first (empty rejects the signature unverified)
+        write_rows: Callable(list of result dicts) that persists a batch before returning
+        algorithm: Fixed algorithm name (default: auto-detect per event)
+        workers: Number of verification workers
+        executor: "process" or "thread" verification pool
+        page_size: Number of blocks per get_logs request
+        on_page_complete: Callable(page_end_block) once a page is fully written
+        retry_events: Events skipped on an earlier run, verified first as a page ending
+                      at start_block - 1 (see collect_retry_events)
+        on_skip: Callable(event) for each event skipped for lack of a key, called
+                 before the page holding it completes
+
+    Returns:
+        dict: Counts of total, valid, invalid and skipped signatures plus elapsed time
+    """
+    pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    event_q = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+    result_q = queue.Queue(maxsize=RESULT_QUEUE_SIZE)
+    in_flight = threading.Semaphore((workers or 1) * 2)
+    errors = []
+    # Set on the first failure: stages stop producing and nothing further is written,
+    # so no checkpoint can move past signatures that were not verified
+    stop = threading.Event()
+
+    def fail(error):
+        errors.append(error)
+        stop.set()
+    counts = {'total': 0, 'valid': 0, 'invalid': 0, 'skipped': 0}
+    start_time = time.perf_counter()
+
+    def fetch_stage():
+        try:
+            seq = 0
+            pages = iter_event_pages(w3, contract, start_block, head_block, page_size)
+            if retry_events:
+                pages = itertools.chain([(None, start_block - 1, retry_events)], pages)
+            for _, page_end, events in pages:
+                if stop.is_set():
+                    break
+                # Resolve the page's uncached keys with concurrent calls before it is queued
+                key_cache.prefetch(event['args']['from'] for event in events)
+                for event in events:
+                    event_q.put((seq, event))
+                event_q.put((seq, ('page', page_end, len(events))))
+                seq += 1
+        except Exception as e:
+            fail(e)
+        finally:
+            event_q.put(_DONE)
+
+    def submit_chunk(pool, chunk):
+        in_flight.acquire()
+        metas = [meta for meta, _ in chunk]
+        future = pool.submit(verify_chunk, [task for _, task in chunk])
+
+        def forward(done_future):
+            in_flight.release()
+            try:
+                outcomes = done_future.result()
+            except Exception as e:
+                # The chunk was never verified: emit no rows and leave its events
+                # outstanding so their page (and every later one) never completes
+                fail(e)
+                return
+            for meta, outcome in zip(metas, outcomes):
+                result_q.put(('result', meta, outcome))
+
+        future.add_done_callback(forward)
+
+    def resolve_stage(pool):
+        chunk = []
+        item = None
+        try:
+            while True:
+                item = event_q.get()
+                if item is _DONE or stop.is_set():
+                    break
+                seq, event = item
+                if isinstance(event, tuple):
+                    # Page boundary: flush pending work so the page can complete promptly
+                    if chunk:
+                        submit_chunk(pool, chunk)
+                        chunk = []
+                    result_q.put(('page', seq, event[1], event[2]))
+                    continue
+
+                user_address = event['args']['from']
+                signature = event['args']['signature']
+                message = event['args']['message']
+                public_key = key_cache.get(user_address)
+                if public_key is None:
+                    result_q.put(('skip', seq, event))
+                    continue
+
+                candidates = [algorithm] if algorithm else detect_algorithm(public_key, signature)
+                meta = {
+                    'seq': seq,
+                    'candidates': candidates,
+                    'public_key_size': len(public_key),
+                    'signature_size': len(signature),
+                    'block_number': event['blockNumber'],
+                }
+                if not candidates:
+                    # Sizes match no supported algorithm: reject without a verification call
+                    result_q.put(('result', meta, ('unknown', False, 0.0)))
+                    continue
+                chunk.append((meta, (candidates, public_key, message, signature)))
+                if len(chunk) >= VERIFY_CHUNK_SIZE:
+                    submit_chunk(pool, chunk)
+                    chunk = []
+            if chunk and not stop.is_set():
+                submit_chunk(pool, chunk)
+        except Exception as e:
+            fail(e)
+        if item is not _DONE:
+            # Unblock the fetch stage so it can exit
+            while event_q.get() is not _DONE:
+                pass
+
+    def writer_stage():
+        tracker = _PageTracker(on_page_complete)
+        pending_rows = []
+        pending_seqs = []
+        item = None
+
+        def flush():
+            if pending_rows:
+                write_rows(pending_rows)
+                pending_rows.clear()
+            for seq in pending_seqs:
+                tracker.item_done(seq)
+            pending_seqs.clear()
+
+        try:
+            while True:
+                item = result_q.get()
+                if item is _DONE or stop.is_set():
+                    break
+                kind = item[0]
+                if kind == 'page':
+                    _, seq, page_end, count = item
+                    # Written rows must be flushed before the page can count as complete
+                    flush()
+                    tracker.page_closed(seq, page_end, count)
+                    print(f"  Blocks up to {page_end}: {counts['total']} signature(s) processed")
+                elif kind == 'skip':
+                    _, seq, event = item
+                    counts['total'] += 1
+                    counts['skipped'] += 1
+                    if on_skip is not None:
+                        on_skip(event)
+                    pending_seqs.append(seq)
+                else:
+                    _, meta, (algorithm_name, is_valid, verify_time) = item
+                    counts['total'] += 1
+                    counts['valid' if is_valid else 'invalid'] += 1
+                    pending_rows.append({
+                        'algorithm': algorithm_name,
+                        'keygen_time': '',  # Not available from events
+                        'sign_time': '',    # Not available from events
+                        'verify_time': f"{verify_time:.6f}",
+                        'public_key_size': meta['public_key_size'],
+                        'signature_size': meta['signature_size'],
+                        'gas_used': '',  # Would need to fetch from transaction
+                        'valid': is_valid,
+                        'block_number': meta['block_number']
+                    })
+                    pending_seqs.append(meta['seq'])
+                    if len(pending_rows) >= WRITE_BATCH_SIZE:
+                        flush()
+            if not stop.is_set():
+                flush()
+        except Exception as e:
+            fail(e)
+        if item is not _DONE:
+            # Keep draining so verification callbacks never block on a full queue
+            while result_q.get() is not _DONE:
+                pass
+
+    with pool_cls(max_workers=workers) as pool:
+        # Start the workers before any stage thread exists, so processes are never forked mid-I/O
+        list(pool.map(verify_chunk, [[]] * (workers or 1)))
+
+        fetcher = threading.Thread(target=fetch_stage, name="pipeline-fetch", daemon=True)
+        writer = threading.Thread(target=writer_stage, name="pipeline-writer", daemon=True)
+        fetcher.start()
+        writer.start()
+
+        # Key resolution stays on this thread; the fetch stage only prefetches into the cache
+        resolve_stage(pool)
+    # Pool shutdown waited for every verification callback; close the writer
+    fetcher.join()
+    result_q.put(_DONE)
+    writer.join()
+
+    if errors:
+        raise errors[0]
+
+    counts['elapsed'] = time.perf_counter() - start_time
+    return counts
+
+def run_corpus_verification(corpus, detect_algorithm, write_rows, algorithm=None, workers=None,
+                            executor="process", kind=None):
+    """
+    Verify test vectors streamed from a corpus on a worker pool
+
+    Same verification and result rows as the event pipeline, with inputs read
+    from a VectorCorpus instead of the chain. Every outcome is compared with
+    the vector's expected validity.
+
+    Args:
+        corpus: VectorCorpus to stream from
+        detect_algorithm: Callable(public_key, signature) -> candidate algorithm names
+        write_rows: Callable(list of result dicts) that persists a batch before returning
+        algorithm: Only verify vectors of this algorithm (default: every algorithm, auto-detected)
+        workers: Number of verification workers
+        executor: "process" or "thread" verification pool
+        kind: Only verify vectors of this kind (default: all kinds)
+
+    Returns:
+        dict: Counts of total, valid, invalid and mismatched (outcome differs from
+              the expected validity) vectors plus elapsed time
+    """
+    pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    counts = {'total': 0, 'valid': 0, 'invalid': 0, 'mismatched': 0}
+    start_time = time.perf_counter()
+
+    with pool_cls(max_workers=workers) as pool:
+        for batch in corpus.batches(WRITE_BATCH_SIZE, algorithm=algorithm, kind=kind):
+            tasks, outcomes = [], [None] * len(batch)
+            for i, vector in enumerate(batch):
+                candidates = [algorithm] if algorithm else detect_algorithm(vector['public_key'], vector['signature'])
+                if candidates:
+                    tasks.append((i, (candidates, vector['public_key'], vector['message'], vector['signature'])))
+                else:
+                    outcomes[i] = ('unknown', False, 0.0)
+
+            chunks = [tasks[j:j + VERIFY_CHUNK_SIZE] for j in range(0, len(tasks), VERIFY_CHUNK_SIZE)]
+            for chunk, chunk_outcomes in zip(chunks, pool.map(verify_chunk, [[task for _, task in chunk]
+                                                                              for chunk in chunks])):
+                for (i, _), outcome in zip(chunk, chunk_outcomes):
+                    outcomes[i] = outcome
+
+            rows = []
+            for vector, (algorithm_name, is_valid, verify_time) in zip(batch, outcomes):
+                counts['total'] += 1
+                counts['valid' if is_valid else 'invalid'] += 1
+                if is_valid != vector['valid']:
+                    counts['mismatched'] += 1
+                rows.append({
+                    'algorithm': algorithm_name,
+                    'keygen_time': '',
+                    'sign_time': '',
+                    'verify_time': f"{verify_time:.6f}",
+                    'public_key_size': len(vector['public_key']),
+                    'signature_size': len(vector['signature']),
+                    'gas_used': '',
+                    'valid': is_valid,
+                    'block_number': '',  # Corpus vectors are not on chain
+                })
+            write_rows(rows)
+            print(f"  {counts['total']} vector(s) processed")
+
+    counts['elapsed'] = time.perf_counter() - start_time
+    return counts
@@ -4,7 +4,6 @@ Generates publication-ready charts and graphs
 """
 import os
 import sys
-import json
 from datetime import datetime
 
 # Get project root and change to it
@@ -12,6 +11,7 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 os.chdir(PROJECT_ROOT)
 
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "scripts"))
+from sample_store import load_results_index, load_samples
 
 RESULTS_DIR = os.path.join(PROJECT_ROOT, "data", "benchmarks")
 FIGURES_DIR = os.path.join(PROJECT_ROOT, "data", "figures")
@@ -44,8 +44,7 @@ def load_latest_benchmark():
     latest_file = sorted(benchmark_files)[-1]
     filepath = os.path.join(RESULTS_DIR, latest_file)
     
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    return load_results_index(filepath)
 
 def add_value_labels_to_bars(ax, bars, values, is_size_chart=False):
     """
@@ -483,6 +482,74 @@ def create_pqc_vs_ecdsa_chart(benchmark_data, save_path=None):
     print(f"[OK] PQC vs ECDSA comparison chart saved to: {save_path}")
     return save_path
 
+def create_timing_distribution_chart(benchmark_data, save_path=None):
+    """
+    Create signing/verification timing distribution box plots
+    
+    Raw samples are read from the results' samples file only here; every
+    other chart uses the JSON summaries.
+    
+    Args:
+        benchmark_data: Loaded benchmark JSON data
+        save_path: Path to save figure (optional)
+    
+    Returns:
+        str: Path to saved figure
+    """
+    if not MATPLOTLIB_AVAILABLE:
+        print("[SKIP] Matplotlib not available, skipping chart generation")
+        return None
+    
+    results = benchmark_data.get('results', [])
+    operations = [('signing', 'Signing'), ('verification', 'Verification')]
+    
+    # Extract per-algorithm samples (ms)
+    distributions = {}
+    for key, _ in operations:
+        labels, samples = [], []
+        for result in results:
+            entry = result.get(key)
+            if not entry:
+                continue
+            times = load_samples(benchmark_data, entry)
+            if times is None or len(times) == 0:
+                continue
+            labels.append(result.get('algorithm', 'unknown').upper().replace('_', '-'))
+            samples.append(np.asarray(times, dtype=np.float64) * 1000)
+        distributions[key] = (labels, samples)
+    
+    if not any(samples for _, samples in distributions.values()):
+        print("[WARNING] No raw timing samples recorded, skipping distribution chart")
+        return None
+    
+    # Create figure
+    fig, axes = plt.subplots(1, len(operations), figsize=(14, 6))
+    
+    for ax, (key, title) in zip(axes, operations):
+        labels, samples = distributions[key]
+        if not samples:
+            ax.set_visible(False)
+            continue
+        ax.boxplot(samples, showfliers=True, flierprops={'markersize': 2, 'alpha': 0.4})
+        ax.set_xticks(range(1, len(labels) + 1))
+        ax.set_xticklabels(labels, rotation=45, ha='right')
+        ax.set_title(f'{title} Time Distribution', fontsize=13, fontweight='bold')
+        ax.set_ylabel('Time (milliseconds, log scale)', fontsize=12, fontweight='bold')
+        ax.set_yscale('log')
+        ax.grid(axis='y', alpha=0.3)
+    
+    plt.tight_layout()
+    
+    if save_path is None:
+        save_path = os.path.join(FIGURES_DIR, 'timing_distribution.png')
+    
+    ensure_figures_directory()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+    
+    print(f"[OK] Timing distribution chart saved to: {save_path}")
+    return save_path
+
 def generate_all_charts(benchmark_data=None):
     """
     Generate all charts for research paper
@@ -531,6 +598,12 @@ def generate_all_charts(benchmark_data=None):
     if fig4:
         figures.append(fig4)
     
+    # 5. Timing distributions (raw samples)
+    print("5. Generating timing distribution chart...")
+    fig5 = create_timing_distribution_chart(benchmark_data)
+    if fig5:
+        figures.append(fig5)
+    
     print("\n" + "="*70)
     print(f"[SUCCESS] Generated {len(figures)} chart(s)")
     print("="*70)
@@ -564,8 +637,7 @@ def main():
     
     # Load benchmark data
     if args.benchmark_file:
-        with open(args.benchmark_file, 'r') as f:
-            benchmark_data = json.load(f)
+        benchmark_data = load_results_index(args.benchmark_file)
     else:
         benchmark_data = load_latest_benchmark()
         if not benchmark_data:
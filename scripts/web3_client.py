@@ -0,0 +1,111 @@
+"""
+Shared Web3 clients for every script
+One keep-alive HTTP connection pool per RPC URL, cached contract objects and a
+helper to issue independent RPCs concurrently over the pool (see rpc_batch.py
+for coalescing many reads into JSON-RPC batch payloads)
+"""
+import weakref
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+
+DEFAULT_RPC_URL = "http://127.0.0.1:8545"
+
+# Keep-alive connections per RPC URL (also the default RPC concurrency)
+POOL_SIZE = 16
+REQUEST_TIMEOUT = 60
+
+_CLIENTS = {}
+_SESSIONS = {}
+_CONTRACTS = {}
+_LOCK = threading.Lock()
+
+def _pooled_session(pool_size=POOL_SIZE):
+    """requests session that keeps up to pool_size connections alive"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def get_web3(url=DEFAULT_RPC_URL):
+    """
+    Get the shared Web3 client for an RPC URL
+
+    The first call creates the client; later calls (from any thread) reuse it
+    and its keep-alive connections.
+
+    Args:
+        url: JSON-RPC endpoint
+
+    Returns:
+        Web3 instance
+    """
+    w3 = _CLIENTS.get(url)
+    if w3 is None:
+        with _LOCK:
+            w3 = _CLIENTS.get(url)
+            if w3 is None:
+                session = _pooled_session()
+                provider = Web3.HTTPProvider(url, request_kwargs={'timeout': REQUEST_TIMEOUT}, session=session)
+                w3 = Web3(provider)
+                _SESSIONS[url] = session
+                _CLIENTS[url] = w3
+    return w3
+
+def get_session(url=DEFAULT_RPC_URL):
+    """Get the pooled requests session behind the shared client for an RPC URL"""
+    get_web3(url)
+    return _SESSIONS[url]
+
+def get_contract(w3, address, abi):
+    """
+    Get a cached contract object
+
+    Args:
+        w3: Web3 instance
+        address: Contract address
+        abi: Contract ABI
+
+    Returns:
+        Contract object, built once per client, address and ABI
+    """
+    key = (id(w3), address)
+    cached = _CONTRACTS.get(key)
+    # The id of a collected client can be reused by a new one; the weak reference
+    # tells them apart. A different ABI for the same address (e.g. after a redeploy)
+    # replaces the entry.
+    if cached is not None and cached[0]() is w3 and (cached[1] is abi or cached[1] == abi):
+        return cached[2]
+    contract = w3.eth.contract(address=address, abi=abi)
+    _CONTRACTS[key] = (weakref.ref(w3), abi, contract)
+    return contract
+
+def run_concurrently(calls, workers=POOL_SIZE):
+    """
+    Run independent RPC calls concurrently over the shared connection pool
+
+    Args:
+        calls: Zero-argument callables (e.g. lambda: w3.eth.get_block(n))
+        workers: Maximum calls in flight
+
+    Returns:
+        list: Results in the order of calls; the first exception is re-raised
+    """
+    calls = list(calls)
+    if len(calls) <= 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=min(workers, len(calls))) as pool:
+        return list(pool.map(lambda call: call(), calls))
+
+def close_clients():
+    """Close every pooled connection (the clients are rebuilt on next use)"""
+    with _LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+        _CLIENTS.clear()
+        _CONTRACTS.clear()
@@ -0,0 +1,38 @@
+"""Tests for algorithm name resolution and size-based identification"""
+import pytest
+
+from algorithm_registry import ALGORITHMS, get_algorithm_info, identify_algorithm, resolve_algorithm_name
+
+
+@pytest.mark.parametrize("name,info", [(n, i) for n, i in ALGORITHMS.items() if "signature_size_range" not in i])
+def test_fixed_size_algorithms_identified_exactly(name, info):
+    public_key = bytes(info["public_key_size"])
+    signature = bytes(info["signature_size"])
+    candidates = identify_algorithm(public_key, signature)
+    assert name in candidates
+    assert name not in identify_algorithm(public_key, bytes(info["signature_size"] + 1))
+
+
+def test_falcon_accepts_variable_signature_lengths():
+    public_key = bytes(ALGORITHMS["falcon512"]["public_key_size"])
+    low, high = ALGORITHMS["falcon512"]["signature_size_range"]
+    assert identify_algorithm(public_key, bytes(low)) == ["falcon512"]
+    assert identify_algorithm(public_key, bytes(high)) == ["falcon512"]
+    assert identify_algorithm(public_key, bytes(high + 1)) == []
+
+
+def test_shared_public_key_size_ordered_by_verify_cost():
+    # Both SPHINCS+ parameter sets have 64-byte public keys; only the signature length differs
+    assert identify_algorithm(bytes(64), bytes(29792)) == ["sphincs128f"]
+    assert identify_algorithm(bytes(64), bytes(49856)) == ["sphincs_fast"]
+
+
+def test_unknown_lengths_rejected():
+    assert identify_algorithm(b"\x00" * 10, b"\x00" * 10) == []
+
+
+def test_aliases_resolve_to_canonical_names():
+    assert resolve_algorithm_name("mldsa65") == "dilithium3"
+    assert get_algorithm_info("falcon_512") is ALGORITHMS["falcon512"]
+    with pytest.raises(ValueError):
+        resolve_algorithm_name("rsa")
@@ -0,0 +1,58 @@
+"""Tests for the chunked batch engine (no QuantCrypt: a fake algorithm is injected)"""
+import pytest
+
+import batch_executor
+from batch_executor import BatchEngine, _chunk_bounds, CHUNKS_PER_WORKER
+
+
+class FakeAlgorithm:
+    def keygen(self):
+        return b"pk", b"sk"
+
+    def sign(self, private_key, message):
+        return b"sig:" + message
+
+    def verify(self, public_key, message, signature):
+        if signature == b"raise":
+            raise ValueError("malformed")
+        return signature == b"sig:" + message
+
+
+@pytest.fixture
+def fake_algorithm(monkeypatch):
+    monkeypatch.setattr(batch_executor, "get_algorithm", lambda name: FakeAlgorithm())
+
+
+@pytest.mark.parametrize("total,workers", [(1, 1), (7, 2), (64, 4), (1000, 3), (5, 16)])
+def test_chunk_bounds_cover_range_contiguously(total, workers):
+    bounds = _chunk_bounds(total, workers)
+    assert bounds[0][0] == 0
+    assert bounds[-1][1] == total
+    for (_, end), (start, _) in zip(bounds, bounds[1:]):
+        assert end == start
+    assert all(end > start for start, end in bounds)
+    assert len(bounds) <= workers * CHUNKS_PER_WORKER
+
+
+def test_chunk_bounds_empty():
+    assert _chunk_bounds(0, 4) == []
+
+
+def test_unknown_executor_rejected():
+    with pytest.raises(ValueError):
+        BatchEngine("dilithium3", executor="fiber")
+
+
+def test_thread_engine_preserves_input_order(fake_algorithm):
+    messages = [f"m{i}".encode() for i in range(37)]
+    with BatchEngine("fake", executor="thread", workers=3) as engine:
+        public_keys, private_keys, times = engine.keygen(37)
+        signatures, sign_times = engine.sign(private_keys, messages)
+        signatures[5] = b"raise"
+        signatures[9] = b"sig:wrong"
+        results, verify_times = engine.verify(public_keys, messages, signatures)
+
+    assert len(public_keys) == len(times) == 37
+    assert signatures[0] == b"sig:m0" and signatures[36] == b"sig:m36"
+    assert len(sign_times) == len(verify_times) == 37
+    assert [i for i, ok in enumerate(results) if not ok] == [5, 9]
@@ -0,0 +1,66 @@
+"""Tests for the chain backends; the eth-tester tests skip without eth-tester[py-evm]"""
+import pytest
+
+import chain_backend
+from chain_backend import ETH_TESTER_AVAILABLE, connect, load_registry
+from contract_build import OFFLINE_ENV, compile_contract
+from gas_model import calldata, intrinsic_gas
+
+needs_eth_tester = pytest.mark.skipif(not ETH_TESTER_AVAILABLE, reason="eth-tester[py-evm] not installed")
+
+# logSignature with a 2420-byte dilithium2 signature and the 151-byte benchmark message,
+# measured on Ganache (data/benchmarks/benchmark_20251215_223916.json, random signature bytes)
+GANACHE_LOG_SIGNATURE_GAS = 94431
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError, match="Unknown chain backend"):
+        connect("hardhat")
+
+
+def test_ganache_registry_comes_from_deploy_info(monkeypatch):
+    monkeypatch.setattr(chain_backend, "load_contract_info", lambda name: (f"0x{name}", ["abi"]))
+    assert load_registry(None, "ganache", "KeyRegistryCommitted") == ("0xKeyRegistryCommitted", ["abi"])
+
+
+@needs_eth_tester
+def test_eth_tester_runs_ganache_hardfork():
+    w3 = connect("eth-tester")
+    assert connect("eth-tester") is w3
+    # 1000 non-zero calldata bytes: Shanghai charges 16 gas each, Prague's floor would charge 40
+    data = b"\x01" * 1000
+    tx_hash = w3.eth.send_transaction({'from': w3.eth.accounts[0], 'to': w3.eth.accounts[1], 'data': data})
+    assert w3.eth.wait_for_transaction_receipt(tx_hash)['gasUsed'] == 21000 + 16 * len(data)
+
+
+@needs_eth_tester
+def test_deploy_register_and_log_signature_gas(monkeypatch):
+    monkeypatch.setenv(OFFLINE_ENV, "1")
+    try:
+        compile_contract("KeyRegistry")
+    except Exception as e:
+        pytest.skip(f"KeyRegistry cannot be built offline: {e}")
+
+    w3 = connect("eth-tester")
+    contract_address, abi = load_registry(w3, "eth-tester")
+    assert load_registry(w3, "eth-tester") == (contract_address, abi)
+    contract = w3.eth.contract(address=contract_address, abi=abi)
+    account = w3.eth.accounts[2]
+
+    public_key = b"\x01" * 1312
+    receipt = w3.eth.wait_for_transaction_receipt(
+        contract.functions.registerPQCKey(public_key).transact({'from': account}))
+    assert receipt.status == 1
+    assert contract.functions.getPQCKey(account).call() == public_key
+
+    signature = b"\x02" * 2420
+    message = b"Benchmark test message for research paper analysis" + b"x" * 100
+    receipt = w3.eth.wait_for_transaction_receipt(
+        contract.functions.logSignature(signature, message).transact({'from': account}))
+    assert receipt.status == 1
+    gas = receipt['gasUsed']
+
+    # No calldata floor (it would dominate this call), and within the zero-byte and
+    # dispatch differences of the Ganache measurement
+    assert gas < intrinsic_gas(calldata('logSignature', payloads=(signature, message)), floor=True)[1]
+    assert abs(gas - GANACHE_LOG_SIGNATURE_GAS) <= GANACHE_LOG_SIGNATURE_GAS * 0.01
@@ -0,0 +1,56 @@
+"""Tests for key resolution against the hash-committed registry"""
+from types import SimpleNamespace
+
+import pytest
+
+import committed_registry
+from committed_registry import CommittedKeyCache, key_commitment, register_committed_key
+from test_key_cache import FakeRegistry, registrations
+from test_tx_submitter import FakeEth
+
+
+def test_key_commitment_is_keccak256():
+    assert key_commitment(b"").hex() == "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"
+
+
+@pytest.fixture
+def published(monkeypatch):
+    events = registrations(("0xA", b"first"), ("0xA", b"second"), ("0xC", b"forged"))
+    monkeypatch.setattr(committed_registry, "iter_event_pages", lambda *args, **kwargs: iter([(0, 10, events)]))
+
+
+def test_committed_cache_returns_key_matching_commitment(published):
+    # 0xA published two keys but its commitment is for the older one; 0xC's published key is forged
+    registry = FakeRegistry({"0xA": b"first", "0xC": b"real"})
+    cache = CommittedKeyCache(registry)
+    assert cache.get("0xA") == b"first"
+    assert cache.get("0xB") is None
+    assert cache.get("0xC") is None
+    assert cache.mismatches == 1
+
+
+def test_register_committed_key_goes_through_the_submitter():
+    eth = FakeEth()
+    registry = FakeRegistry({})
+    views = registry.functions
+
+    class Register:
+        def __init__(self, public_key):
+            self.public_key = public_key
+
+        def estimate_gas(self, tx):
+            eth.estimates += 1
+            return 50_000
+
+        def transact(self, tx):
+            eth.sent.append(("registerPQCKey", tx))
+            registry.keys[tx['from']] = self.public_key
+            return f"0x{tx['nonce']:064x}"
+
+    registry.functions = SimpleNamespace(registerPQCKey=Register, getPQCKeyCommitment=views.getPQCKeyCommitment)
+    receipt = register_committed_key(SimpleNamespace(eth=eth), "0xA", registry, b"key")
+
+    assert receipt.status == 1
+    assert eth.nonce_lookups == 1 and eth.estimates == 1
+    (fn, tx), = eth.sent
+    assert fn == "registerPQCKey" and tx['nonce'] == 0 and tx['gas'] == 75_000
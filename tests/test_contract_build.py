@@ -0,0 +1,76 @@
+"""Tests for the compile cache (solcx replaced by a counting fake; paths redirected to tmp_path)"""
+from types import SimpleNamespace
+
+import pytest
+
+import contract_build
+from contract_build import compile_contract
+
+SOURCE = "pragma solidity ^0.8.0;\ncontract KeyRegistry {}\n"
+
+
+@pytest.fixture
+def fake_solc(tmp_path, monkeypatch):
+    contracts = tmp_path / "contracts"
+    contracts.mkdir()
+    (contracts / "KeyRegistry.sol").write_text(SOURCE)
+    monkeypatch.setattr(contract_build, "CONTRACTS_DIR", str(contracts))
+    monkeypatch.setattr(contract_build, "BUILD_DIR", str(contracts / "build"))
+    monkeypatch.setattr(contract_build, "PROJECT_ROOT", str(tmp_path))
+
+    solc = SimpleNamespace(compiled=0, installed=[], installs=[])
+
+    def compile_source(source, output_values, solc_version):
+        solc.compiled += 1
+        return {"<stdin>:KeyRegistry": {'abi': [{'name': solc_version}], 'bin': f"60{solc.compiled:02x}"}}
+
+    solc.compile_source = compile_source
+    solc.get_installed_solc_versions = lambda: solc.installed
+    solc.install_solc = lambda version: solc.installs.append(version) or solc.installed.append(version)
+    monkeypatch.setattr(contract_build, "solcx", solc)
+    monkeypatch.setattr(contract_build, "SOLCX_AVAILABLE", True)
+    return solc
+
+
+def test_unchanged_source_loads_from_cache(fake_solc):
+    first = compile_contract("KeyRegistry", "0.8.0", offline=False)
+    second = compile_contract("KeyRegistry", "0.8.0", offline=True)
+    assert first == second
+    assert fake_solc.compiled == 1
+    assert fake_solc.installs == ["0.8.0"]
+
+
+def test_source_version_and_force_recompile(fake_solc, tmp_path):
+    compile_contract("KeyRegistry", "0.8.0", offline=False)
+    compile_contract("KeyRegistry", "0.8.0", offline=False, force=True)
+    assert fake_solc.compiled == 2
+
+    (tmp_path / "contracts" / "KeyRegistry.sol").write_text(SOURCE + "// changed\n")
+    compile_contract("KeyRegistry", "0.8.0", offline=False)
+    assert fake_solc.compiled == 3
+
+    fake_solc.installed.append("0.8.19")
+    assert compile_contract("KeyRegistry", "0.8.19", offline=True)['abi'] == [{'name': "0.8.19"}]
+    assert fake_solc.compiled == 4
+
+
+def test_offline_without_compiler_or_artifact_fails(fake_solc):
+    with pytest.raises(RuntimeError, match="offline"):
+        compile_contract("KeyRegistry", "0.8.0", offline=True)
+    assert fake_solc.installs == []
+
+
+def test_missing_source(fake_solc):
+    with pytest.raises(FileNotFoundError):
+        compile_contract("NoSuchContract")
+
+
+def test_warm_cache_then_build_offline(fake_solc, tmp_path, monkeypatch):
+    monkeypatch.setattr("sys.argv", ["contract_build.py"])
+    contract_build.main()
+    assert (tmp_path / "contracts" / "build" / "KeyRegistry.json").exists()
+
+    monkeypatch.setenv(contract_build.OFFLINE_ENV, "1")
+    fake_solc.installed.clear()
+    compile_contract("KeyRegistry")
+    assert fake_solc.compiled == 1
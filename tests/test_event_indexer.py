@@ -0,0 +1,89 @@
+"""Tests for event paging and checkpoint resume (checkpoint file redirected to tmp_path)"""
+from types import SimpleNamespace
+
+import pytest
+
+import event_indexer
+from event_indexer import (
+    fetch_block_events, iter_event_pages, load_checkpoint, load_pending, resolve_start_block, save_checkpoint
+)
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_file(tmp_path, monkeypatch):
+    path = tmp_path / "data" / "indexer_checkpoint.json"
+    monkeypatch.setattr(event_indexer, "CHECKPOINT_FILE", str(path))
+    return path
+
+
+def fake_chain(head, events_by_block=None):
+    events_by_block = events_by_block or {}
+    calls = []
+
+    def get_logs(from_block, to_block):
+        calls.append((from_block, to_block))
+        return [e for b in range(from_block, to_block + 1) for e in events_by_block.get(b, [])]
+
+    w3 = SimpleNamespace(eth=SimpleNamespace(block_number=head))
+    contract = SimpleNamespace(events=SimpleNamespace(PQCSignature=SimpleNamespace(get_logs=get_logs)))
+    return w3, contract, calls
+
+
+def test_pages_cover_range_without_overlap():
+    w3, contract, calls = fake_chain(head=25, events_by_block={3: ["a"], 10: ["b", "c"], 25: ["d"]})
+    pages = list(iter_event_pages(w3, contract, 0, page_size=10))
+
+    assert calls == [(0, 9), (10, 19), (20, 25)]
+    assert [(start, end) for start, end, _ in pages] == calls
+    assert [events for _, _, events in pages] == [["a"], ["b", "c"], ["d"]]
+
+
+def test_empty_range_fetches_nothing():
+    w3, contract, calls = fake_chain(head=5)
+    assert list(iter_event_pages(w3, contract, 6, 5)) == []
+    assert calls == []
+
+
+def test_checkpoint_round_trip_keeps_other_entries(checkpoint_file):
+    assert load_checkpoint("0xA") is None
+    save_checkpoint("0xA", 10)
+    save_checkpoint("0xA", 4, event_name="PQCKeyRegistered")
+    save_checkpoint("0xB", 7)
+
+    assert load_checkpoint("0xA") == 10
+    assert load_checkpoint("0xA", "PQCKeyRegistered") == 4
+    assert load_checkpoint("0xB") == 7
+    assert not checkpoint_file.with_name(checkpoint_file.name + ".tmp").exists()
+
+
+def test_resume_after_checkpoint():
+    w3, _, _ = fake_chain(head=100)
+    assert resolve_start_block(w3, "0xA") == 0
+    save_checkpoint("0xA", 41)
+    assert resolve_start_block(w3, "0xA") == 42
+    assert resolve_start_block(w3, "0xA", full_rescan=True) == 0
+    assert resolve_start_block(w3, "0xA", from_block=5) == 5
+
+
+def test_checkpoint_ahead_of_chain_rescans():
+    save_checkpoint("0xA", 500)
+    w3, _, _ = fake_chain(head=100)
+    assert resolve_start_block(w3, "0xA") == 0
+
+
+def test_pending_saved_with_checkpoint_and_replaced():
+    assert load_pending("0xA") == {}
+    save_checkpoint("0xA", 10, pending={"0xS": [7, 3, 7], "0xT": []})
+    assert load_checkpoint("0xA") == 10
+    assert load_pending("0xA") == {"0xS": [3, 7]}
+
+    save_checkpoint("0xA", 20)  # no pending given: the saved set is kept
+    assert load_pending("0xA") == {"0xS": [3, 7]}
+    save_checkpoint("0xA", 30, pending={})
+    assert load_pending("0xA") == {}
+
+
+def test_fetch_block_events_reads_each_block_once():
+    _, contract, calls = fake_chain(head=20, events_by_block={3: ["a"], 9: ["b", "c"]})
+    assert fetch_block_events(contract, [9, 3, 9]) == ["a", "b", "c"]
+    assert calls == [(3, 3), (9, 9)]
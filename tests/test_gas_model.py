@@ -0,0 +1,86 @@
+"""Tests for the analytical gas model (no chain: synthetic calibration data)"""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from algorithm_registry import ALGORITHMS
+from gas_model import (GasModel, _features, _fit, algorithm_gas_table, calibrate, calldata, intrinsic_gas,
+                       load_gas_model, save_gas_model)
+
+COEFFICIENTS = {
+    'registerPQCKey': [30000.0, 22100.0, 0.1],
+    'logSignature': [3000.0, 300.0, 0.05],
+}
+
+
+def test_calldata_layout():
+    data = calldata('logSignature', 3, 40)
+    # selector + 2 offsets + (length + 1 word) + (length + 2 words)
+    assert len(data) == 4 + 32 * 2 + 32 * 2 + 32 * 3
+
+
+def test_intrinsic_gas_counts_zero_and_nonzero_bytes():
+    data = b"\x00" * 10 + b"\x01" * 5
+    standard, floor = intrinsic_gas(data)
+    assert standard == 21000 + 4 * 10 + 16 * 5 and floor == 0
+    assert intrinsic_gas(data, floor=True)[1] == 21000 + 10 * (10 + 4 * 5)
+
+
+def test_fit_recovers_coefficients():
+    rows = []
+    for size in (32, 100, 640, 2000, 4096):
+        features = _features('registerPQCKey', size)
+        rows.append((features, sum(c * f for c, f in zip(COEFFICIENTS['registerPQCKey'], features))))
+    coefficients, residual = _fit(rows)
+    assert list(coefficients) == pytest.approx(COEFFICIENTS['registerPQCKey'], rel=1e-6)
+    assert residual < 1e-3
+
+
+def test_predict_applies_calldata_floor():
+    metered = GasModel(COEFFICIENTS)
+    floored = GasModel({'registerPQCKey': [0, 0, 0], 'logSignature': [0, 0, 0]}, calldata_floor=True)
+    data = calldata('logSignature', 3309, 151)
+    assert metered.predict_log_signature(3309, 151) > intrinsic_gas(data)[0]
+    assert floored.predict_log_signature(3309, 151) == intrinsic_gas(data, floor=True)[1]
+
+
+def test_gas_table_uses_typical_falcon_size():
+    rows = {row['algorithm']: row for row in algorithm_gas_table(GasModel(COEFFICIENTS))}
+    assert rows['falcon512']['signature_size'] == ALGORITHMS['falcon512']['signature_size']
+    assert rows['falcon512']['transaction_gas'] == GasModel(COEFFICIENTS).predict_log_signature(
+        ALGORITHMS['falcon512']['signature_size'], 151)
+
+
+def test_save_load_round_trip(tmp_path):
+    path = str(tmp_path / "gas_model.json")
+    save_gas_model(GasModel(COEFFICIENTS, backend="eth-tester", calibrated="now"), path)
+    model = load_gas_model(path)
+    assert model.backend == "eth-tester"
+    assert model.predict_registration(1952) == GasModel(COEFFICIENTS).predict_registration(1952)
+    assert load_gas_model(str(tmp_path / "missing.json")) is None
+
+
+def test_calibration_refuses_shared_chains():
+    w3 = SimpleNamespace(provider=SimpleNamespace(endpoint_uri="http://127.0.0.1:8545"))
+    with pytest.raises(ValueError, match="eth-tester"):
+        calibrate(w3, contract=None)
+
+
+def test_log_signatures_calldata_and_features():
+    entries = [(b"m" * 151, b"s" * 666), (b"n", b"t" * 33)]
+    payloads = [b"s" * 666, b"m" * 151, b"t" * 33, b"n"]
+    data = calldata('logSignatures', payloads=payloads)
+    # selector, 2 array offsets, per array: length + 2 element offsets + elements
+    assert len(data) == 4 + 32 * 2 + 32 * 3 * 2 + 32 * (1 + 21) + 32 * (1 + 2) + 32 * (1 + 5) + 32 * (1 + 1)
+    assert _features('logSignatures', 666, 151, 33, 1) == [1.0, 2.0, 21 + 5 + 2 + 1, float((21 + 5 + 2 + 1) ** 2)]
+
+    model = GasModel({**COEFFICIENTS, 'logSignatures': [2500.0, 1500.0, 300.0, 0.004]})
+    assert model.predict_log_signatures(entries) == model.predict('logSignatures', payloads=payloads)
+
+
+def test_intrinsic_only_is_a_lower_bound():
+    model = GasModel({**COEFFICIENTS, 'logSignatures': [2500.0, 1500.0, 300.0, 0.004]}, calldata_floor=True)
+    entries = [(b"m" * 32, b"\x01" * 2420)] * 10
+    assert GasModel.intrinsic_only().predict_log_signatures(entries) <= model.predict_log_signatures(entries)
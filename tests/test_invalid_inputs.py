@@ -0,0 +1,71 @@
+"""Tests for invalid-signature generation and rejection timing"""
+import itertools
+import time
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import verify_signatures
+from vector_corpus import INVALID_KINDS, iter_invalid_inputs
+
+PUBLIC_KEY = bytes(range(32))
+OTHER_KEY = bytes(32)
+SIGNATURE = bytes(range(200))
+
+
+def take(kind, n, seed=0):
+    return list(itertools.islice(iter_invalid_inputs(kind, PUBLIC_KEY, SIGNATURE, seed, OTHER_KEY), n))
+
+
+def test_tampered_flips_exactly_one_bit():
+    for public_key, signature in take('tampered', 20):
+        assert public_key == PUBLIC_KEY and len(signature) == len(SIGNATURE)
+        diff = [a ^ b for a, b in zip(signature, SIGNATURE) if a != b]
+        assert len(diff) == 1 and bin(diff[0]).count("1") == 1
+
+
+def test_truncated_is_a_strict_nonempty_prefix():
+    for public_key, signature in take('truncated', 20):
+        assert 0 < len(signature) < len(SIGNATURE)
+        assert SIGNATURE.startswith(signature)
+
+
+def test_wrong_key_swaps_the_public_key():
+    assert take('wrong_key', 3) == [(OTHER_KEY, SIGNATURE)] * 3
+    with pytest.raises(ValueError):
+        next(iter_invalid_inputs('wrong_key', PUBLIC_KEY, SIGNATURE))
+
+
+@pytest.mark.parametrize("kind", INVALID_KINDS)
+def test_streams_are_seeded(kind):
+    assert take(kind, 10, seed=5) == take(kind, 10, seed=5)
+
+
+def test_different_seeds_differ():
+    assert take('tampered', 10, seed=1) != take('tampered', 10, seed=2)
+
+
+def test_unknown_kind_rejected():
+    with pytest.raises(ValueError):
+        next(iter_invalid_inputs('reordered', PUBLIC_KEY, SIGNATURE))
+
+
+class RaisingAlgorithm:
+    def verify(self, public_key, message, signature):
+        raise ValueError("malformed signature")
+
+
+def test_rejection_time_excludes_reporter(monkeypatch):
+    monkeypatch.setattr(verify_signatures, "QUANTCRYPT_AVAILABLE", True)
+    events = []
+
+    def slow_reporter(event, **fields):
+        events.append(event)
+        time.sleep(0.2)
+
+    is_valid, elapsed = verify_signatures.verify_pqc_signature(RaisingAlgorithm(), PUBLIC_KEY, b"m", SIGNATURE,
+                                                              reporter=slow_reporter)
+    assert is_valid is False
+    assert events == ["error"]
+    assert 0 < elapsed < 0.1
@@ -0,0 +1,107 @@
+"""Tests for the public key cache against a fake registry"""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import key_cache
+from committed_registry import key_commitment
+from key_cache import PublicKeyCache
+
+
+class FakeRegistry:
+    """getPQCKey / getPQCKeyCommitment views; calls are counted"""
+
+    def __init__(self, keys, address="0xRegistry"):
+        self.keys = keys
+        self.address = address
+        self.calls = 0
+        registry = self
+
+        class View:
+            def __init__(self, read, user):
+                self.read, self.user = read, user
+
+            def call(self, block_identifier='latest'):
+                registry.calls += 1
+                return self.read(registry.keys.get(self.user, b""))
+
+        self.functions = SimpleNamespace(
+            getPQCKey=lambda user: View(lambda key: key, user),
+            getPQCKeyCommitment=lambda user: View(lambda key: key_commitment(key) if key else bytes(32), user),
+        )
+        self.w3 = SimpleNamespace(eth=SimpleNamespace(block_number=10))
+
+
+def registrations(*users_and_keys):
+    return [{'args': {'user': user, 'publicKey': key}} for user, key in users_and_keys]
+
+
+def test_get_caches_hits_and_unregistered_addresses():
+    registry = FakeRegistry({"0xA": b"key-a"})
+    cache = PublicKeyCache(registry)
+    assert cache.get("0xA") == b"key-a"
+    assert cache.get("0xA") == b"key-a"
+    assert cache.get("0xB") is None
+    assert cache.get("0xB") is None
+    assert (cache.hits, cache.misses, registry.calls) == (2, 2, 2)
+
+
+def test_sync_invalidates_reregistered_addresses(monkeypatch):
+    registry = FakeRegistry({"0xA": b"old", "0xB": b"b"})
+    cache = PublicKeyCache(registry)
+    cache.sync(None, 5)
+    cache.get("0xA"), cache.get("0xB")
+
+    registry.keys["0xA"] = b"new"
+    monkeypatch.setattr(key_cache, "iter_event_pages",
+                        lambda *args, **kwargs: iter([(6, 9, registrations(("0xA", b"new")))]))
+    assert cache.sync(None, 9) == 1
+    assert cache.get("0xA") == b"new"
+    assert cache.get("0xB") == b"b"
+
+
+def test_sync_backwards_clears_everything():
+    cache = PublicKeyCache(FakeRegistry({"0xA": b"a"}))
+    cache.sync(None, 50)
+    cache.get("0xA")
+    assert cache.sync(None, 3) == 1 and len(cache) == 0
+
+
+def test_save_load_round_trip(tmp_path):
+    path = str(tmp_path / "key_cache.json")
+    registry = FakeRegistry({"0xA": b"\x01\x02"})
+    cache = PublicKeyCache(registry)
+    cache.sync(None, 7)
+    cache.get("0xA"), cache.get("0xB")
+    cache.save(path)
+
+    restored = PublicKeyCache(registry)
+    assert restored.load(path)
+    assert restored.synced_block == 7
+    assert restored.get("0xA") == b"\x01\x02" and restored.get("0xB") is None
+    assert restored.hits == 2
+    assert not PublicKeyCache(FakeRegistry({}, address="0xOther")).load(path)
+
+
+def test_one_entry_per_address(monkeypatch):
+    registry = FakeRegistry({"0xA": b"key-a"})
+    cache = PublicKeyCache(registry)
+    cache.sync(None, 5)
+    cache.get("0xA")
+    monkeypatch.setattr(key_cache, "call_many", lambda *args, **kwargs: pytest.fail("0xA is cached"))
+    assert cache.prefetch(["0xA", "0xA"]) == 0
+    assert len(cache) == 1 and registry.calls == 1
+
+    monkeypatch.setattr(key_cache, "iter_event_pages",
+                        lambda *args, **kwargs: iter([(6, 9, registrations(("0xA", b"new")))]))
+    assert cache.sync(None, 9) == 1 and len(cache) == 0
+
+
+def test_load_older_per_algorithm_entries(tmp_path):
+    path = tmp_path / "key_cache.json"
+    path.write_text(json.dumps({'contract_address': "0xRegistry", 'synced_block': 3,
+                                'entries': [["0xA", None, "0102"], ["0xB", "falcon512", None]]}))
+    cache = PublicKeyCache(FakeRegistry({}))
+    assert cache.load(str(path))
+    assert cache.get("0xA") == b"\x01\x02" and cache.get("0xB") is None and cache.hits == 2
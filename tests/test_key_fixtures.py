@@ -0,0 +1,112 @@
+"""Tests for the content-addressed key fixture store (stubbed batch engine, fixtures under tmp_path)"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pytest
+
+import key_fixtures
+from key_fixtures import FIXTURES_VERSION, fixture_message, load_fixtures
+
+ALGORITHM = "falcon512"
+
+
+class StubEngine:
+    """BatchEngine stand-in: key i is derived from a global counter, signatures vary in length"""
+
+    generated = 0
+
+    def __init__(self, algorithm, executor=None, workers=None):
+        self.algorithm = algorithm
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def keygen(self, count):
+        first = StubEngine.generated
+        StubEngine.generated += count
+        info = key_fixtures.get_algorithm_info(self.algorithm)
+        public_keys = [bytes([i % 256]) * info["public_key_size"] for i in range(first, first + count)]
+        private_keys = [bytes([(i + 1) % 256]) * info["private_key_size"] for i in range(first, first + count)]
+        return public_keys, private_keys, [0.0] * count
+
+    def sign(self, private_keys, messages):
+        return [sk[:1] * (40 + sk[0]) + m for sk, m in zip(private_keys, messages)], [0.0] * len(messages)
+
+
+@pytest.fixture(autouse=True)
+def fixtures_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "fixtures"
+    monkeypatch.setattr(key_fixtures, "FIXTURES_DIR", str(directory))
+    monkeypatch.setattr(key_fixtures, "FIXTURES_INDEX_FILE", str(directory / "index.json"))
+    monkeypatch.setattr(key_fixtures, "BatchEngine", StubEngine)
+    StubEngine.generated = 0
+    return directory
+
+
+def objects(directory):
+    return sorted(os.listdir(directory / "objects"))
+
+
+def read_index(directory):
+    with open(directory / "index.json") as f:
+        return json.load(f)
+
+
+def test_object_is_named_by_content_hash_and_reused(fixtures_dir):
+    fixtures = load_fixtures(ALGORITHM, 3)
+    stored = np.load(fixtures_dir / "objects" / f"{fixtures.digest}.npy")
+    assert hashlib.sha256(stored.tobytes()).hexdigest() == fixtures.digest
+    assert objects(fixtures_dir) == [f"{fixtures.digest}.npy"]
+
+    again = load_fixtures("falcon_512", 2)
+    assert again.digest == fixtures.digest
+    assert StubEngine.generated == 3
+
+
+def test_growing_the_set_replaces_the_object(fixtures_dir):
+    small = load_fixtures(ALGORITHM, 2)
+    grown = load_fixtures(ALGORITHM, 5)
+
+    assert StubEngine.generated == 5  # only the missing three were generated
+    assert grown.digest != small.digest
+    assert objects(fixtures_dir) == [f"{grown.digest}.npy"]
+    entry = read_index(fixtures_dir)[ALGORITHM]
+    assert (entry['digest'], entry['count'], entry['version']) == (grown.digest, 5, FIXTURES_VERSION)
+    assert grown.public_keys(2) == small.public_keys()
+
+
+def test_version_mismatch_regenerates(fixtures_dir):
+    old = load_fixtures(ALGORITHM, 2)
+    index = read_index(fixtures_dir)
+    index[ALGORITHM]['version'] = FIXTURES_VERSION - 1
+    with open(fixtures_dir / "index.json", "w") as f:
+        json.dump(index, f)
+
+    fresh = load_fixtures(ALGORITHM, 2)
+    assert StubEngine.generated == 4
+    assert fresh.digest != old.digest
+    assert read_index(fixtures_dir)[ALGORITHM]['version'] == FIXTURES_VERSION
+
+
+def test_memory_mapped_load_returns_stored_keys_and_signatures():
+    load_fixtures(ALGORITHM, 4)
+    fixtures = load_fixtures(ALGORITHM, 4)
+    assert isinstance(fixtures.records, np.memmap)
+
+    engine = StubEngine(ALGORITHM)
+    StubEngine.generated = 0
+    public_keys, private_keys, _ = engine.keygen(4)
+    messages = [fixture_message(i) for i in range(4)]
+    signatures, _ = engine.sign(private_keys, messages)
+
+    assert len(fixtures) == 4
+    assert fixtures.public_keys() == public_keys
+    assert fixtures.private_keys(3) == private_keys[:3]
+    assert fixtures.messages() == messages
+    assert fixtures.signatures() == signatures
+    assert len({len(sig) for sig in fixtures.signatures()}) > 1
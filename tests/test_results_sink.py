@@ -0,0 +1,73 @@
+"""Round-trip tests for the csv/arrow/binary results sink (outputs redirected to tmp_path)"""
+import math
+
+import pytest
+
+import results_sink
+from results_sink import ResultsSink, load_results_columns
+
+np = pytest.importorskip("numpy")
+
+ROWS = [
+    {'algorithm': 'dilithium3', 'keygen_time': '', 'sign_time': '', 'verify_time': '0.000250',
+     'public_key_size': 1952, 'signature_size': 3309, 'gas_used': '', 'valid': True, 'block_number': 7},
+    {'algorithm': 'falcon512', 'keygen_time': '0.010000', 'sign_time': '0.000500', 'verify_time': '0.000100',
+     'public_key_size': 897, 'signature_size': 655, 'gas_used': 54321, 'valid': False, 'block_number': ''},
+]
+
+
+@pytest.fixture(autouse=True)
+def results_paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(results_sink, "RESULTS_FILE", str(tmp_path / "results.csv"))
+    monkeypatch.setattr(results_sink, "RESULTS_ARROW_DIR", str(tmp_path / "results_arrow"))
+    monkeypatch.setattr(results_sink, "RESULTS_BINARY_FILE", str(tmp_path / "results.bin"))
+
+
+def formats():
+    available = ["csv", "binary"]
+    if results_sink.PYARROW_AVAILABLE:
+        available.append("arrow")
+    return available
+
+
+@pytest.mark.parametrize("fmt", formats())
+def test_round_trip(fmt):
+    with ResultsSink(fmt, batch_size=1) as sink:
+        for row in ROWS:
+            sink.write(row)
+    # A second run appends instead of overwriting
+    with ResultsSink(fmt) as sink:
+        sink.write_batch(ROWS[:1])
+        assert sink.rows_written == 1
+
+    columns = load_results_columns([fmt])
+    assert list(columns['algorithm']) == ['dilithium3', 'falcon512', 'dilithium3']
+    assert list(columns['valid']) == [True, False, True]
+    assert list(columns['public_key_size']) == [1952, 897, 1952]
+    assert list(columns['gas_used']) == [-1, 54321, -1]
+    assert list(columns['block_number']) == [7, -1, 7]
+    assert math.isnan(columns['keygen_time'][0])
+    assert columns['verify_time'][1] == pytest.approx(0.0001)
+
+
+def test_formats_are_concatenated():
+    for fmt in ("csv", "binary"):
+        with ResultsSink(fmt) as sink:
+            sink.write_batch(ROWS)
+    columns = load_results_columns(["csv", "binary"])
+    assert len(columns['algorithm']) == 4
+
+
+def test_nothing_stored():
+    assert load_results_columns() is None
+
+
+def test_unknown_format_rejected():
+    with pytest.raises(ValueError):
+        ResultsSink("parquet")
+
+
+def test_binary_file_needs_magic(tmp_path):
+    (tmp_path / "results.bin").write_bytes(b"not a record file")
+    with pytest.raises(ValueError):
+        load_results_columns(["binary"])
@@ -0,0 +1,89 @@
+"""Tests for JSON-RPC batching against a fake HTTP session"""
+import random
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import rpc_batch
+from rpc_batch import RpcBatcher, RpcError, get_blocks, to_int
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+class FakeSession:
+    """Answers eth_getBlockByNumber with {'number': n}; responses come back shuffled"""
+
+    def __init__(self, fail_method=None):
+        self.payload_sizes = []
+        self.fail_method = fail_method
+        self._lock = threading.Lock()
+
+    def post(self, url, json):
+        with self._lock:
+            self.payload_sizes.append(len(json))
+        body = []
+        for request in json:
+            if request['method'] == self.fail_method:
+                body.append({'jsonrpc': '2.0', 'id': request['id'], 'error': {'code': -32000, 'message': 'boom'}})
+            else:
+                body.append({'jsonrpc': '2.0', 'id': request['id'], 'result': {'number': request['params'][0]}})
+        random.Random(len(json)).shuffle(body)
+        return FakeResponse(body)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(rpc_batch, "get_session", lambda url: session)
+    return session
+
+
+def http_w3():
+    return SimpleNamespace(provider=SimpleNamespace(endpoint_uri="http://node"))
+
+
+def test_results_in_request_order_across_chunks(session):
+    blocks = get_blocks(http_w3(), range(250), batch_size=100)
+    assert [to_int(block['number']) for block in blocks] == list(range(250))
+    assert sorted(session.payload_sizes) == [50, 100, 100]
+
+
+def test_round_trips_counted_once_per_payload(session):
+    batcher = RpcBatcher(http_w3(), batch_size=7)
+    for _ in range(3):
+        batcher.map("eth_getBlockByNumber", ([hex(n), False] for n in range(50)))
+    assert batcher.round_trips == 3 * 8 == len(session.payload_sizes)
+
+
+def test_error_entry_raises(monkeypatch):
+    monkeypatch.setattr(rpc_batch, "get_session", lambda url: FakeSession(fail_method="eth_call"))
+    batcher = RpcBatcher(http_w3())
+    batcher.add("eth_getBlockByNumber", ["0x1", False])
+    batcher.add("eth_call", [{}, "latest"])
+    with pytest.raises(RpcError, match="eth_call failed: boom"):
+        batcher.execute()
+
+
+def test_non_http_provider_sends_one_request_at_a_time():
+    sent = []
+    manager = SimpleNamespace(request_blocking=lambda method, params: sent.append(method) or 7)
+    w3 = SimpleNamespace(provider=SimpleNamespace(), manager=manager)
+    batcher = RpcBatcher(w3)
+    assert batcher.map("eth_blockNumber", [[], []]) == [7, 7]
+    assert batcher.round_trips == 2 and sent == ["eth_blockNumber"] * 2
+
+
+def test_to_int():
+    assert to_int("0x1f") == 31
+    assert to_int(5) == 5
+    assert to_int(None) is None
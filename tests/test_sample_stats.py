@@ -0,0 +1,79 @@
+"""Tests for the shared summary statistics and adaptive sample collection"""
+import itertools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sample_stats import (SampleBuffer, SamplingPlan, bootstrap_ci, collect_samples, outlier_flags,
+                          summarize)
+
+
+def test_sample_buffer_grows():
+    buffer = SampleBuffer(capacity=2)
+    for value in range(5):
+        buffer.append(value)
+    buffer.extend([5.0, 6.0, 7.0])
+    assert len(buffer) == 8
+    assert buffer.values.tolist() == list(range(8))
+
+
+def test_summarize_matches_numpy():
+    samples = np.linspace(1.0, 2.0, 101)
+    summary = summarize(samples, resamples=200)
+    assert summary['mean'] == pytest.approx(1.5)
+    assert summary['median'] == pytest.approx(1.5)
+    assert summary['std_dev'] == pytest.approx(samples.std(ddof=1))
+    assert (summary['min'], summary['max']) == (1.0, 2.0)
+    assert summary['p90'] == pytest.approx(np.percentile(samples, 90))
+    assert summary['mad'] == pytest.approx(0.25)
+    assert summary['ci_low'] < summary['mean'] < summary['ci_high']
+    assert summary['outliers'] == 0 and summary['outlier_indices'] == []
+
+
+def test_summarize_reports_outliers_flagged_by_outlier_flags():
+    samples = [1.0, 1.1, 0.9, 1.05, 0.95, 1.0, 50.0, 1.02, 0.98, 40.0]
+    buffer = SampleBuffer()
+    buffer.extend(samples)
+    summary = summarize(buffer, resamples=100)
+    assert summary['outlier_indices'] == np.flatnonzero(outlier_flags(samples)).tolist() == [6, 9]
+    assert summary['outliers'] == 2
+
+
+def test_summarize_empty_and_constant():
+    assert summarize([])['mean'] == 0
+    constant = summarize([2.0] * 10, resamples=50)
+    assert constant['mad'] == 0 and constant['outliers'] == 0
+    assert constant['ci_low'] == constant['ci_high'] == 2.0
+
+
+def test_bootstrap_ci_is_seeded_and_narrows_with_more_samples():
+    rng = np.random.default_rng(1)
+    small = rng.normal(10.0, 1.0, 20)
+    large = rng.normal(10.0, 1.0, 2000)
+    assert bootstrap_ci(small, seed=3) == bootstrap_ci(small, seed=3)
+    low_s, high_s = bootstrap_ci(small)
+    low_l, high_l = bootstrap_ci(large)
+    assert high_l - low_l < high_s - low_s
+    assert low_l < 10.0 < high_l
+    assert bootstrap_ci([4.0]) == (4.0, 4.0)
+
+
+def test_fixed_plan_collects_exactly_and_counts_failures():
+    values = itertools.cycle([0.001, None, 0.002])
+    samples, info = collect_samples(lambda: next(values), SamplingPlan.fixed(6, warmup=1))
+    assert len(samples) == 6
+    assert info['stop_reason'] == 'fixed'
+    assert info['failures'] == 3
+
+
+def test_adaptive_plan_stops_at_target_ci():
+    samples, info = collect_samples(lambda: 0.001, SamplingPlan(warmup=0, min_samples=10, max_samples=1000,
+                                                                 target_rel_ci=0.01, time_budget=None))
+    assert info['stop_reason'] == 'target_ci'
+    assert len(samples) == 10
+
+
+def test_always_failing_measure_terminates():
+    samples, info = collect_samples(lambda: None, SamplingPlan(warmup=0, min_samples=5, max_samples=20))
+    assert len(samples) == 0 and info['failures'] == 20
@@ -0,0 +1,82 @@
+"""Tests for the JSON index + .npy samples sidecar"""
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sample_stats import summarize
+from sample_store import load_outlier_indices, load_results_index, load_samples, save_results_index
+
+
+def make_output():
+    return {
+        'timestamp': 'now',
+        'results': [
+            {'algorithm': 'dilithium3', 'signing': {'mean': 2.0, 'times': [1.0, 2.0, 3.0]},
+             'verification': {'mean': 0.5, 'times': np.array([0.5, 0.5])}},
+            {'algorithm': 'falcon512', 'signing': {'mean': 4.0, 'times': [4.0]}, 'verification': {}},
+        ],
+    }
+
+
+def test_round_trip_moves_samples_out_of_json(tmp_path):
+    path = tmp_path / "benchmark_x.json"
+    save_results_index(make_output(), str(path))
+
+    raw = json.loads(path.read_text())
+    assert raw['samples_file'] == "benchmark_x.samples.npy"
+    assert 'times' not in raw['results'][0]['signing']
+    assert raw['results'][0]['signing']['mean'] == 2.0
+
+    data = load_results_index(str(path))
+    dilithium, falcon = data['results']
+    assert list(load_samples(data, dilithium['signing'])) == [1.0, 2.0, 3.0]
+    assert list(load_samples(data, dilithium['verification'])) == [0.5, 0.5]
+    assert list(load_samples(data, falcon['signing'])) == [4.0]
+    assert load_samples(data, falcon['verification']) is None
+
+
+def test_outlier_indices_kept_out_of_json(tmp_path):
+    times = [1.0 + 0.01 * (i % 5) for i in range(40)] + [9.0, 1.02, 8.0]
+    signing = {'times': times, **summarize(times, resamples=100)}
+    output = {'results': [{'signing': signing}, {'signing': {'times': [1.0], **summarize([1.0], resamples=10)}}]}
+    path = tmp_path / "benchmark_x.json"
+    save_results_index(output, str(path))
+
+    raw = json.loads(path.read_text())
+    assert raw['outliers_file'] == "benchmark_x.outliers.npy"
+    assert 'outlier_indices' not in raw['results'][0]['signing']
+    assert raw['results'][0]['signing']['outliers'] == 2
+
+    data = load_results_index(str(path))
+    flagged = load_outlier_indices(data, data['results'][0]['signing'])
+    assert list(flagged) == signing['outlier_indices'] == [40, 42]
+    assert list(load_samples(data, data['results'][0]['signing'])[flagged]) == [9.0, 8.0]
+    assert len(load_outlier_indices(data, data['results'][1]['signing'])) == 0
+
+
+def test_no_samples_writes_no_sidecar(tmp_path):
+    path = tmp_path / "summary.json"
+    save_results_index({'results': [{'signing': {'mean': 1.0}}]}, str(path))
+    assert 'samples_file' not in load_results_index(str(path))
+    assert not (tmp_path / "summary.samples.npy").exists()
+
+
+def test_inline_samples_from_older_files(tmp_path):
+    path = tmp_path / "old.json"
+    path.write_text(json.dumps({'results': [{'signing': {'times': [0.25, 0.75]}}]}))
+    data = load_results_index(str(path))
+    assert list(load_samples(data, data['results'][0]['signing'])) == [0.25, 0.75]
+
+
+def test_distribution_chart_reads_samples_file(tmp_path, monkeypatch):
+    pytest.importorskip("matplotlib")
+    import visualize_results
+
+    path = tmp_path / "benchmark_x.json"
+    save_results_index(make_output(), str(path))
+    monkeypatch.setattr(visualize_results, "FIGURES_DIR", str(tmp_path / "figures"))
+
+    figure = visualize_results.create_timing_distribution_chart(load_results_index(str(path)))
+    assert figure is not None and (tmp_path / "figures" / "timing_distribution.png").exists()
@@ -0,0 +1,110 @@
+"""Tests for gas-budget packing and sending of batched logSignatures transactions"""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import web3_client
+from gas_model import GasModel
+from send_hybrid_tx import pack_signature_batches, send_hybrid_batch
+
+MODEL = GasModel({
+    'registerPQCKey': [0.0, 0.0, 0.0],
+    'logSignature': [2000.0, 300.0, 0.01],
+    'logSignatures': [2500.0, 1500.0, 300.0, 0.004],
+})
+ENTRIES = [(f"message {i}".encode(), bytes([i % 251 + 1]) * 2420) for i in range(120)]
+
+
+@pytest.mark.parametrize("model", [MODEL, None])
+def test_batches_are_the_longest_runs_under_budget(model):
+    budget = 2_000_000
+    effective = model or GasModel.intrinsic_only()
+    batches = pack_signature_batches(ENTRIES, budget, model)
+
+    assert [entry for batch in batches for entry in batch] == ENTRIES
+    for batch, following in zip(batches, batches[1:]):
+        assert effective.predict_log_signatures(batch) <= budget
+        assert effective.predict_log_signatures(batch + following[:1]) > budget
+    assert effective.predict_log_signatures(batches[-1]) <= budget
+
+
+def test_oversized_entry_gets_its_own_batch():
+    huge = (b"m", b"\x01" * 200_000)
+    batches = pack_signature_batches([huge] + ENTRIES[:3], 1_000_000, MODEL)
+    assert batches == [[huge], ENTRIES[:3]]
+
+
+def test_empty_input():
+    assert pack_signature_batches([], 1_000_000, MODEL) == []
+
+
+BUDGET = 2_000_000
+
+
+class Receipt(dict):
+    def __init__(self, gas_used):
+        super().__init__(gasUsed=gas_used)
+        self.status = 1
+
+
+class FakeEth:
+    """Node whose logSignatures estimate is twice the packing model's prediction"""
+
+    def __init__(self):
+        self.sent = []
+        self.gas_price = 1
+        self.nonce_lookups = 0
+
+    def get_transaction_count(self, account, block="latest"):
+        self.nonce_lookups += 1
+        return len(self.sent)
+
+    def contract(self, address, abi):
+        eth = self
+
+        class Call:
+            def __init__(self, fn_name, entries):
+                self.fn_name, self.entries = fn_name, entries
+
+            def estimate_gas(self, tx):
+                if self.fn_name == 'logSignature':
+                    return MODEL.predict('logSignature', payloads=[self.entries[0][1], self.entries[0][0]])
+                return 2 * MODEL.predict_log_signatures(self.entries)
+
+            def transact(self, tx):
+                assert tx['gas'] <= BUDGET and tx['nonce'] == len(eth.sent)
+                eth.sent.append((self.fn_name, len(self.entries)))
+                return len(eth.sent)
+
+        functions = SimpleNamespace(
+            logSignature=lambda signature, message: Call('logSignature', [(message, signature)]),
+            logSignatures=lambda signatures, messages: Call('logSignatures', list(zip(messages, signatures))),
+        )
+        return SimpleNamespace(address=address, functions=functions)
+
+    def wait_for_transaction_receipt(self, tx_hash, timeout=120, poll_latency=0.1):
+        return Receipt(1000 + tx_hash)
+
+
+class FakeWeb3:
+    def __init__(self, eth):
+        self.eth = eth
+
+
+def test_batches_over_the_node_estimate_are_split(monkeypatch):
+    eth = FakeEth()
+    monkeypatch.setattr(web3_client, "_CONTRACTS", {})
+
+    sent = send_hybrid_batch(FakeWeb3(eth), "0xabc", "0xC", [], ENTRIES, BUDGET, MODEL)
+
+    assert sum(count for count, _ in sent) == len(ENTRIES)
+    assert [count for count, _ in sent] == [count for _, count in eth.sent]
+    assert [receipt['gasUsed'] for _, receipt in sent] == [1001 + i for i in range(len(sent))]
+    assert all(fn == ('logSignature' if count == 1 else 'logSignatures') for fn, count in eth.sent)
+    # Every packed batch was over the node's estimate and had to be halved
+    packed = max(len(batch) for batch in pack_signature_batches(ENTRIES, BUDGET, MODEL))
+    assert max(count for _, count in eth.sent) <= (packed + 1) // 2
+    # One submitter: the nonce is looked up once for every transaction
+    assert eth.nonce_lookups == 1
@@ -0,0 +1,105 @@
+"""Tests for the pipelined transaction submitter against a fake node"""
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from tx_submitter import TransactionSubmitter
+
+
+class FakeEth:
+    def __init__(self, fail_nonces=()):
+        self.sent = []
+        self.estimates = 0
+        self.nonce_lookups = 0
+        self.fail_nonces = set(fail_nonces)
+        self.gas_price = 1
+        self._lock = threading.Lock()
+
+    def get_transaction_count(self, account, block="latest"):
+        self.nonce_lookups += 1
+        return len(self.sent)
+
+    def wait_for_transaction_receipt(self, tx_hash, timeout=120, poll_latency=0.1):
+        return SimpleNamespace(status=1, tx_hash=tx_hash)
+
+
+class FakeCall:
+    def __init__(self, eth, fn_name, args):
+        self.eth, self.fn_name, self.args = eth, fn_name, args
+
+    def estimate_gas(self, tx):
+        self.eth.estimates += 1
+        return 100_000 + 10 * sum(len(a) for a in self.args)
+
+    def transact(self, tx):
+        if tx['nonce'] in self.eth.fail_nonces:
+            self.eth.fail_nonces.discard(tx['nonce'])
+            raise ValueError("nonce too low")
+        with self.eth._lock:
+            self.eth.sent.append((self.fn_name, tx))
+        return f"0x{tx['nonce']:064x}"
+
+
+class FakeFunctions:
+    def __init__(self, eth):
+        self.eth = eth
+
+    def __getattr__(self, fn_name):
+        return lambda *args: FakeCall(self.eth, fn_name, args)
+
+
+def make_submitter(eth):
+    w3 = SimpleNamespace(eth=eth)
+    contract = SimpleNamespace(functions=FakeFunctions(eth))
+    return TransactionSubmitter(w3, "0xabc", contract, receipt_workers=2)
+
+
+def test_nonces_are_sequential_and_gas_estimated_once_per_size():
+    eth = FakeEth()
+    submitter = make_submitter(eth)
+    try:
+        submitter.submit("registerPQCKey", b"k" * 1952)
+        for _ in range(5):
+            submitter.submit("logSignature", b"s" * 3309, b"m")
+        receipts = submitter.collect()
+    finally:
+        submitter.close()
+
+    assert [tx['nonce'] for _, tx in eth.sent] == list(range(6))
+    assert [fn for fn, _ in eth.sent] == ["registerPQCKey"] + ["logSignature"] * 5
+    assert eth.estimates == 2
+    assert eth.nonce_lookups == 1
+    assert [r.tx_hash for r in receipts] == [f"0x{n:064x}" for n in range(6)]
+    assert submitter.stats()['submitted'] == 6
+
+
+def test_failed_submission_resynchronizes_nonce():
+    eth = FakeEth(fail_nonces={1})
+    submitter = make_submitter(eth)
+    try:
+        submitter.submit("logSignature", b"s", b"m")
+        with pytest.raises(ValueError):
+            submitter.submit("logSignature", b"s", b"m")
+        submitter.submit("logSignature", b"s", b"m")
+        submitter.collect()
+    finally:
+        submitter.close()
+
+    assert [tx['nonce'] for _, tx in eth.sent] == [0, 1]
+
+
+def test_array_arguments_estimated_per_element_size_and_gas_override():
+    eth = FakeEth()
+    submitter = make_submitter(eth)
+    try:
+        assert submitter.estimate_gas("logSignatures", [b"s" * 10, b"s"], [b"m", b"m"]) == 100_040
+        submitter.submit("logSignatures", [b"t" * 10, b"t"], [b"n", b"n"])
+        submitter.submit("logSignatures", [b"s", b"s" * 10], [b"m", b"m"])
+        submitter.submit("registerPQCKey", b"k", gas=500_000)
+        submitter.collect()
+    finally:
+        submitter.close()
+
+    assert eth.estimates == 2  # same shape reused, swapped lengths estimated again
+    assert [tx['gas'] for _, tx in eth.sent] == [int(100_040 * 1.2), int(100_040 * 1.2), 500_000]
@@ -0,0 +1,124 @@
+"""Tests for the test-vector corpus container (stubbed batch engine, corpus under tmp_path)"""
+import hashlib
+
+import pytest
+
+import vector_corpus
+from vector_corpus import CORPUS_MAGIC, INVALID_KINDS, VectorCorpus, build_corpus
+
+ALGORITHMS = ["dilithium2", "falcon512"]
+MESSAGE_SIZES = [16, 64]
+VECTORS = 3
+
+
+def stub_sign(private_key, message):
+    return hashlib.sha256(private_key + message).digest() * 2
+
+
+class StubEngine:
+    """BatchEngine stand-in: fresh keys on every keygen call, like real PQC key generation"""
+
+    generated = 0
+
+    def __init__(self, algorithm, executor=None, workers=None):
+        self.algorithm = algorithm
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def keygen(self, count):
+        first = StubEngine.generated
+        StubEngine.generated += count
+        private_keys = [f"{self.algorithm}-sk-{i}".encode() for i in range(first, first + count)]
+        public_keys = [hashlib.sha256(sk).digest() for sk in private_keys]
+        return public_keys, private_keys, [0.0] * count
+
+    def sign(self, private_keys, messages):
+        return [stub_sign(sk, m) for sk, m in zip(private_keys, messages)], [0.0] * len(messages)
+
+
+@pytest.fixture(autouse=True)
+def stub_engine(monkeypatch):
+    monkeypatch.setattr(vector_corpus, "BatchEngine", StubEngine)
+
+
+def build(tmp_path, name="corpus.pqcv", seed=7):
+    return build_corpus(str(tmp_path / name), ALGORITHMS, MESSAGE_SIZES, vectors=VECTORS, keypairs=2, seed=seed)
+
+
+def test_build_read_round_trip(tmp_path):
+    path = build(tmp_path)
+    with open(path, "rb") as f:
+        assert f.read(len(CORPUS_MAGIC)) == CORPUS_MAGIC
+
+    corpus = VectorCorpus(path, verify=True)
+    assert corpus.algorithms == ALGORITHMS
+    assert corpus.header['seed'] == 7 and corpus.header['invalid_kinds'] == INVALID_KINDS
+    assert len(corpus) == len(ALGORITHMS) * len(MESSAGE_SIZES) * VECTORS * (1 + len(INVALID_KINDS))
+
+    for vector in corpus.iter_vectors(kind='valid'):
+        assert len(vector['message']) in MESSAGE_SIZES
+        assert vector['signature'] == stub_sign(vector['private_key'], vector['message'])
+        assert vector['public_key'] == hashlib.sha256(vector['private_key']).digest()
+        assert vector['valid']
+
+    valid = corpus.vector(corpus.select(kind='valid')[0])
+    truncated, wrong_key = (corpus.vector(corpus.select(kind=kind)[0]) for kind in ('truncated', 'wrong_key'))
+    assert not truncated['valid'] and valid['signature'].startswith(truncated['signature'])
+    assert truncated['signature'] != valid['signature']
+    assert wrong_key['signature'] == valid['signature'] and wrong_key['public_key'] != valid['public_key']
+
+
+def test_select_batches_and_inputs_filter(tmp_path):
+    corpus = VectorCorpus(build(tmp_path))
+    per_algorithm = len(MESSAGE_SIZES) * VECTORS
+
+    positions = corpus.select(algorithm="falcon_512", kind='tampered')
+    assert len(positions) == per_algorithm
+    assert {(corpus.vector(p)['algorithm'], corpus.vector(p)['kind']) for p in positions} == \
+        {("falcon512", 'tampered')}
+    assert len(corpus.select(algorithm="dilithium2", message_size=64)) == VECTORS * (1 + len(INVALID_KINDS))
+    assert len(corpus.select(algorithm="dilithium5")) == 0
+
+    batches = list(corpus.batches(4, algorithm="dilithium2", kind='valid'))
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert all(v['algorithm'] == "dilithium2" and v['kind'] == 'valid' for batch in batches for v in batch)
+
+    public_keys, private_keys, messages, signatures = corpus.inputs("dilithium2", count=4)
+    assert len(public_keys) == 4
+    assert signatures == [stub_sign(sk, m) for sk, m in zip(private_keys, messages)]
+
+
+def test_edited_blob_fails_checksum(tmp_path):
+    path = build(tmp_path)
+    with open(path, "r+b") as f:
+        f.seek(-1, 2)
+        last = f.read(1)
+        f.seek(-1, 2)
+        f.write(bytes([last[0] ^ 0xFF]))
+
+    VectorCorpus(path)  # only checked on request
+    with pytest.raises(ValueError, match="checksum"):
+        VectorCorpus(path, verify=True)
+
+
+def test_not_a_corpus_is_rejected(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"NOTACORP" + bytes(16))
+    with pytest.raises(ValueError, match="not a test-vector corpus"):
+        VectorCorpus(str(path))
+
+
+def test_same_seed_gives_identical_messages(tmp_path):
+    first = VectorCorpus(build(tmp_path, "a.pqcv"))
+    second = VectorCorpus(build(tmp_path, "b.pqcv"))
+    other_seed = VectorCorpus(build(tmp_path, "c.pqcv", seed=8))
+
+    messages = lambda corpus: [v['message'] for v in corpus.iter_vectors(kind='valid')]
+    assert messages(first) == messages(second)
+    assert messages(first) != messages(other_seed)
+    # Keys are not seeded, so the containers themselves still differ
+    assert first.digest != second.digest
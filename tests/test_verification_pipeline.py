@@ -0,0 +1,145 @@
+"""Tests for page completion tracking and failure handling in the verification pipeline"""
+from types import SimpleNamespace
+
+import pytest
+
+import event_indexer
+import key_cache
+import verification_pipeline
+from event_indexer import load_checkpoint, load_pending, resolve_start_block, save_checkpoint
+from key_cache import PublicKeyCache
+from test_key_cache import FakeRegistry
+from verification_pipeline import (
+    _PageTracker, collect_retry_events, record_skipped, run_verification_pipeline
+)
+
+
+def test_page_tracker_completes_pages_in_order():
+    completed = []
+    tracker = _PageTracker(completed.append)
+
+    tracker.item_done(1)
+    tracker.page_closed(1, 199, 1)
+    assert completed == []  # page 0 still open
+
+    tracker.page_closed(0, 99, 2)
+    tracker.item_done(0)
+    assert completed == []
+    tracker.item_done(0)
+    assert completed == [99, 199]
+
+
+def test_page_tracker_empty_page_completes_immediately():
+    completed = []
+    tracker = _PageTracker(completed.append)
+    tracker.page_closed(0, 9, 0)
+    assert completed == [9]
+
+
+class FakeKeyCache:
+    def prefetch(self, addresses):
+        list(addresses)
+
+    def get(self, address):
+        return None if address == "0xNoKey" else b"k" * 32
+
+
+def make_event(block, sender="0xA", signature=b"s"):
+    return {'args': {'from': sender, 'signature': signature, 'message': b"m"}, 'blockNumber': block}
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    pages = [
+        (0, 9, [make_event(1), make_event(2, sender="0xNoKey")]),
+        (10, 19, [make_event(12, signature=b"bad")]),
+        (20, 29, [make_event(25)]),
+    ]
+    monkeypatch.setattr(verification_pipeline, "iter_event_pages", lambda *args, **kwargs: iter(pages))
+    return pages
+
+
+def run(write_rows, completed):
+    return run_verification_pipeline(
+        w3=None, contract=None, start_block=0, head_block=29, key_cache=FakeKeyCache(),
+        detect_algorithm=lambda pk, sig: ["fake"], write_rows=write_rows, workers=2,
+        executor="thread", on_page_complete=completed.append,
+    )
+
+
+def test_pipeline_counts_rows_and_checkpoints(monkeypatch, pages):
+    monkeypatch.setattr(verification_pipeline, "verify_chunk",
+                        lambda tasks: [("fake", task[3] != b"bad", 0.001) for task in tasks])
+    rows, completed = [], []
+    counts = run(rows.extend, completed)
+
+    assert completed == [9, 19, 29]
+    assert {k: counts[k] for k in ('total', 'valid', 'invalid', 'skipped')} == \
+        {'total': 4, 'valid': 2, 'invalid': 1, 'skipped': 1}
+    assert sorted((r['block_number'], r['valid']) for r in rows) == [(1, True), (12, False), (25, True)]
+
+
+def test_failed_chunk_writes_nothing_and_never_checkpoints_its_page(monkeypatch, pages):
+    def verify_chunk(tasks):
+        if any(task[3] == b"bad" for task in tasks):
+            raise RuntimeError("worker died")
+        return [("fake", True, 0.001) for _ in tasks]
+
+    monkeypatch.setattr(verification_pipeline, "verify_chunk", verify_chunk)
+    rows, completed = [], []
+    with pytest.raises(RuntimeError, match="worker died"):
+        run(rows.extend, completed)
+
+    assert 19 not in completed and 29 not in completed
+    assert all(row['block_number'] != 12 for row in rows)
+
+
+def verify_run(w3, registry, rows):
+    """One verify_signatures run: resume, retry pending events, scan new blocks, checkpoint"""
+    start_block = resolve_start_block(w3, registry.address)
+    head_block = w3.eth.block_number
+    cache = PublicKeyCache(registry)
+    cache.sync(w3, head_block)
+    retry_events, pending = collect_retry_events(registry, load_pending(registry.address), start_block, cache)
+    counts = run_verification_pipeline(
+        w3, registry, start_block, head_block, cache, lambda pk, sig: ["fake"], rows.extend,
+        workers=1, executor="thread", page_size=5,
+        on_page_complete=lambda page_end: save_checkpoint(registry.address, page_end, pending=pending),
+        retry_events=retry_events, on_skip=lambda event: record_skipped(pending, event),
+    )
+    return counts
+
+
+def test_skipped_event_is_verified_once_its_key_is_registered(tmp_path, monkeypatch):
+    monkeypatch.setattr(event_indexer, "CHECKPOINT_FILE", str(tmp_path / "indexer_checkpoint.json"))
+    monkeypatch.setattr(verification_pipeline, "verify_chunk",
+                        lambda tasks: [("fake", True, 0.001) for _ in tasks])
+    monkeypatch.setattr(key_cache, "call_many", lambda contract, fn_name, args_list, **kwargs: [
+        getattr(contract.functions, fn_name)(*args).call() for args in args_list])
+    logs = {2: [make_event(2, sender="0xLate")], 3: [make_event(3)]}
+
+    def get_logs(from_block, to_block):
+        return [e for b in range(from_block, to_block + 1) for e in logs.get(b, [])]
+
+    registry = FakeRegistry({"0xA": b"key-a"})
+    registry.events = SimpleNamespace(PQCSignature=SimpleNamespace(get_logs=get_logs))
+    w3 = SimpleNamespace(eth=SimpleNamespace(block_number=9))
+
+    rows = []
+    counts = verify_run(w3, registry, rows)
+    assert (counts['valid'], counts['skipped']) == (1, 1)
+    assert [row['block_number'] for row in rows] == [3]
+    assert load_checkpoint(registry.address) == 9
+    assert load_pending(registry.address) == {"0xLate": [2]}
+
+    # No key yet: the event stays pending and nothing is re-verified
+    rows.clear()
+    assert verify_run(w3, registry, rows)['total'] == 0
+    assert load_pending(registry.address) == {"0xLate": [2]}
+
+    registry.keys["0xLate"] = b"key-late"
+    counts = verify_run(w3, registry, rows)
+    assert (counts['total'], counts['valid'], counts['skipped']) == (1, 1, 0)
+    assert [row['block_number'] for row in rows] == [2]
+    assert load_checkpoint(registry.address) == 9
+    assert load_pending(registry.address) == {}
@@ -0,0 +1,74 @@
+"""Tests for shared client helpers (no node: a fake eth.contract factory is used)"""
+import gc
+import weakref
+from types import SimpleNamespace
+
+import pytest
+
+import web3_client
+from web3_client import get_contract, run_concurrently
+
+ABI_V1 = [{'type': 'function', 'name': 'logSignature'}]
+ABI_V2 = ABI_V1 + [{'type': 'function', 'name': 'logSignatures'}]
+
+
+@pytest.fixture(autouse=True)
+def empty_contract_cache(monkeypatch):
+    monkeypatch.setattr(web3_client, "_CONTRACTS", {})
+
+
+class FakeWeb3:
+    def __init__(self, built):
+        self.eth = SimpleNamespace(contract=self.contract)
+        self.built = built
+
+    def contract(self, address, abi):
+        # Weak back-reference, so the client can be collected while its contract is cached
+        self.built.append(abi)
+        return SimpleNamespace(address=address, abi=abi, client=weakref.ref(self))
+
+
+def fake_w3():
+    built = []
+    return FakeWeb3(built), built
+
+
+def test_contract_cached_per_address_and_abi():
+    w3, built = fake_w3()
+    first = get_contract(w3, "0xA", ABI_V1)
+    assert get_contract(w3, "0xA", list(ABI_V1)) is first
+    assert get_contract(w3, "0xB", ABI_V1) is not first
+    assert len(built) == 2
+
+
+def test_new_abi_for_same_address_is_not_served_stale():
+    w3, _ = fake_w3()
+    get_contract(w3, "0xA", ABI_V1)
+    upgraded = get_contract(w3, "0xA", ABI_V2)
+    assert upgraded.abi == ABI_V2
+    assert get_contract(w3, "0xA", ABI_V2) is upgraded
+
+
+def test_contract_of_a_collected_client_is_not_reused(monkeypatch):
+    w3, built = fake_w3()
+    get_contract(w3, "0xA", ABI_V1)
+    old_id = id(w3)
+    del w3
+    gc.collect()
+
+    # A new client that happens to get the same id must not receive the old contract
+    new_w3, _ = fake_w3()
+    monkeypatch.setattr(web3_client, "id", lambda obj: old_id if obj is new_w3 else id(obj), raising=False)
+    contract = get_contract(new_w3, "0xA", ABI_V1)
+    assert contract.client() is new_w3
+    assert get_contract(new_w3, "0xA", ABI_V1) is contract
+
+
+def test_run_concurrently_keeps_order_and_raises():
+    assert run_concurrently([lambda i=i: i * i for i in range(20)], workers=4) == [i * i for i in range(20)]
+
+    def boom():
+        raise RuntimeError("rpc failed")
+
+    with pytest.raises(RuntimeError):
+        run_concurrently([lambda: 1, boom])
@@ -0,0 +1,33 @@
+"""Tests for the worker-count sweep helpers (knee detection, sweep points)"""
+import pytest
+
+from batch_operations import find_knee, scaling_worker_counts
+
+
+def test_knee_of_saturating_curve():
+    workers = [1, 2, 4, 8, 16]
+    throughput = [100, 195, 380, 400, 405]
+    assert find_knee(workers, throughput) == 4
+
+
+def test_linear_curve_knee_is_an_endpoint():
+    workers = [1, 2, 3, 4]
+    assert find_knee(workers, [10, 20, 30, 40]) in (1, 4)
+
+
+def test_flat_curve_knee_is_first_point():
+    assert find_knee([1, 2, 4, 8], [50, 50, 50, 50]) == 1
+
+
+def test_too_few_points_returns_last():
+    assert find_knee([1, 2], [10, 19]) == 2
+
+
+@pytest.mark.parametrize("max_workers,expected", [
+    (1, [1]),
+    (4, [1, 2, 4]),
+    (6, [1, 2, 4, 6]),
+    (16, [1, 2, 4, 8, 16]),
+])
+def test_scaling_worker_counts(max_workers, expected):
+    assert scaling_worker_counts(max_workers) == expected